@@ -0,0 +1,25 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Paginación por cursor (keyset): cada página filtra desde la última
+    posición vista en lugar de usar OFFSET, así que cuesta lo mismo en la
+    primera página que en la página diez mil. El cliente elige page_size
+    hasta max_page_size
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+class VueloPagination(KeysetPagination):
+    # Usa el índice flight_departure_keyset_idx
+    ordering = ('departure_time', 'id')
+
+
+class ReservaPagination(KeysetPagination):
+    # Las reservas se filtran por passenger__email: el índice de Passenger.email encuentra
+    # los pasajeros del usuario y reservation_keyset_idx sus reservas desde el cursor.
+    # Como puede haber varios pasajeros por email, el orden se arma sobre esas filas
+    ordering = ('reservation_date', 'id')
@@ -0,0 +1,11 @@
+from rest_framework.renderers import JSONRenderer
+
+
+class SeatLayoutRenderer(JSONRenderer):
+    """
+    Formato compacto de layouts de asientos, elegido por negociación de
+    contenido: Accept: application/vnd.volando.seat-layout+json o
+    ?format=layout. Sin pedirlo, la respuesta sigue siendo la detallada
+    """
+    media_type = 'application/vnd.volando.seat-layout+json'
+    format = 'layout'
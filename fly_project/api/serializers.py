@@ -1,6 +1,117 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.core.exceptions import ObjectDoesNotExist
 from app.models import Airplane, Seat, Flight, Reservation, Ticket, Passenger
+from app.services import FlightSearchService, ReservaService, SeatInventoryService
+
+def split_param(value):
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+def expand_paths(expand):
+    """Cada ruta con sus prefijos: 'airplane.seats' también expande 'airplane'"""
+    paths = set()
+    for path in expand:
+        names = path.split('.')
+        paths.update('.'.join(names[:position]) for position in range(1, len(names) + 1))
+    return paths
+
+class ExpandableFieldsMixin:
+    """
+    Campos a pedido y relaciones expandibles:
+    ?fields=id,origin devuelve sólo esos campos y
+    ?expand=airplane,airplane.seats anida esas relaciones en lugar de su id.
+    expandable_fields mapea cada relación a (serializer, many). Sólo el
+    serializer raíz lee los parámetros del request; los anidados reciben
+    la parte de expand que les corresponde
+    """
+    expandable_fields = {}
+    # Expansiones por defecto cuando el request no trae ?expand=
+    default_expand = ()
+    # Relaciones que la representación compacta lee en cada fila (ids de un M2M, reversas)
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if expand is None:
+            request = self.context.get('request')
+            query_params = getattr(request, 'query_params', {})
+            fields = split_param(query_params.get('fields'))
+            expand = split_param(query_params['expand']) if 'expand' in query_params else self.default_expand
+        self.expand = expand_paths(expand)
+        # Las relaciones many (todos los asientos de un avión) sólo aparecen expandidas
+        hidden = {name for name, (_, many) in self.expandable_fields.items() if many and name not in self.expand}
+        # Sólo al leer: al escribir hacen falta todos los campos para validar
+        if fields and 'data' not in kwargs:
+            hidden |= set(self.fields) - set(fields)
+        for name in hidden & set(self.fields):
+            self.fields.pop(name)
+
+    def nested_expand(self, name):
+        prefix = f"{name}."
+        return [path[len(prefix):] for path in self.expand if path.startswith(prefix)]
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        for name, (serializer_class, many) in self.expandable_fields.items():
+            if name not in self.expand or name not in representation:
+                continue
+            try:
+                value = getattr(instance, name)
+            except ObjectDoesNotExist:
+                value = None
+            if value is None:
+                representation[name] = None
+                continue
+            if many:
+                value = value.all()
+            kwargs = {'context': self.context}
+            if issubclass(serializer_class, ExpandableFieldsMixin):
+                kwargs['expand'] = self.nested_expand(name)
+            representation[name] = serializer_class(value, many=many, **kwargs).data
+        return representation
+
+    @classmethod
+    def related_lookups(cls, expand):
+        """
+        select_related y prefetch_related que necesita expand:
+        ['flight.airplane.seats'] -> (['flight', 'flight__airplane', 'ticket'],
+                                      ['flight__airplane__seats', 'flight__users'])
+        """
+        select, prefetch = set(), set()
+
+        def add_base(serializer_class, lookup, prefetching):
+            for name in getattr(serializer_class, 'select_related_fields', ()):
+                (prefetch if prefetching else select).add('__'.join([*lookup, name]))
+            for name in getattr(serializer_class, 'prefetch_related_fields', ()):
+                prefetch.add('__'.join([*lookup, name]))
+
+        add_base(cls, [], False)
+        for path in expand_paths(expand):
+            serializer_class, lookup, prefetching = cls, [], False
+            for name in path.split('.'):
+                spec = getattr(serializer_class, 'expandable_fields', {}).get(name)
+                if spec is None:
+                    break
+                serializer_class, many = spec
+                lookup.append(name)
+                prefetching = prefetching or many
+                (prefetch if prefetching else select).add('__'.join(lookup))
+            else:
+                add_base(serializer_class, lookup, prefetching)
+        return sorted(select), sorted(prefetch)
+
+    @classmethod
+    def optimize_queryset(cls, queryset, request):
+        """Trae de una vez sólo las relaciones que el request pide expandir"""
+        query_params = getattr(request, 'query_params', {})
+        expand = split_param(query_params['expand']) if 'expand' in query_params else cls.default_expand
+        select, prefetch = cls.related_lookups(expand)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
 
 class PassengerSerializer(serializers.ModelSerializer):
     class Meta:
@@ -25,57 +136,75 @@ class UserSerializer(serializers.ModelSerializer):
 class SeatSerializer(serializers.ModelSerializer):
     class Meta:
         model = Seat
-        fields = ('id', 'airplane', 'number', 'row', 'column', 'type', 'status')
+        fields = ('id', 'airplane', 'number', 'row', 'column', 'type')
 
-class AirplaneSerializer(serializers.ModelSerializer):
-    seats = SeatSerializer(many=True, read_only=True)
+class AirplaneSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
+    seats = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    expandable_fields = {'seats': (SeatSerializer, True)}
+    # /api/aviones/ sigue mostrando los asientos; anidado en un vuelo, sólo con airplane.seats
+    default_expand = ('seats',)
 
     class Meta:
         model = Airplane
         fields = ('id', 'model', 'capacity', 'rows', 'columns', 'seats')
 
-class VueloSerializer(serializers.ModelSerializer):
-    airplane_detail = AirplaneSerializer(source='airplane', read_only=True)
+class VueloSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     airplane = serializers.PrimaryKeyRelatedField(queryset=Airplane.objects.all())
     users = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    expandable_fields = {'airplane': (AirplaneSerializer, False)}
+    prefetch_related_fields = ('users',)
 
     class Meta:
         model = Flight
-        fields = ('id', 'airplane', 'airplane_detail', 'origin', 'destination', 'departure_time',
+        fields = ('id', 'airplane', 'origin', 'destination', 'departure_time',
                  'arrival_time', 'duration', 'status', 'base_price', 'users')
 
-    def to_representation(self, instance):
-        # Obtener la representación por defecto
-        representation = super().to_representation(instance)
-        # Mover los detalles del avión al campo principal
-        representation['airplane'] = representation.pop('airplane_detail')
-        return representation
-
     def validate(self, data):
         if 'departure_time' in data and 'arrival_time' in data:
             if data['departure_time'] >= data['arrival_time']:
                 raise serializers.ValidationError("El tiempo de salida debe ser anterior al tiempo de llegada")
         return data
 
+class AvionCargadoField(serializers.PrimaryKeyRelatedField):
+    """Resuelve el avión contra los ya leídos en context['airplanes'], sin una consulta por vuelo"""
+    def to_internal_value(self, data):
+        try:
+            return self.context['airplanes'][int(data)]
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+
+class VueloLoteSerializer(VueloSerializer):
+    """Un vuelo de una carga por lote"""
+    airplane = AvionCargadoField(queryset=Airplane.objects.all())
+
 class BoletoSerializer(serializers.ModelSerializer):
     class Meta:
         model = Ticket
         fields = ('id', 'reservation', 'barcode', 'issue_date', 'status')
         read_only_fields = ('barcode', 'issue_date')
 
-class ReservaSerializer(serializers.ModelSerializer):
+class ReservaSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     passenger = serializers.PrimaryKeyRelatedField(read_only=True)
-    ticket = BoletoSerializer(read_only=True)
-    flight_detail = VueloSerializer(source='flight', read_only=True)
-    seat_detail = SeatSerializer(source='seat', read_only=True)
+    ticket = serializers.PrimaryKeyRelatedField(read_only=True)
     flight = serializers.PrimaryKeyRelatedField(queryset=Flight.objects.all())
     seat = serializers.PrimaryKeyRelatedField(queryset=Seat.objects.all())
+    expandable_fields = {
+        'flight': (VueloSerializer, False),
+        'seat': (SeatSerializer, False),
+        'passenger': (PassengerSerializer, False),
+        'ticket': (BoletoSerializer, False),
+    }
+    select_related_fields = ('ticket',)
 
     class Meta:
         model = Reservation
-        fields = ('id', 'flight', 'flight_detail', 'passenger', 'seat', 'seat_detail', 
+        fields = ('id', 'flight', 'passenger', 'seat',
                  'status', 'reservation_date', 'price', 'reservation_code', 'ticket')
         read_only_fields = ('reservation_date', 'reservation_code', 'status')
+        # La disponibilidad del asiento en el vuelo se valida contra el inventario en validate()
+        validators = []
 
     def validate(self, data):
         if 'flight' in data and 'seat' in data:
@@ -84,9 +213,59 @@ class ReservaSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError(
                     "El asiento seleccionado no pertenece al avión de este vuelo"
                 )
-            # Validar que el asiento está disponible
-            if data['seat'].status != 'available':
+            # Validar que el asiento está disponible en este vuelo; al actualizar lo hace
+            # ReservaService.actualizar_reserva al tomar el asiento en el inventario
+            if self.instance is None and SeatInventoryService().status_of(data['flight'], data['seat']) != 'available':
                 raise serializers.ValidationError(
                     "El asiento seleccionado no está disponible"
                 )
-        return data
\ No newline at end of file
+        return data
+class PasajeroGrupoSerializer(serializers.Serializer):
+    seat = serializers.PrimaryKeyRelatedField(queryset=Seat.objects.all())
+    name = serializers.CharField(max_length=100)
+    document = serializers.CharField(max_length=30)
+    document_type = serializers.ChoiceField(choices=Passenger.DOCUMENT_TYPES)
+    email = serializers.EmailField(required=False)
+    phone = serializers.CharField(max_length=30, required=False, allow_blank=True)
+    birth_date = serializers.DateField()
+
+class ReservaGrupoSerializer(serializers.Serializer):
+    flight = serializers.PrimaryKeyRelatedField(queryset=Flight.objects.all())
+    pasajeros = PasajeroGrupoSerializer(many=True, min_length=1, max_length=ReservaService.MAX_PASAJEROS_GRUPO)
+
+class TramoSerializer(serializers.Serializer):
+    flight = serializers.PrimaryKeyRelatedField(queryset=Flight.objects.all())
+    seat = serializers.PrimaryKeyRelatedField(queryset=Seat.objects.all())
+
+class ReservaIdaVueltaSerializer(serializers.Serializer):
+    ida = TramoSerializer()
+    vuelta = TramoSerializer()
+
+class CambioEstadoLoteSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), min_length=1, max_length=ReservaService.MAX_RESERVAS_LOTE)
+    status = serializers.ChoiceField(choices=Reservation.STATUS_OPTIONS)
+
+class CalendarioTarifasSerializer(serializers.Serializer):
+    origin = serializers.CharField(max_length=100)
+    destination = serializers.CharField(max_length=100)
+    fecha = serializers.DateField()
+    dias = serializers.IntegerField(min_value=0, max_value=FlightSearchService.CALENDAR_MAX_DAYS, default=FlightSearchService.CALENDAR_DAYS)
+    clase = serializers.ChoiceField(choices=Seat.SEAT_TYPES, default='economy')
+
+class TarifaDiaSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    lowest_fare = serializers.DecimalField(max_digits=12, decimal_places=2, allow_null=True)
+    flights = serializers.IntegerField()
+
+class ConexionesSerializer(serializers.Serializer):
+    origin = serializers.CharField(max_length=100)
+    destination = serializers.CharField(max_length=100)
+    fecha = serializers.DateField()
+    escalas = serializers.IntegerField(min_value=1, max_value=FlightSearchService.MAX_STOPS, default=FlightSearchService.MAX_STOPS)
+    clase = serializers.ChoiceField(choices=Seat.SEAT_TYPES, required=False)
+
+class ConexionSerializer(serializers.Serializer):
+    flights = VueloSerializer(many=True)
+    stops = serializers.IntegerField()
+    total_price = serializers.DecimalField(max_digits=12, decimal_places=2)
+    duration = serializers.DurationField()
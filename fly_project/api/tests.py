@@ -1,6 +1,7 @@
 from rest_framework.test import APITestCase
 from django.urls import reverse
-from app.models import Airplane, Seat, Flight, Passenger
+from app.models import Airplane, Seat, Flight, Passenger, Reservation, Ticket
+from app.services import FlightSearchService, SeatInventoryService
 from django.utils import timezone
 from django.contrib.auth.models import User
 import datetime
@@ -15,7 +16,7 @@ class ReservaVueloIntegrationTest(APITestCase):
 		self.airplane = Airplane.objects.create(model="Boeing 737", capacity=180, rows=30, columns=6)
 		print("Avión:", self.airplane)
 		print("Creando asiento")
-		self.seat = Seat.objects.create(airplane=self.airplane, number="1A", row=1, column=1, type="economy", status="available")
+		self.seat = Seat.objects.create(airplane=self.airplane, number="1A", row=1, column=1, type="economy")
 		print("Asiento:", self.seat)
 		print("Creando vuelo")
 		self.flight = Flight.objects.create(
@@ -113,7 +114,7 @@ class ReservaVueloIntegrationTest(APITestCase):
 		print("\n-------------------------------------------------")
 		print("\nTest: Un pasajero no puede tener más de una reserva por vuelo")
 		# Crear primer asiento y reserva
-		seat2 = Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="economy", status="available")
+		seat2 = Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="economy")
 		url = reverse('reserva-list')
 		data1 = {
 			"flight": self.flight.id,
@@ -152,9 +153,9 @@ class ReservaVueloIntegrationTest(APITestCase):
 		print(f"Reserva creada: {response.status_code} - {response.data}")
 		self.assertEqual(response.status_code, 201)
 
-		self.seat.refresh_from_db()
-		print(f"Estado del asiento tras reservar: {self.seat.status}")
-		self.assertIn(self.seat.status, ['reserved', 'occupied'])
+		estado = SeatInventoryService().status_of(self.flight, self.seat)
+		print(f"Estado del asiento tras reservar: {estado}")
+		self.assertIn(estado, ['reserved', 'occupied'])
 
 		reserva_id = response.data.get('id')
 		if reserva_id:
@@ -163,9 +164,9 @@ class ReservaVueloIntegrationTest(APITestCase):
 			cancel_response = self.client.patch(cancel_url, {"status": "canceled"}, format='json')
 			print(f"Respuesta cancelación: {cancel_response.status_code} - {cancel_response.data}")
 			self.assertIn(cancel_response.status_code, [200, 202])
-			self.seat.refresh_from_db()
-			print(f"Estado del asiento tras cancelar: {self.seat.status}")
-			self.assertEqual(self.seat.status, 'available')
+			estado = SeatInventoryService().status_of(self.flight, self.seat)
+			print(f"Estado del asiento tras cancelar: {estado}")
+			self.assertEqual(estado, 'available')
 		else:
 			print("No se pudo obtener el id de la reserva para cancelar.")
 
@@ -185,4 +186,311 @@ class ReservaVueloIntegrationTest(APITestCase):
 			self.fail("Se permitió crear un pasajero con documento duplicado")
 		except Exception as e:
 			print(f"Error esperado: {e}")
-			self.assertIn('unique', str(e).lower())
\ No newline at end of file
+			self.assertIn('unique', str(e).lower())
+	def test_reserva_de_grupo_atomica(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: Reserva de grupo en una sola transacción")
+		seat2 = Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="premium")
+		seat3 = Seat.objects.create(airplane=self.airplane, number="1C", row=1, column=3, type="economy")
+		url = reverse('reserva-grupo')
+		data = {
+			"flight": self.flight.id,
+			"pasajeros": [
+				{"seat": self.seat.id, "name": "Pela Perez", "document": "12345678", "document_type": "DNI", "birth_date": "1990-01-01"},
+				{"seat": seat2.id, "name": "Nico Perez", "document": "23456789", "document_type": "DNI", "birth_date": "2015-03-02"},
+			]
+		}
+		response = self.client.post(url, data, format='json')
+		print(f"Respuesta grupo: {response.status_code} - {len(response.data)} reservas")
+		self.assertEqual(response.status_code, 201)
+		self.assertEqual([reserva['price'] for reserva in response.data], ['1000.00', '1500.00'])
+		self.assertTrue(all(reserva['ticket'] for reserva in response.data))
+		self.assertEqual(SeatInventoryService().status_of(self.flight, seat2), 'occupied')
+
+		# Un asiento del grupo ya está tomado: no se crea ninguna reserva
+		data = {
+			"flight": self.flight.id,
+			"pasajeros": [
+				{"seat": seat3.id, "name": "Ana Gomez", "document": "34567890", "document_type": "DNI", "birth_date": "1985-07-07"},
+				{"seat": seat2.id, "name": "Luz Gomez", "document": "45678901", "document_type": "DNI", "birth_date": "2012-09-09"},
+			]
+		}
+		response = self.client.post(url, data, format='json')
+		print(f"Respuesta grupo con asiento tomado: {response.status_code} - {response.data}")
+		self.assertEqual(response.status_code, 400)
+		self.assertIn('1B', response.data['error'])
+		self.assertEqual(SeatInventoryService().status_of(self.flight, seat3), 'available')
+		self.assertFalse(Passenger.objects.filter(document="34567890").exists())
+
+	def test_paginacion_por_cursor_de_vuelos(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: Paginación por cursor de vuelos con page_size elegido por el cliente")
+		salida = self.flight.departure_time
+		for horas in [3, 1, 2, 1]:
+			Flight.objects.create(
+				airplane=self.airplane,
+				origin="Buenos Aires",
+				destination="Mendoza",
+				departure_time=salida + datetime.timedelta(hours=horas),
+				arrival_time=salida + datetime.timedelta(hours=horas + 2),
+				duration=datetime.timedelta(hours=2),
+				base_price=2000
+			)
+		esperados = list(Flight.objects.order_by('departure_time', 'id').values_list('id', flat=True))
+
+		url = reverse('vuelo-list') + '?page_size=2'
+		vistos = []
+		while url:
+			response = self.client.get(url)
+			print(f"Página: {response.status_code} - {[vuelo['id'] for vuelo in response.data['results']]}")
+			self.assertEqual(response.status_code, 200)
+			self.assertLessEqual(len(response.data['results']), 2)
+			vistos += [vuelo['id'] for vuelo in response.data['results']]
+			url = response.data['next']
+		self.assertEqual(vistos, esperados)
+
+		# El servidor limita el tamaño de página
+		response = self.client.get(reverse('vuelo-list') + '?page_size=100000')
+		self.assertEqual(len(response.data['results']), len(esperados))
+		self.assertNotIn('count', response.data)
+
+	def test_campos_a_pedido_y_expansion(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: ?fields= y ?expand= en vuelos y reservas")
+		Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="economy")
+		response = self.client.get(reverse('vuelo-detail', args=[self.flight.id]))
+		print(f"Vuelo compacto: {response.status_code} - {response.data}")
+		self.assertEqual(response.data['airplane'], self.airplane.id)
+
+		response = self.client.get(reverse('vuelo-detail', args=[self.flight.id]) + '?fields=id,origin')
+		self.assertEqual(set(response.data), {'id', 'origin'})
+
+		response = self.client.get(reverse('vuelo-detail', args=[self.flight.id]) + '?expand=airplane')
+		self.assertEqual(response.data['airplane']['model'], "Boeing 737")
+		self.assertNotIn('seats', response.data['airplane'])
+
+		response = self.client.get(reverse('vuelo-list') + '?expand=airplane.seats')
+		print(f"Vuelos con asientos: {response.status_code} - {response.data['results'][0]['airplane']['seats']}")
+		self.assertEqual([asiento['number'] for asiento in response.data['results'][0]['airplane']['seats']], ["1A", "1B"])
+
+		data = {"flight": self.flight.id, "seat": self.seat.id, "price": 1000}
+		response = self.client.post(reverse('reserva-list') + '?expand=flight,seat', data, format='json')
+		print(f"Reserva expandida: {response.status_code} - {response.data}")
+		self.assertEqual(response.status_code, 201)
+		self.assertEqual(response.data['flight']['destination'], "Córdoba")
+		self.assertEqual(response.data['flight']['airplane'], self.airplane.id)
+		self.assertEqual(response.data['seat']['number'], "1A")
+
+		response = self.client.get(reverse('reserva-list') + '?fields=id,flight')
+		self.assertEqual(response.data['results'], [{'id': response.data['results'][0]['id'], 'flight': self.flight.id}])
+
+	def test_consultas_de_listados_no_crecen_con_las_filas(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: Los listados de la API hacen las mismas consultas con 2 o con 10 filas")
+		self.user.email = self.passenger.email
+		self.user.save()
+		admin = User.objects.create_user(username="admin", password="adminpass", is_staff=True)
+		listados = [
+			(reverse('vuelo-list'), 2),
+			(reverse('vuelo-list') + '?expand=airplane.seats', 3),
+			(reverse('reserva-list'), 1),
+			(reverse('reserva-list') + '?expand=flight.airplane.seats,seat,passenger,ticket', 3),
+		]
+
+		for cantidad in (2, 10):
+			while Flight.objects.count() <= cantidad:
+				numero = Flight.objects.count()
+				vuelo = Flight.objects.create(
+					airplane=self.airplane,
+					origin="Buenos Aires",
+					destination="Salta",
+					departure_time=self.flight.departure_time + datetime.timedelta(hours=numero),
+					arrival_time=self.flight.arrival_time + datetime.timedelta(hours=numero),
+					duration=datetime.timedelta(hours=1),
+					base_price=1000
+				)
+				vuelo.users.add(self.user, admin)
+				asiento = Seat.objects.create(airplane=self.airplane, number=f"{numero + 1}A", row=numero + 1, column=1, type="economy")
+				reserva = Reservation.objects.create(flight=vuelo, passenger=self.passenger, seat=asiento, price=1000, status="confirmed", reservation_code=f"V{numero}")
+				Ticket.objects.create(reservation=reserva, barcode=f"BC{numero}")
+				pasajero = Passenger.objects.create(
+					name=f"Pasajero {numero}", document=f"9000{numero}", document_type="DNI",
+					email=f"pasajero{numero}@example.com", phone="1", birth_date="1990-01-01"
+				)
+				Reservation.objects.create(flight=self.flight, passenger=pasajero, seat=asiento, price=1000, status="confirmed", reservation_code=f"P{numero}")
+
+			self.client.force_authenticate(user=self.user)
+			for url, consultas in listados:
+				with self.assertNumQueries(consultas):
+					response = self.client.get(url)
+				print(f"{url} con {cantidad} filas: {response.status_code} - {len(response.data['results'])} resultados")
+				self.assertEqual(response.status_code, 200)
+
+			self.client.force_authenticate(user=admin)
+			with self.assertNumQueries(2):
+				response = self.client.get(reverse('vuelo-pasajeros', args=[self.flight.id]))
+			self.assertEqual(response.data['total_pasajeros'], cantidad)
+
+	def test_layout_compacto_por_negociacion_de_contenido(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: Layout de asientos compacto con Accept o ?format=layout")
+		Seat.objects.create(airplane=self.airplane, number="1C", row=1, column=3, type="economy")
+		Seat.objects.create(airplane=self.airplane, number="2A", row=2, column=1, type="business")
+		SeatInventoryService().claim(self.flight, [self.seat], 'reserved')
+
+		# Sin pedirlo, el formato detallado de siempre
+		response = self.client.get(reverse('avion-list'))
+		self.assertEqual(response['Content-Type'], 'application/json')
+		self.assertEqual(len(response.data['results'][0]['seats']), 3)
+
+		response = self.client.get(reverse('avion-list'), HTTP_ACCEPT='application/vnd.volando.seat-layout+json')
+		print(f"Flota compacta: {response.status_code} - {response.data}")
+		self.assertEqual(response['Content-Type'], 'application/vnd.volando.seat-layout+json')
+		layout = response.data['results'][0]
+		self.assertEqual((layout['rows'], layout['columns']), (30, 6))
+		self.assertEqual(layout['types'], '1E1-1E3-1B173-')
+		self.assertNotIn('seats', layout)
+
+		url = reverse('avion-layout-asientos', args=[self.airplane.id])
+		response = self.client.get(url + f'?format=layout&vuelo={self.flight.id}')
+		print(f"Layout con estado: {response.status_code} - {response.data['status']}")
+		self.assertEqual(response.data['status'], '1R1-1A3-1A173-')
+		self.assertEqual(response.data['ids'][:3], [self.seat.id, None, self.seat.id + 1])
+		self.assertEqual(self.client.get(url + '?format=layout&vuelo=999').status_code, 404)
+		self.assertEqual(len(self.client.get(url).data), 3)
+
+	def test_get_condicional_con_etag(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: Vuelos y layout de asientos responden 304 mientras no cambian")
+		urls = [
+			reverse('vuelo-list'),
+			reverse('vuelo-detail', args=[self.flight.id]),
+			reverse('avion-layout-asientos', args=[self.airplane.id]) + f'?format=layout&vuelo={self.flight.id}',
+		]
+		etags = {}
+		for url in urls:
+			response = self.client.get(url)
+			etags[url] = response['ETag']
+			response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+			print(f"{url}: {response.status_code}")
+			self.assertEqual(response.status_code, 304)
+		self.assertIn('Last-Modified', self.client.get(urls[1]))
+
+		# Un cambio de estado de asiento sólo cambia el layout del vuelo
+		with self.captureOnCommitCallbacks(execute=True):
+			SeatInventoryService().claim(self.flight, [self.seat], 'reserved')
+		self.assertEqual(self.client.get(urls[0], HTTP_IF_NONE_MATCH=etags[urls[0]]).status_code, 304)
+		response = self.client.get(urls[2], HTTP_IF_NONE_MATCH=etags[urls[2]])
+		print(f"Layout después de reservar: {response.status_code} - {response.data['status']}")
+		self.assertTrue(response.data['status'].startswith('1R'))
+
+		# Los usuarios del vuelo también son parte de su versión
+		self.flight.users.add(self.user)
+		for url in urls[:2]:
+			response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+			self.assertEqual(response.status_code, 200)
+			etags[url] = response['ETag']
+
+		self.flight.status = 'canceled'
+		self.flight.save()
+		for url in urls[:2]:
+			self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etags[url]).status_code, 200)
+
+	def test_patch_de_reserva_atomico_y_con_inventario(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: PATCH de una reserva mueve el asiento en el inventario y no queda a medias")
+		otro = Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="economy")
+		tomado = Seat.objects.create(airplane=self.airplane, number="1C", row=1, column=3, type="economy")
+		SeatInventoryService().claim(self.flight, [tomado], 'occupied')
+		response = self.client.post(reverse('reserva-list'), {"flight": self.flight.id, "seat": self.seat.id, "price": 1000}, format='json')
+		url = reverse('reserva-detail', args=[response.data['id']])
+
+		response = self.client.patch(url, {"seat": otro.id}, format='json')
+		print(f"Cambio de asiento: {response.status_code} - {response.data}")
+		self.assertEqual(response.status_code, 200)
+		inventario = SeatInventoryService()
+		self.assertEqual(inventario.status_of(self.flight, self.seat), 'available')
+		self.assertEqual(inventario.status_of(self.flight, otro), 'reserved')
+
+		response = self.client.patch(url, {"seat": tomado.id}, format='json')
+		print(f"Asiento tomado: {response.status_code} - {response.data}")
+		self.assertEqual(response.status_code, 400)
+		self.assertEqual(inventario.status_of(self.flight, otro), 'reserved')
+
+		response = self.client.patch(url, {"price": 1, "status": "volando"}, format='json')
+		print(f"Estado inválido: {response.status_code} - {response.data}")
+		self.assertEqual(response.status_code, 400)
+		self.assertEqual(Reservation.objects.get(id=response.wsgi_request.resolver_match.kwargs['pk']).price, 1000)
+
+	def test_carga_de_vuelos_por_lote(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: Alta y modificación de vuelos por lote con errores por posición")
+		admin = User.objects.create_user(username="admin", password="adminpass", is_staff=True)
+		self.client.force_authenticate(user=admin)
+		salida = self.flight.departure_time
+		url = reverse('vuelo-lote')
+
+		def vuelo(horas, **cambios):
+			return {
+				"airplane": self.airplane.id,
+				"origin": "AEP",
+				"destination": "BRC",
+				"departure_time": (salida + datetime.timedelta(hours=horas)).isoformat(),
+				"arrival_time": (salida + datetime.timedelta(hours=horas + 2)).isoformat(),
+				"duration": "02:00:00",
+				"base_price": "3000.00",
+				**cambios
+			}
+
+		# La búsqueda del día queda cacheada vacía antes de la carga
+		dia = timezone.localtime(salida + datetime.timedelta(hours=1)).date()
+		self.assertEqual(FlightSearchService().search("AEP", "BRC", dia), [])
+
+		lote = [vuelo(1), vuelo(2, airplane=999), vuelo(3, arrival_time=salida.isoformat()), vuelo(4), "no es un vuelo"]
+		with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(4):
+			response = self.client.post(url, lote, format='json')
+		print(f"Lote con errores: {response.status_code} - {response.data}")
+		self.assertEqual(response.status_code, 207)
+		self.assertEqual(len(response.data['creados']), 2)
+		self.assertEqual([error['posicion'] for error in response.data['errores']], [1, 2, 4])
+		self.assertIn('airplane', response.data['errores'][0]['errores'])
+		self.assertEqual(Flight.objects.filter(destination="BRC").count(), 2)
+		# bulk_create no dispara señales: la carga invalida la búsqueda por su cuenta
+		self.assertIn(response.data['creados'][0], [flight.id for flight in FlightSearchService().search("AEP", "BRC", dia)])
+
+		creados = response.data['creados']
+		cambios = [
+			{"id": creados[0], "base_price": "3500.00"},
+			{"id": creados[1], "status": "completed"},
+			{"id": 999, "base_price": "1.00"},
+		]
+		response = self.client.patch(url, cambios, format='json')
+		print(f"Cambios por lote: {response.status_code} - {response.data}")
+		self.assertEqual(response.status_code, 207)
+		self.assertEqual(response.data['actualizados'], [creados[0]])
+		self.assertEqual([error['posicion'] for error in response.data['errores']], [1, 2])
+		self.assertEqual(Flight.objects.get(id=creados[0]).base_price, 3500)
+		self.assertEqual(Flight.objects.get(id=creados[1]).status, "scheduled")
+
+		# Sólo los administradores cargan vuelos
+		self.client.force_authenticate(user=self.user)
+		self.assertEqual(self.client.post(url, [vuelo(5)], format='json').status_code, 403)
+
+	def test_cambio_de_estado_de_reservas_en_lote(self):
+		print("\n-------------------------------------------------")
+		print("\nTest: Confirmación de reservas en lote")
+		self.user.email = self.passenger.email
+		self.user.save()
+		reserva = self.client.post(reverse('reserva-list'), {"flight": self.flight.id, "seat": self.seat.id, "price": 1000}, format='json').data
+		url = reverse('reserva-cambiar-estado-lote')
+		response = self.client.post(url, {"ids": [reserva['id'], 999], "status": "confirmed"}, format='json')
+		print(f"Lote: {response.status_code} - {response.data}")
+		self.assertEqual(response.status_code, 207)
+		self.assertEqual(response.data['cambiadas'], [reserva['id']])
+		self.assertEqual(response.data['errores'], [{'id': 999, 'error': "Reserva inexistente"}])
+		self.assertEqual(SeatInventoryService().status_of(self.flight, self.seat), 'occupied')
+
+		response = self.client.post(url, {"ids": [reserva['id']], "status": "pending"}, format='json')
+		self.assertEqual(response.status_code, 400)
+		response = self.client.post(url, {"ids": [], "status": "canceled"}, format='json')
+		self.assertEqual(response.status_code, 400)
@@ -2,7 +2,8 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from rest_framework.authtoken import views
 from .views import (
-    RegistroPasajeroView, AvionViewSet, VueloViewSet, ReservaViewSet
+    RegistroPasajeroView, AvionViewSet, VueloViewSet, ReservaViewSet, BloqueosMetricasView,
+    BusquedasMetricasView, AeropuertosAutocompletarView
 )
 
 router = DefaultRouter()
@@ -14,4 +15,7 @@ urlpatterns = [
     path('', include(router.urls)),
     path('registro/', RegistroPasajeroView.as_view(), name='registro'),
     path('token/', views.obtain_auth_token, name='token'),
+    path('bloqueos/metricas/', BloqueosMetricasView.as_view(), name='bloqueos-metricas'),
+    path('aeropuertos/autocompletar/', AeropuertosAutocompletarView.as_view(), name='aeropuertos-autocompletar'),
+    path('busquedas/metricas/', BusquedasMetricasView.as_view(), name='busquedas-metricas'),
 ]
@@ -4,14 +4,23 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.generics import get_object_or_404
 from rest_framework.exceptions import ValidationError
+from django.db.models import prefetch_related_objects
 from django_filters.rest_framework import DjangoFilterBackend
+from app.airport_index import airport_index
+from app.conditional import conditional_response, make_etag, set_validators
 from app.models import Airplane, Seat, Flight, Reservation, Ticket
-from app.services import FlightService, ReservaService
+from app.services import FlightSearchService, FlightService, ReservaService, SeatHoldService, SeatLayoutService, SeatRecommendationService
+from .pagination import ReservaPagination, VueloPagination
+from .renderers import SeatLayoutRenderer
 from .permissions import IsAdminUser
 from .serializers import (
-    UserSerializer, AirplaneSerializer, SeatSerializer, VueloSerializer,
-    ReservaSerializer, BoletoSerializer, PassengerSerializer
+    UserSerializer, AirplaneSerializer, SeatSerializer, VueloSerializer, VueloLoteSerializer,
+    ReservaSerializer, ReservaGrupoSerializer, ReservaIdaVueltaSerializer, BoletoSerializer, PassengerSerializer,
+    CambioEstadoLoteSerializer,
+    CalendarioTarifasSerializer, TarifaDiaSerializer, ConexionesSerializer, ConexionSerializer
 )
 
 class RegistroPasajeroView(APIView):
@@ -24,27 +33,101 @@ class RegistroPasajeroView(APIView):
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class BloqueosMetricasView(APIView):
+    """
+    Métricas de bloqueos de asientos (activos, vencidos sin barrer y contadores)
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(SeatHoldService().metrics())
+
+class BusquedasMetricasView(APIView):
+    """
+    Aciertos y fallos de la caché de búsquedas de vuelos
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(FlightSearchService().metrics())
+
+class AeropuertosAutocompletarView(APIView):
+    """
+    Autocompletado de aeropuertos por prefijo de código, nombre, ciudad o
+    sinónimo, sin tildes: ?q=cord. Responde desde el índice en memoria
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return Response(airport_index.search(request.query_params.get('q', '')))
+
 class AvionViewSet(ReadOnlyModelViewSet):
-    queryset = Airplane.objects.all()
+    """
+    Con Accept: application/vnd.volando.seat-layout+json (o ?format=layout)
+    los layouts salen compactos: dimensiones y grillas en run-length
+    """
+    queryset = Airplane.objects.order_by('id')
     serializer_class = AirplaneSerializer
+    renderer_classes = [JSONRenderer, BrowsableAPIRenderer, SeatLayoutRenderer]
+
+    def compact(self):
+        return self.request.accepted_renderer.format == SeatLayoutRenderer.format
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # El formato compacto lee los asientos con values_list: no hace falta precargarlos
+        if self.compact():
+            return queryset
+        return AirplaneSerializer.optimize_queryset(queryset, self.request)
+
+    def list(self, request, *args, **kwargs):
+        if not self.compact():
+            return super().list(request, *args, **kwargs)
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        return self.get_paginated_response(SeatLayoutService().compact_layouts(page))
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.compact():
+            return super().retrieve(request, *args, **kwargs)
+        return Response(SeatLayoutService().compact_layout(self.get_object()))
 
     @action(detail=True, methods=['get'])
     def layout_asientos(self, request, pk=None):
+        """
+        Asientos del avión. En formato compacto, ?vuelo=<id> agrega el
+        estado de cada asiento en ese vuelo. El ETag sale de la versión de
+        los asientos y del inventario del vuelo, sin armar el layout: si el
+        cliente ya la tiene (If-None-Match) responde 304
+        """
         instance = self.get_object()
-        asientos = Seat.objects.filter(airplane=instance)
-        serializer = SeatSerializer(asientos, many=True)
-        return Response(serializer.data)
+        vuelo = request.query_params.get('vuelo')
+        flight = get_object_or_404(Flight, pk=vuelo, airplane=instance) if vuelo and self.compact() else None
+        etag = None
+        if request.accepted_renderer.format != BrowsableAPIRenderer.format:
+            etag = make_etag(request.get_full_path(), request.accepted_renderer.format,
+                             SeatLayoutService().current_version(instance, flight))
+            not_modified = conditional_response(request, etag)
+            if not_modified is not None:
+                return not_modified
+        if self.compact():
+            response = Response(SeatLayoutService().compact_layout(instance, flight))
+        else:
+            asientos = Seat.objects.filter(airplane=instance)
+            serializer = SeatSerializer(asientos, many=True)
+            response = Response(serializer.data)
+        return set_validators(response, etag) if etag else response
 
 class VueloViewSet(ModelViewSet):
     queryset = Flight.objects.all()
     serializer_class = VueloSerializer
+    pagination_class = VueloPagination
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['origin', 'destination', 'departure_time', 'status']
 
     @action(detail=True, methods=['get'], permission_classes=[IsAdminUser])
     def pasajeros(self, request, pk=None):
         vuelo = self.get_object()
-        reservas = vuelo.reservations.filter(status='confirmed')
+        reservas = vuelo.reservations.filter(status='confirmed').select_related('passenger')
         pasajeros = [reserva.passenger for reserva in reservas]
         serializer = PassengerSerializer(pasajeros, many=True)
         return Response({
@@ -52,28 +135,198 @@ class VueloViewSet(ModelViewSet):
             'pasajeros': serializer.data
         })
 
+    @action(detail=True, methods=['get'])
+    def sugerir_asientos(self, request, pk=None):
+        """
+        Sugiere el mejor bloque de asientos contiguos libres para un grupo:
+        ?cantidad=3&clase=economy
+        """
+        vuelo = self.get_object()
+        try:
+            cantidad = int(request.query_params.get('cantidad', 1))
+        except ValueError:
+            cantidad = 0
+        if not 1 <= cantidad <= ReservaService.MAX_PASAJEROS_GRUPO:
+            return Response(
+                {'error': f'La cantidad debe estar entre 1 y {ReservaService.MAX_PASAJEROS_GRUPO}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        clase = request.query_params.get('clase', 'economy')
+        if clase not in Seat.TYPE_CODES:
+            return Response(
+                {'error': f'Clase no válida. Opciones: {list(Seat.TYPE_CODES)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        sugerencia = SeatRecommendationService().suggest(vuelo, cantidad, clase)
+        if sugerencia is None:
+            return Response(
+                {'error': 'No quedan suficientes asientos libres en esa clase'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        asientos, contiguos = sugerencia
+        return Response({
+            'contiguos': contiguos,
+            'asientos': SeatSerializer(asientos, many=True).data
+        })
+
+    @action(detail=False, methods=['get'])
+    def calendario(self, request):
+        """
+        Tarifa más baja por día en la ventana fecha ± dias:
+        ?origin=AEP&destination=COR&fecha=2025-08-01&dias=3&clase=economy
+        """
+        serializer = CalendarioTarifasSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        calendario = FlightSearchService().fare_calendar(
+            params['origin'], params['destination'], params['fecha'], params['dias'], params['clase']
+        )
+        return Response(TarifaDiaSerializer(calendario, many=True).data)
+
+    @action(detail=False, methods=['get'])
+    def conexiones(self, request):
+        """
+        Itinerarios con hasta `escalas` escalas que salen ese día:
+        ?origin=AEP&destination=USH&fecha=2025-08-01&escalas=2&clase=economy
+        """
+        serializer = ConexionesSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        conexiones = FlightSearchService().connections(
+            params['origin'], params['destination'], params['fecha'], params.get('clase'), params['escalas']
+        )
+        return Response(ConexionSerializer(conexiones, many=True).data)
+
+    @action(detail=False, methods=['post', 'patch'])
+    def lote(self, request):
+        """
+        Carga por lote: POST crea una lista de vuelos y PATCH aplica una lista
+        de cambios [{"id": 1, "status": "canceled"}, ...]. Los válidos se
+        guardan juntos en una transacción; los demás vuelven con su posición
+        en la lista y sus errores
+        """
+        items = request.data
+        if not isinstance(items, list) or not 1 <= len(items) <= FlightService.MAX_LOTE:
+            return Response(
+                {'error': f'Se espera una lista de 1 a {FlightService.MAX_LOTE} vuelos'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        creando = request.method == 'POST'
+        # Un solo serializer para todo el lote, con la flota y los vuelos leídos de una vez
+        context = {**self.get_serializer_context(), 'airplanes': Airplane.objects.in_bulk()}
+        serializer = VueloLoteSerializer(context=context, partial=not creando)
+        vuelos = {} if creando else Flight.objects.in_bulk(
+            {item.get('id') for item in items if isinstance(item, dict) and isinstance(item.get('id'), int)}
+        )
+
+        validos, errores = [], {}
+        for posicion, item in enumerate(items):
+            if not isinstance(item, dict):
+                errores[posicion] = {'non_field_errors': ['Se espera un objeto']}
+                continue
+            if not creando and item.get('id') not in vuelos:
+                errores[posicion] = {'id': ['Vuelo inexistente']}
+                continue
+            try:
+                datos = serializer.run_validation(item)
+            except ValidationError as e:
+                errores[posicion] = e.detail
+                continue
+            validos.append((posicion, datos) if creando else (posicion, vuelos[item['id']], datos))
+
+        if creando:
+            guardados, errores_negocio = self.flight_service.bulk_create_flights(validos)
+        else:
+            guardados, errores_negocio = self.flight_service.bulk_update_flights(validos)
+        errores.update({posicion: {'non_field_errors': error} for posicion, error in errores_negocio.items()})
+
+        if not guardados and errores:
+            codigo = status.HTTP_400_BAD_REQUEST
+        elif errores:
+            codigo = status.HTTP_207_MULTI_STATUS
+        else:
+            codigo = status.HTTP_201_CREATED if creando else status.HTTP_200_OK
+        return Response({
+            'creados' if creando else 'actualizados': [vuelo.pk for vuelo in guardados],
+            'errores': [{'posicion': posicion, 'errores': errores[posicion]} for posicion in sorted(errores)],
+        }, status=codigo)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.flight_service = FlightService()
 
-    def get_permissions(self):
+    def conditional(self):
+        """
+        GET condicional para list y retrieve en JSON. Con ?expand= la
+        respuesta incluye el avión, que updated_at del vuelo no versiona
+        """
+        request = self.request
+        return 'expand' not in request.query_params and request.accepted_renderer.format != BrowsableAPIRenderer.format
+
+    def etag(self, *parts):
+        return make_etag(self.request.get_full_path(), self.request.accepted_renderer.format, *parts)
+
+    def list(self, request, *args, **kwargs):
+        """
+        El ETag de una página sale de los ids y updated_at de sus vuelos y de
+        si hay páginas vecinas, antes de serializarlos. Sin Last-Modified:
+        un borrado no mueve la última modificación
+        """
+        if not self.conditional():
+            return super().list(request, *args, **kwargs)
+        # Los usuarios se precargan recién si hay que serializar la página
+        _, prefetch = VueloSerializer.related_lookups(VueloSerializer.default_expand)
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()).prefetch_related(None))
+        etag = self.etag(self.paginator.has_next, self.paginator.has_previous,
+                         *((vuelo.pk, vuelo.updated_at) for vuelo in page))
+        not_modified = conditional_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        prefetch_related_objects(page, *prefetch)
+        serializer = self.get_serializer(page, many=True)
+        return set_validators(self.get_paginated_response(serializer.data), etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.conditional():
+            return super().retrieve(request, *args, **kwargs)
+        vuelo = self.get_object()
+        etag = self.etag(vuelo.updated_at)
+        not_modified = conditional_response(request, etag, vuelo.updated_at)
+        if not_modified is not None:
+            return not_modified
+        return set_validators(Response(self.get_serializer(vuelo).data), etag, vuelo.updated_at)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Las acciones que no serializan el vuelo (pasajeros, sugerir_asientos) no precargan nada
         if self.action in ['list', 'retrieve']:
+            queryset = VueloSerializer.optimize_queryset(queryset, self.request)
+        return queryset
+
+    def get_permissions(self):
+        if self.action in ['list', 'retrieve', 'sugerir_asientos', 'calendario', 'conexiones']:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
 
+    # La respuesta se arma con el objeto que guardó el servicio, así ?expand= puede anidarlo
     def perform_create(self, serializer):
-        return self.flight_service.create_flight(serializer.validated_data)
+        serializer.instance = self.flight_service.create_flight(serializer.validated_data)
+        return serializer.instance
 
     def perform_update(self, serializer):
-        return self.flight_service.update_flight(self.get_object(), serializer.validated_data)
+        serializer.instance = self.flight_service.update_flight(self.get_object(), serializer.validated_data)
+        return serializer.instance
 
     def perform_destroy(self, instance):
         self.flight_service.delete_flight(instance)
 
 class ReservaViewSet(ModelViewSet):
     serializer_class = ReservaSerializer
+    pagination_class = ReservaPagination
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['status', 'flight']
@@ -82,11 +335,56 @@ class ReservaViewSet(ModelViewSet):
         super().__init__(*args, **kwargs)
         self.reserva_service = ReservaService()
 
-    def get_queryset(self):
+    def reservas_del_usuario(self):
         return Reservation.objects.filter(passenger__email=self.request.user.email)
 
+    def get_queryset(self):
+        return ReservaSerializer.optimize_queryset(self.reservas_del_usuario(), self.request)
+
     def perform_create(self, serializer):
-        return self.reserva_service.crear_reserva(serializer.validated_data, self.request.user)
+        serializer.instance = self.reserva_service.crear_reserva(serializer.validated_data, self.request.user)
+        return serializer.instance
+
+    def perform_update(self, serializer):
+        # status es de sólo lectura en el serializer: el servicio aplica el estado y el asiento
+        # junto con el resto del cambio, en una transacción, manteniendo el inventario
+        serializer.instance = self.reserva_service.actualizar_reserva(
+            serializer.instance, serializer.validated_data, self.request.data.get('status')
+        )
+
+    @action(detail=False, methods=['post'])
+    def grupo(self, request):
+        """
+        Reserva de grupo: todos los asientos en una sola transacción o ninguno
+        """
+        serializer = ReservaGrupoSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            reservas = self.reserva_service.crear_reservas_grupo(
+                serializer.validated_data['flight'],
+                serializer.validated_data['pasajeros'],
+                request.user
+            )
+        except ValidationError as e:
+            return Response({'error': e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(reservas, many=True).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['post'])
+    def ida_y_vuelta(self, request):
+        """
+        Reserva de ida y vuelta: los dos tramos en una sola transacción o ninguno
+        """
+        serializer = ReservaIdaVueltaSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            reservas = self.reserva_service.crear_reserva_ida_vuelta(
+                serializer.validated_data['ida'],
+                serializer.validated_data['vuelta'],
+                request.user
+            )
+        except ValidationError as e:
+            return Response({'error': e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(reservas, many=True).data, status=status.HTTP_201_CREATED)
 
     @action(detail=True, methods=['post'])
     def cambiar_estado(self, request, pk=None):
@@ -105,6 +403,31 @@ class ReservaViewSet(ModelViewSet):
         except ValidationError as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['post'])
+    def cambiar_estado_lote(self, request):
+        """
+        Cambia el estado de muchas reservas del usuario a la vez:
+        {"ids": [1, 2, 3], "status": "confirmed"}. Las que no pueden pasar a
+        ese estado vuelven con su error; el resto se aplica junto
+        """
+        serializer = CambioEstadoLoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        cambiadas, errores = self.reserva_service.cambiar_estado_reservas(
+            serializer.validated_data['ids'],
+            serializer.validated_data['status'],
+            self.reservas_del_usuario()
+        )
+        if not cambiadas and errores:
+            codigo = status.HTTP_400_BAD_REQUEST
+        elif errores:
+            codigo = status.HTTP_207_MULTI_STATUS
+        else:
+            codigo = status.HTTP_200_OK
+        return Response({
+            'cambiadas': cambiadas,
+            'errores': [{'id': reserva_id, 'error': error} for reserva_id, error in errores.items()],
+        }, status=codigo)
+
     @action(detail=True, methods=['post'])
     def generar_boleto(self, request, pk=None):
         reserva = self.get_object()
@@ -0,0 +1,87 @@
+import bisect
+import re
+import threading
+import unicodedata
+
+from .models import Airport
+
+
+class AirportIndex:
+    """
+    Índice de prefijos en memoria para autocompletar aeropuertos: un arreglo
+    ordenado de (término normalizado, prioridad, código) con los códigos
+    IATA, los nombres, las ciudades, cada palabra de ellos y los sinónimos.
+    Se arma una vez por proceso desde la tabla de aeropuertos y se rearma
+    sólo cuando cambia; las búsquedas no tocan la base
+    """
+    LIMIT = 10
+    # Orden de los resultados: primero el código, después el nombre o la ciudad
+    CODE, NAME, WORD, SYNONYM = range(4)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = None
+        self._entries = None
+        self._airports = None
+
+    @staticmethod
+    def normalize(text):
+        """Minúsculas, sin tildes ni signos: 'Córdoba (Pajas Blancas)' -> 'cordoba pajas blancas'"""
+        text = unicodedata.normalize('NFKD', text or '')
+        text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+        return ' '.join(re.findall(r'[a-z0-9]+', text))
+
+    def build(self):
+        entries = []
+        airports = {}
+        for airport in Airport.objects.order_by('code'):
+            code = airport.code.upper()
+            airports[code] = {'code': code, 'name': airport.name, 'city': airport.city}
+            terms = [(self.CODE, airport.code)]
+            for text in (airport.name, airport.city):
+                terms.append((self.NAME, text))
+                terms.extend((self.WORD, word) for word in self.normalize(text).split()[1:])
+            terms.extend((self.SYNONYM, synonym) for synonym in airport.synonym_list())
+            for priority, term in terms:
+                term = self.normalize(term)
+                if term:
+                    entries.append((term, priority, code))
+        entries = sorted(set(entries))
+
+        with self._lock:
+            self._keys = [term for term, _, _ in entries]
+            self._entries = entries
+            self._airports = airports
+
+    def invalidate(self):
+        with self._lock:
+            self._keys = None
+
+    def search(self, query, limit=LIMIT):
+        """
+        Aeropuertos con algún término que empieza con query, sin importar
+        tildes ni mayúsculas. Devuelve dicts {'code', 'name', 'city'}
+        """
+        if self._keys is None:
+            self.build()
+        prefix = self.normalize(query)
+        if not prefix:
+            return []
+
+        with self._lock:
+            keys, entries, airports = self._keys, self._entries, self._airports
+        matches = {}
+        position = bisect.bisect_left(keys, prefix)
+        while position < len(keys) and keys[position].startswith(prefix):
+            term, priority, code = entries[position]
+            # Una coincidencia exacta gana sobre un prefijo de la misma prioridad
+            rank = (priority, term != prefix)
+            if rank < matches.get(code, (len(entries),)):
+                matches[code] = rank
+            position += 1
+
+        ranked = sorted(matches, key=lambda code: (matches[code], code))
+        return [airports[code] for code in ranked[:limit]]
+
+
+airport_index = AirportIndex()
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+
+class SeatStatusBroadcaster:
+    """
+    Difunde los cambios de estado de asientos a los clientes conectados a
+    este proceso. Cada suscriptor tiene su propia cola en su event loop:
+    publicar no consulta la base, sólo recorre los suscriptores del vuelo
+    """
+    QUEUE_SIZE = 100
+    RESYNC = {'resync': True}
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+    def subscribe(self, flight_id):
+        """Registra una cola para el vuelo; se llama desde el event loop del cliente"""
+        queue = asyncio.Queue(self.QUEUE_SIZE)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._subscribers.setdefault(flight_id, {})[queue] = loop
+        return queue
+
+    def unsubscribe(self, flight_id, queue):
+        with self._lock:
+            subscribers = self._subscribers.get(flight_id, {})
+            subscribers.pop(queue, None)
+            if not subscribers:
+                self._subscribers.pop(flight_id, None)
+
+    def subscriber_count(self, flight_id):
+        with self._lock:
+            return len(self._subscribers.get(flight_id, {}))
+
+    def publish(self, flight_id, event):
+        """
+        Entrega el evento a todos los suscriptores del vuelo. Puede llamarse
+        desde cualquier hilo (las vistas sync corren fuera del event loop)
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(flight_id, {}).items())
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, event)
+            except RuntimeError:
+                # El loop del cliente ya se cerró
+                self.unsubscribe(flight_id, queue)
+
+    @classmethod
+    def _deliver(cls, queue, event):
+        if queue.full():
+            # Cliente lento: se descartan sus deltas pendientes y se le pide
+            # que vuelva a pedir el mapa completo
+            while not queue.empty():
+                queue.get_nowait()
+            event = cls.RESYNC
+        queue.put_nowait(event)
+
+
+seat_status_broadcaster = SeatStatusBroadcaster()
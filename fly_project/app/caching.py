@@ -0,0 +1,82 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class VersionedCache:
+    """
+    Invalidación por versiones sobre la caché configurada: cada espacio de
+    nombres (flights, seats, reservations, availability, destinations) tiene
+    un número de versión que forma parte de las claves que dependen de él. Subir la
+    versión invalida todas esas claves de una vez, en todos los workers, sin
+    recorrerlas; las entradas viejas expiran solas.
+
+    get_or_compute evita la estampida: cuando una clave falta, un solo
+    pedido la recalcula y el resto espera su resultado
+    """
+    LOCK_TIMEOUT = 30
+    WAIT_TIMEOUT = 5
+    POLL_INTERVAL = 0.05
+
+    def version_key(self, namespace):
+        return f"cache_version:{namespace}"
+
+    def versions(self, *namespaces):
+        keys = [self.version_key(namespace) for namespace in namespaces]
+        versions = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                # Si la versión se perdió (expulsión, reinicio) arranca de un valor
+                # nuevo, para no volver a servir entradas de una versión anterior
+                cache.add(key, time.time_ns() // 1000, None)
+                versions[key] = cache.get(key)
+        return [versions[key] for key in keys]
+
+    def key(self, namespaces, *parts):
+        """
+        Clave que depende de las versiones de namespaces:
+        key(['flights'], 'offers', '2025-08-01') -> 'offers:2025-08-01:v17'
+        """
+        versions = '.'.join(str(version) for version in self.versions(*namespaces))
+        return ':'.join([*(str(part) for part in parts), f"v{versions}"])
+
+    def bump(self, namespace):
+        key = self.version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns() // 1000, None)
+
+    def bump_on_commit(self, namespace):
+        transaction.on_commit(lambda: self.bump(namespace))
+
+    def get_or_compute(self, key, compute, timeout):
+        """
+        Valor cacheado de key, calculándolo con compute() si falta. Mientras
+        un pedido lo calcula, los demás esperan hasta WAIT_TIMEOUT segundos
+        a que aparezca; si no aparece lo calculan sin cachearlo
+        """
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        lock_key = f"{key}:lock"
+        if cache.add(lock_key, 1, self.LOCK_TIMEOUT):
+            try:
+                value = compute()
+                cache.set(key, value, timeout)
+            finally:
+                cache.delete(lock_key)
+            return value
+
+        deadline = time.monotonic() + self.WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(self.POLL_INTERVAL)
+            value = cache.get(key)
+            if value is not None:
+                return value
+        return compute()
+
+
+versioned_cache = VersionedCache()
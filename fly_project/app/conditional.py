@@ -0,0 +1,39 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def make_etag(*parts):
+    """
+    ETag a partir de lo que identifica la versión de una respuesta (ids,
+    marcas de modificación, contadores de versión), sin armar su contenido
+    """
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def set_validators(response, etag, last_modified=None):
+    """
+    Agrega ETag y Last-Modified. no-cache hace que el cliente revalide en
+    cada pedido: la respuesta se reusa sólo si el servidor contesta 304
+    """
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_response(request, etag, last_modified=None):
+    """
+    304 si el cliente ya tiene esta versión (If-None-Match, o
+    If-Modified-Since cuando no manda ETag); None si hay que armar la
+    respuesta completa
+    """
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified and int(last_modified.timestamp())
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
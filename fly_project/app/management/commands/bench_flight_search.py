@@ -0,0 +1,146 @@
+import datetime
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from app.models import Airplane, Flight
+from app.route_graph import route_graph
+from app.services import FlightSearchService
+
+AIRPORTS = ['AEP', 'EZE', 'COR', 'MDZ', 'BRC', 'USH', 'IGR', 'NQN']
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark de la búsqueda de vuelos: carga N vuelos y muestra el plan "
+        "(EXPLAIN) y la latencia con y sin los índices de búsqueda, filtrando por "
+        "__date y por rango semiabierto, la latencia de la búsqueda de conexiones "
+        "sobre el grafo de rutas y la de paginar con OFFSET contra cursor. Todo "
+        "corre en una transacción que se revierte"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--flights', type=int, default=1_000_000, help="Vuelos a generar")
+        parser.add_argument('--days', type=int, default=365, help="Días sobre los que se reparten las salidas")
+        parser.add_argument('--repeat', type=int, default=20, help="Ejecuciones por consulta para medir latencia")
+
+    def handle(self, *args, **options):
+        # SQLite no permite usar el schema editor con las FK activas dentro de una transacción
+        connection.disable_constraint_checking()
+        try:
+            with transaction.atomic():
+                self.seed(options['flights'], options['days'])
+                indexes = Flight._meta.indexes
+
+                with connection.schema_editor() as editor:
+                    for index in indexes:
+                        editor.remove_index(Flight, index)
+                self.report("Sin índices", options)
+
+                with connection.schema_editor() as editor:
+                    for index in indexes:
+                        editor.add_index(Flight, index)
+                self.report("Con índices", options)
+                self.report_connections(options)
+                self.report_pagination(options)
+
+                transaction.set_rollback(True)
+        finally:
+            connection.enable_constraint_checking()
+            # El grafo se armó con vuelos que se revierten
+            route_graph.invalidate()
+
+    def seed(self, total, days):
+        airplane = Airplane.objects.create(model="Bench", capacity=180, rows=30, columns=6)
+        start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        random.seed(42)
+        created = 0
+        began = time.perf_counter()
+        while created < total:
+            batch = []
+            for _ in range(min(10_000, total - created)):
+                origin, destination = random.sample(AIRPORTS, 2)
+                departure = start + datetime.timedelta(minutes=random.randrange(days * 24 * 60))
+                batch.append(Flight(
+                    airplane=airplane,
+                    origin=origin,
+                    destination=destination,
+                    departure_time=departure,
+                    arrival_time=departure + datetime.timedelta(hours=2),
+                    duration=datetime.timedelta(hours=2),
+                    status=random.choice(['scheduled'] * 8 + ['completed', 'canceled']),
+                    base_price=random.randrange(20_000, 200_000),
+                ))
+            Flight.objects.bulk_create(batch)
+            created += len(batch)
+        self.stdout.write(f"Vuelos generados: {created} en {time.perf_counter() - began:.1f}s")
+
+    def queries(self, options):
+        day = timezone.localdate() + datetime.timedelta(days=options['days'] // 2)
+        offers_start, offers_end = FlightSearchService().day_range(timezone.localdate(), days=91)
+        return [
+            ("Búsqueda por ruta con __date", Flight.objects.filter(
+                origin='AEP', destination='COR', departure_time__date=day, status='scheduled'
+            )),
+            ("Búsqueda por ruta con rango", FlightSearchService().route_flights(
+                'AEP', 'COR', *FlightSearchService().day_range(day)
+            ).order_by('departure_time')),
+            ("Ofertas con __date", Flight.objects.filter(
+                departure_time__date__gte=timezone.localdate(),
+                departure_time__date__lte=timezone.localdate() + datetime.timedelta(days=90),
+                status='scheduled',
+            ).order_by('departure_time')[:50]),
+            ("Ofertas con rango", Flight.objects.filter(
+                departure_time__gte=offers_start, departure_time__lt=offers_end, status='scheduled'
+            ).order_by('departure_time')[:50]),
+        ]
+
+    def report(self, title, options):
+        self.stdout.write(f"\n=== {title} ===")
+        for name, queryset in self.queries(options):
+            timings = []
+            for _ in range(options['repeat']):
+                began = time.perf_counter()
+                list(queryset.values_list('id', flat=True))
+                timings.append((time.perf_counter() - began) * 1000)
+            self.stdout.write(f"\n{name}: mediana {statistics.median(timings):.2f} ms - máx {max(timings):.2f} ms")
+            self.stdout.write(queryset.explain())
+
+    def report_connections(self, options):
+        self.stdout.write("\n=== Conexiones sobre el grafo de rutas ===")
+        began = time.perf_counter()
+        route_graph.build()
+        self.stdout.write(f"Grafo armado en {time.perf_counter() - began:.1f}s")
+
+        start, end = FlightSearchService().day_range(timezone.localdate() + datetime.timedelta(days=options['days'] // 2))
+        timings = []
+        for _ in range(options['repeat']):
+            began = time.perf_counter()
+            itineraries = route_graph.connections('AEP', 'USH', start, end)
+            timings.append((time.perf_counter() - began) * 1000)
+        self.stdout.write(
+            f"AEP → USH hasta 2 escalas: {len(itineraries)} itinerarios - "
+            f"mediana {statistics.median(timings):.2f} ms - máx {max(timings):.2f} ms"
+        )
+
+    def report_pagination(self, options, page_size=50):
+        self.stdout.write("\n=== Paginación de /api/vuelos/ (orden por salida e id) ===")
+        ordered = Flight.objects.order_by('departure_time', 'id')
+        for depth in (0, options['flights'] // 2, options['flights'] - page_size):
+            # El cursor guarda la última posición vista: la página filtra desde ahí
+            last = ordered.values_list('departure_time', flat=True)[depth - 1] if depth else None
+            pages = [
+                ("OFFSET", ordered[depth:depth + page_size]),
+                ("cursor", (ordered.filter(departure_time__gt=last) if last else ordered)[:page_size]),
+            ]
+            for name, queryset in pages:
+                timings = []
+                for _ in range(options['repeat']):
+                    began = time.perf_counter()
+                    list(queryset.values_list('id', flat=True))
+                    timings.append((time.perf_counter() - began) * 1000)
+                self.stdout.write(f"Página desde {depth} con {name}: mediana {statistics.median(timings):.2f} ms")
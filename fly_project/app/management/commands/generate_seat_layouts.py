@@ -0,0 +1,68 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import ProtectedError
+
+from app.models import Airplane, Seat
+from app.services import SeatLayoutService
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera el layout de asientos de los aviones con una definición de cabina. "
+        "Con --sql imprime los INSERT para los seeds en lugar de escribir en la base"
+    )
+
+    def add_arguments(self, parser):
+        cabin = SeatLayoutService.DEFAULT_CABIN
+        parser.add_argument('airplane_ids', nargs='*', type=int, help="Aviones a regenerar (por defecto, todos)")
+        parser.add_argument('--business', default=cabin['business_rows'], help="Filas business, por ejemplo 1-3")
+        parser.add_argument('--premium', default=cabin['premium_rows'], help="Filas premium, por ejemplo 4-8")
+        parser.add_argument('--aisles', default=cabin['aisle_columns'], help="Columnas de pasillo, por ejemplo 4")
+        parser.add_argument('--blocked', default=cabin['blocked_seats'], help="Asientos bloqueados, por ejemplo 1B,12C")
+        parser.add_argument(
+            '--default-type', default=cabin['default_type'],
+            choices=[code for code, _ in Seat.SEAT_TYPES], help="Tipo del resto de las filas"
+        )
+        parser.add_argument('--sql', action='store_true', help="Imprimir INSERTs en lugar de guardar")
+        parser.add_argument('--start-id', type=int, default=1, help="Primer id de asiento al generar SQL")
+
+    def handle(self, *args, **options):
+        service = SeatLayoutService()
+        try:
+            cabin = {
+                'business_rows': service.parse_numbers(options['business']),
+                'premium_rows': service.parse_numbers(options['premium']),
+                'aisle_columns': service.parse_numbers(options['aisles']),
+                'blocked_seats': service.parse_seats(options['blocked']),
+                'default_type': options['default_type'],
+            }
+        except ValueError as error:
+            raise CommandError(error)
+
+        airplanes = Airplane.objects.order_by('id')
+        if options['airplane_ids']:
+            airplanes = airplanes.filter(id__in=options['airplane_ids'])
+
+        if options['sql']:
+            seat_id = options['start_id']
+            for airplane in airplanes:
+                for seat in service.build_seats(airplane, **cabin):
+                    self.stdout.write(
+                        "INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES "
+                        f"({seat_id}, {airplane.id}, '{seat.number}', {seat.row}, {seat.column}, '{seat.type}');"
+                    )
+                    seat_id += 1
+            return
+
+        start = time.perf_counter()
+        total = 0
+        for airplane in airplanes:
+            try:
+                seats = service.generate(airplane, **cabin)
+            except ProtectedError:
+                self.stderr.write(f"{airplane.model}: tiene reservas sobre sus asientos, se omite")
+                continue
+            total += len(seats)
+            self.stdout.write(f"{airplane.model}: {len(seats)} asientos")
+        self.stdout.write(f"Total: {total} asientos en {time.perf_counter() - start:.3f}s")
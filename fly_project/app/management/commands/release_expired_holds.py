@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from app.services import SeatHoldService
+
+
+class Command(BaseCommand):
+    help = "Libera en lote los bloqueos de asientos vencidos (SeatHold)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Holds liberados por UPDATE")
+        parser.add_argument(
+            '--every', type=int, default=0,
+            help="Repetir el barrido cada N segundos en lugar de ejecutarlo una sola vez"
+        )
+
+    def handle(self, *args, **options):
+        service = SeatHoldService()
+        while True:
+            released = service.release_expired(batch_size=options['batch_size'])
+            metrics = service.metrics()
+            self.stdout.write(
+                f"Holds liberados: {released} - Activos: {metrics['active']} - "
+                f"Creados: {metrics['created']} - Convertidos: {metrics['converted']} - "
+                f"Liberados total: {metrics['released']}"
+            )
+            if not options['every']:
+                return
+            time.sleep(options['every'])
@@ -0,0 +1,164 @@
+import datetime
+import itertools
+import os
+import random
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from app.models import Airplane, Flight, FlightSeatInventory, Seat
+from app.services import ReservaService, SeatHoldService, SeatInventoryService
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark de concurrencia: varios hilos reservan, confirman, cancelan y "
+        "bloquean asientos de un mismo vuelo mientras otro barre los holds. "
+        "Informa operaciones/seg y la deriva del inventario empaquetado y sus "
+        "contadores contra las reservas. Corre sobre una base descartable que "
+        "se borra al terminar"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help="Hilos operando en paralelo")
+        parser.add_argument('--attempts', type=int, default=500, help="Operaciones en total")
+        parser.add_argument('--rows', type=int, default=10, help="Filas del avión de prueba (6 columnas)")
+
+    def handle(self, *args, **options):
+        # La base de prueba es la de los tests: un archivo temporal en SQLite (los hilos
+        # necesitan conexiones propias, así que no alcanza con revertir una transacción)
+        old_name = connection.settings_dict['NAME']
+        with tempfile.TemporaryDirectory() as directory:
+            if connection.vendor == 'sqlite':
+                connection.settings_dict['TEST']['NAME'] = os.path.join(directory, 'stress.sqlite3')
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            try:
+                self.run(options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def run(self, options):
+        airplane, flight, users = self.crear_escenario(options['rows'], options['attempts'])
+        seats = list(Seat.objects.filter(airplane=airplane))
+        # El inventario se crea antes de largar los hilos
+        SeatInventoryService().get_inventory(flight)
+
+        pending_users = iter(users)
+        lock = threading.Lock()
+        done = threading.Event()
+        results = {'booked': 0, 'confirmed': 0, 'canceled': 0, 'held': 0, 'taken': 0, 'errors': 0, 'swept': 0}
+
+        def count(outcome, amount=1):
+            with lock:
+                results[outcome] += amount
+
+        def worker():
+            service = ReservaService()
+            hold_service = SeatHoldService()
+            try:
+                while True:
+                    with lock:
+                        user = next(pending_users, None)
+                    if user is None:
+                        return
+                    seat = random.choice(seats)
+                    try:
+                        if random.random() < 0.4:
+                            count('held' if hold_service.hold(flight, seat, user) else 'taken')
+                            continue
+                        reserva = service.crear_reserva({'flight': flight, 'seat': seat}, user)
+                        count('booked')
+                        action = random.random()
+                        if action < 0.5:
+                            service.cambiar_estado_reserva(reserva, 'confirmed')
+                            count('confirmed')
+                        elif action < 0.7:
+                            service.cambiar_estado_reserva(reserva, 'canceled')
+                            count('canceled')
+                    except ValidationError:
+                        count('taken')
+                    except Exception:
+                        count('errors')
+            finally:
+                connection.close()
+
+        def sweeper():
+            # Todos los holds cuentan como vencidos: se barren mientras los hilos toman asientos
+            hold_service = SeatHoldService()
+            horizon = datetime.timedelta(seconds=settings.SEAT_HOLD_TTL_SECONDS + 1)
+            try:
+                while not done.is_set():
+                    try:
+                        count('swept', hold_service.release_expired(now=timezone.now() + horizon))
+                    except Exception:
+                        count('errors')
+                    time.sleep(0.01)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(options['threads'])]
+        sweeper_thread = threading.Thread(target=sweeper)
+        start = time.perf_counter()
+        sweeper_thread.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        sweeper_thread.join()
+        elapsed = time.perf_counter() - start
+
+        # Con los holds restantes barridos, el inventario tiene que coincidir con las reservas
+        SeatHoldService().release_expired(now=timezone.now() + datetime.timedelta(days=1))
+        inventory = SeatInventoryService().get_inventory(flight)
+        _, expected_status, expected_available = SeatInventoryService().build_seat_status(flight)
+        status_drift = sum(actual != expected for actual, expected in zip(inventory.seat_status, expected_status))
+        counter_drift = {
+            field: getattr(inventory, field) - expected
+            for field, expected in expected_available.items()
+            if getattr(inventory, field) != expected
+        }
+        occupied_positions = sum(
+            code not in (FlightSeatInventory.STATUS_CODES['available'], FlightSeatInventory.NO_SEAT)
+            for code in expected_status
+        )
+
+        self.stdout.write(f"Hilos: {options['threads']} - Operaciones: {len(users)} - Asientos: {len(seats)}")
+        self.stdout.write(f"Tiempo: {elapsed:.3f}s - Operaciones/seg: {len(users) / elapsed:.1f} - Reservas/seg: {results['booked'] / elapsed:.1f}")
+        self.stdout.write(
+            f"Reservas: {results['booked']} (confirmadas {results['confirmed']}, canceladas {results['canceled']}) - "
+            f"Holds: {results['held']} (barridos {results['swept']}) - Asiento tomado: {results['taken']} - Errores: {results['errors']}"
+        )
+        self.stdout.write(f"Asientos tomados según las reservas: {occupied_positions}")
+        self.stdout.write(f"Deriva del inventario (posiciones distintas): {status_drift}")
+        self.stdout.write(f"Deriva de los contadores: {counter_drift or 'ninguna'}")
+
+    def crear_escenario(self, rows, attempts):
+        airplane = Airplane.objects.create(model="Stress", capacity=rows * 6, rows=rows, columns=6)
+        Seat.objects.bulk_create([
+            Seat(airplane=airplane, number=f"{row}{chr(64 + column)}", row=row, column=column, type='economy')
+            for row, column in itertools.product(range(1, rows + 1), range(1, 7))
+        ])
+        departure = timezone.now() + datetime.timedelta(days=30)
+        flight = Flight.objects.create(
+            airplane=airplane,
+            origin='AEP',
+            destination='BRC',
+            departure_time=departure,
+            arrival_time=departure + datetime.timedelta(hours=2),
+            duration=datetime.timedelta(hours=2),
+            base_price=1000,
+        )
+        User.objects.bulk_create([
+            User(username=f"stress-{i}", email=f"stress-{i}@example.com")
+            for i in range(attempts)
+        ])
+        users = list(User.objects.filter(username__startswith="stress-"))
+        return airplane, flight, users
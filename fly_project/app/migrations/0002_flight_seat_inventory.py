@@ -0,0 +1,35 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FlightSeatInventory',
+            fields=[
+                ('flight', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='seat_inventory', serialize=False, to='app.flight')),
+                ('columns', models.PositiveIntegerField()),
+                ('seat_status', models.TextField()),
+            ],
+        ),
+        migrations.RemoveField(
+            model_name='seat',
+            name='status',
+        ),
+        migrations.AlterField(
+            model_name='reservation',
+            name='seat',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='reservations', to='app.seat'),
+        ),
+        migrations.AddConstraint(
+            model_name='reservation',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'canceled'), _negated=True), fields=('flight', 'seat'), name='unique_active_seat_per_flight'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 07:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0003_seat_hold'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='flight',
+            index=models.Index(fields=['origin', 'destination', 'status', 'departure_time'], name='flight_route_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='flight',
+            index=models.Index(fields=['status', 'departure_time'], name='flight_status_departure_idx'),
+        ),
+    ]
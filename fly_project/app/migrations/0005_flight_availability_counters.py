@@ -0,0 +1,46 @@
+# Generated by Django 5.2.3 on 2026-10-18 07:07
+
+from django.db import migrations, models
+
+
+def contar_disponibles(apps, schema_editor):
+    """Inicializa los contadores de los inventarios existentes a partir de su string"""
+    FlightSeatInventory = apps.get_model('app', 'FlightSeatInventory')
+    Seat = apps.get_model('app', 'Seat')
+    for inventory in FlightSeatInventory.objects.select_related('flight'):
+        counts = {'economy': 0, 'premium': 0, 'business': 0}
+        seats = Seat.objects.filter(airplane_id=inventory.flight.airplane_id).values_list('row', 'column', 'type')
+        for row, column, seat_type in seats:
+            position = (row - 1) * inventory.columns + (column - 1)
+            if position < len(inventory.seat_status) and inventory.seat_status[position] == 'A':
+                counts[seat_type] += 1
+        inventory.available_economy = counts['economy']
+        inventory.available_premium = counts['premium']
+        inventory.available_business = counts['business']
+        inventory.save(update_fields=['available_economy', 'available_premium', 'available_business'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_flight_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='flightseatinventory',
+            name='available_business',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='flightseatinventory',
+            name='available_economy',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='flightseatinventory',
+            name='available_premium',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(contar_disponibles, migrations.RunPython.noop),
+    ]
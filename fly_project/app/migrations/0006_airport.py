@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 07:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_flight_availability_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Airport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=3, unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('city', models.CharField(max_length=100)),
+                ('synonyms', models.TextField(blank=True, default='')),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 07:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_airport'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='flight',
+            index=models.Index(fields=['departure_time', 'id'], name='flight_departure_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['passenger', 'reservation_date', 'id'], name='reservation_keyset_idx'),
+        ),
+    ]
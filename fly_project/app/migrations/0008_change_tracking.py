@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:10
+
+from django.db import migrations, models
+import django.db.models.functions.datetime
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='flight',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_default=django.db.models.functions.datetime.Now()),
+        ),
+        migrations.AddField(
+            model_name='seat',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_default=django.db.models.functions.datetime.Now()),
+        ),
+        migrations.AddField(
+            model_name='flightseatinventory',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
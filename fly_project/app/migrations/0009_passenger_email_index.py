@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_change_tracking'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='passenger',
+            name='email',
+            field=models.EmailField(db_index=True, max_length=254),
+        ),
+    ]
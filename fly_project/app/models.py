@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models.functions import Now
 from django.utils import timezone
 
 class Airplane(models.Model):
@@ -27,6 +28,20 @@ class Flight(models.Model):
     status = models.CharField(max_length=20, choices=STATUSES, default="scheduled")
     base_price = models.DecimalField(max_digits=10, decimal_places=2)
     users = models.ManyToManyField(User, related_name="managed_flights", blank=True)
+    # Última modificación: arma los ETag y Last-Modified de la API sin serializar.
+    # db_default cubre los INSERT en SQL crudo (seeds, generate_seat_layouts --sql)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
+
+    class Meta:
+        indexes = [
+            # Filtros exactos por ruta y fecha (?origin=&destination= de la API): igualdades primero,
+            # rango al final. La búsqueda de HomeView compara sin mayúsculas y usa el índice de abajo
+            models.Index(fields=["origin", "destination", "status", "departure_time"], name="flight_route_search_idx"),
+            # Ofertas: vuelos programados en un rango de salida, ordenados por salida
+            models.Index(fields=["status", "departure_time"], name="flight_status_departure_idx"),
+            # Paginación por cursor de la API: orden por salida y id
+            models.Index(fields=["departure_time", "id"], name="flight_departure_keyset_idx"),
+        ]
 
     def __str__(self):
         return f"Flight {self.id} - {self.origin} to {self.destination}"
@@ -40,7 +55,8 @@ class Passenger(models.Model):
     name = models.CharField(max_length=100)
     document = models.CharField(max_length=30, unique=True)
     document_type = models.CharField(max_length=20, choices=DOCUMENT_TYPES)
-    email = models.EmailField()
+    # Las reservas de la API se filtran por el email del usuario
+    email = models.EmailField(db_index=True)
     phone = models.CharField(max_length=30)
     birth_date = models.DateField()
 
@@ -53,17 +69,17 @@ class Seat(models.Model):
         ("premium", "Premium"),
         ("business", "Business"),
     ]
-    SEAT_STATUSES = [
-        ("available", "Available"),
-        ("reserved", "Reserved"),
-        ("occupied", "Occupied"),
-    ]
+    TYPE_CODES = {
+        "economy": "E",
+        "premium": "P",
+        "business": "B",
+    }
     airplane = models.ForeignKey(Airplane, on_delete=models.CASCADE, related_name="seats")
     number = models.CharField(max_length=10)
     row = models.PositiveIntegerField()
     column = models.PositiveIntegerField()
     type = models.CharField(max_length=20, choices=SEAT_TYPES)
-    status = models.CharField(max_length=20, choices=SEAT_STATUSES, default="available")
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     class Meta:
         unique_together = ("airplane", "number")
@@ -79,7 +95,7 @@ class Reservation(models.Model):
     ]
     flight = models.ForeignKey(Flight, on_delete=models.CASCADE, related_name="reservations")
     passenger = models.ForeignKey(Passenger, on_delete=models.CASCADE, related_name="reservations")
-    seat = models.OneToOneField(Seat, on_delete=models.PROTECT, related_name="reservation")
+    seat = models.ForeignKey(Seat, on_delete=models.PROTECT, related_name="reservations")
     status = models.CharField(max_length=20, choices=STATUS_OPTIONS, default="pending")
     reservation_date = models.DateTimeField(auto_now_add=True)
     price = models.DecimalField(max_digits=10, decimal_places=2)
@@ -87,10 +103,80 @@ class Reservation(models.Model):
 
     class Meta:
         unique_together = ("flight", "passenger")
+        indexes = [
+            # Reservas de cada pasajero del usuario desde el cursor; el orden final
+            # (reservation_date, id) se arma sobre esas pocas filas, no sobre la tabla
+            models.Index(fields=["passenger", "reservation_date", "id"], name="reservation_keyset_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["flight", "seat"],
+                condition=~models.Q(status="canceled"),
+                name="unique_active_seat_per_flight",
+            ),
+        ]
 
     def __str__(self):
         return f"Reservation {self.reservation_code} - Flight {self.flight.id} - {self.passenger.name}"
 
+class FlightSeatInventory(models.Model):
+    """
+    Disponibilidad de asientos de un vuelo, empaquetada en un string con un
+    caracter por posicion de la cabina (fila por fila). Una sola fila alcanza
+    para conocer el estado de todo el avion en ese vuelo.
+    """
+    STATUS_CODES = {
+        "available": "A",
+        "reserved": "R",
+        "occupied": "O",
+    }
+    STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+    NO_SEAT = "-"
+    AVAILABLE_FIELDS = {
+        "economy": "available_economy",
+        "premium": "available_premium",
+        "business": "available_business",
+    }
+
+    flight = models.OneToOneField(Flight, on_delete=models.CASCADE, primary_key=True, related_name="seat_inventory")
+    columns = models.PositiveIntegerField()
+    seat_status = models.TextField()
+    # Asientos libres por clase, mantenidos junto con seat_status
+    available_economy = models.PositiveIntegerField(default=0)
+    available_premium = models.PositiveIntegerField(default=0)
+    available_business = models.PositiveIntegerField(default=0)
+    # Sube con cada UPDATE de seat_status: versiona el mapa de asientos del vuelo
+    version = models.PositiveIntegerField(default=1)
+
+    def position(self, row, column):
+        return (row - 1) * self.columns + (column - 1)
+
+    def status_of(self, seat):
+        position = self.position(seat.row, seat.column)
+        if position >= len(self.seat_status):
+            return None
+        return self.STATUS_NAMES.get(self.seat_status[position])
+
+    def __str__(self):
+        return f"Inventory - Flight {self.flight_id}"
+
+class SeatHold(models.Model):
+    """
+    Bloqueo temporal de un asiento mientras el usuario confirma la compra.
+    Si vence sin confirmarse, el barrido de holds libera el asiento.
+    """
+    flight = models.ForeignKey(Flight, on_delete=models.CASCADE, related_name="seat_holds")
+    seat = models.ForeignKey(Seat, on_delete=models.CASCADE, related_name="holds")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="seat_holds")
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        unique_together = ("flight", "seat")
+
+    def __str__(self):
+        return f"Hold {self.seat.number} - Flight {self.flight_id} - {self.user.username}"
+
 class Ticket(models.Model):
     STATUS_OPTIONS = [
         ("issued", "Issued"),
@@ -104,6 +190,19 @@ class Ticket(models.Model):
     def __str__(self):
         return f"Ticket {self.barcode} - Reservation {self.reservation.reservation_code}"
 
+class Airport(models.Model):
+    code = models.CharField(max_length=3, unique=True)
+    name = models.CharField(max_length=100)
+    city = models.CharField(max_length=100)
+    # Otros nombres con los que se busca el aeropuerto, separados por coma
+    synonyms = models.TextField(blank=True, default="")
+
+    def synonym_list(self):
+        return [synonym.strip() for synonym in self.synonyms.split(",") if synonym.strip()]
+
+    def __str__(self):
+        return f"{self.code} - {self.name}"
+
 class Destination(models.Model):
     name = models.CharField(max_length=100)
 
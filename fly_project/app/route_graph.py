@@ -0,0 +1,137 @@
+import bisect
+import datetime
+import threading
+import time
+from collections import namedtuple
+
+from django.utils import timezone
+
+from .models import Flight
+
+Leg = namedtuple('Leg', 'id origin destination departure_time arrival_time base_price')
+
+
+class RouteGraph:
+    """
+    Grafo en memoria de los vuelos programados a futuro: por aeropuerto de
+    origen, la lista de salidas ordenada por horario. Las conexiones se
+    buscan con bisect sobre esas listas, sin self-joins en la base. Se
+    actualiza vuelo por vuelo desde las señales de Flight y se reconstruye
+    entero cada MAX_AGE segundos para tomar los cambios hechos en otros
+    procesos o con bulk_create/update (que no disparan señales)
+    """
+    MAX_AGE = 5 * 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built_at = None
+        self._legs = {}
+        self._departures = {}
+
+    @staticmethod
+    def airport(code):
+        # origin/destination son texto libre: se comparan normalizados
+        return (code or '').strip().upper()
+
+    @classmethod
+    def leg(cls, flight):
+        return Leg(
+            flight.id, cls.airport(flight.origin), cls.airport(flight.destination),
+            flight.departure_time, flight.arrival_time, flight.base_price,
+        )
+
+    def build(self):
+        legs = {}
+        departures = {}
+        flights = Flight.objects.filter(status='scheduled', departure_time__gte=timezone.now()).only(
+            'id', 'origin', 'destination', 'departure_time', 'arrival_time', 'base_price'
+        )
+        for flight in flights.iterator(chunk_size=2000):
+            leg = self.leg(flight)
+            legs[leg.id] = leg
+            departures.setdefault(leg.origin, []).append((leg.departure_time, leg.id))
+        for airport_departures in departures.values():
+            airport_departures.sort()
+
+        with self._lock:
+            self._legs = legs
+            self._departures = departures
+            self._built_at = time.monotonic()
+
+    def ensure_built(self):
+        if self._built_at is None or time.monotonic() - self._built_at > self.MAX_AGE:
+            self.build()
+
+    def invalidate(self):
+        with self._lock:
+            self._built_at = None
+
+    def update_flight(self, flight):
+        """Refleja el alta, cambio o cancelación de un vuelo sin reconstruir el grafo"""
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._remove(flight.id)
+            if flight.status == 'scheduled' and flight.departure_time >= timezone.now():
+                leg = self.leg(flight)
+                self._legs[leg.id] = leg
+                bisect.insort(self._departures.setdefault(leg.origin, []), (leg.departure_time, leg.id))
+
+    def remove_flight(self, flight_id):
+        with self._lock:
+            if self._built_at is not None:
+                self._remove(flight_id)
+
+    def _remove(self, flight_id):
+        leg = self._legs.pop(flight_id, None)
+        if leg is None:
+            return
+        airport_departures = self._departures[leg.origin]
+        position = bisect.bisect_left(airport_departures, (leg.departure_time, leg.id))
+        if position < len(airport_departures) and airport_departures[position][1] == leg.id:
+            del airport_departures[position]
+
+    def departures(self, airport, start, end):
+        """Tramos que salen del aeropuerto en [start, end), por horario"""
+        airport_departures = self._departures.get(airport, [])
+        first = bisect.bisect_left(airport_departures, (start, 0))
+        last = bisect.bisect_left(airport_departures, (end, 0))
+        return [self._legs[flight_id] for _, flight_id in airport_departures[first:last]]
+
+    def connections(self, origin, destination, start, end, max_stops=2,
+                    min_connection=datetime.timedelta(minutes=45), max_connection=datetime.timedelta(hours=12)):
+        """
+        Itinerarios de 1 a max_stops escalas que salen de origin en
+        [start, end) y llegan a destination. Cada tramo siguiente sale entre
+        min_connection y max_connection después de la llegada del anterior y
+        no se repiten aeropuertos. Devuelve listas de Leg
+        """
+        self.ensure_built()
+        origin, destination = self.airport(origin), self.airport(destination)
+        itineraries = []
+
+        def extend(path, visited):
+            last = path[-1]
+            if last.destination == destination:
+                if len(path) > 1:
+                    itineraries.append(list(path))
+                return
+            if len(path) > max_stops:
+                return
+            for leg in self.departures(last.destination, last.arrival_time + min_connection,
+                                       last.arrival_time + max_connection):
+                if leg.destination not in visited:
+                    path.append(leg)
+                    visited.add(leg.destination)
+                    extend(path, visited)
+                    visited.discard(leg.destination)
+                    path.pop()
+
+        with self._lock:
+            for first in self.departures(origin, start, end):
+                if first.destination != destination:
+                    extend([first], {origin, first.destination})
+        return itineraries
+
+
+route_graph = RouteGraph()
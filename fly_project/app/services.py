@@ -1,14 +1,724 @@
+import hashlib
+import string
 import uuid
 from rest_framework.exceptions import ValidationError
-from .models import Flight, Reservation, Ticket, Seat
+import datetime
+import heapq
+import itertools
+import random
+from decimal import Decimal
+from .broadcast import seat_status_broadcaster
+from .caching import versioned_cache
+from .route_graph import route_graph
+from .models import Destination, DestinationImage, Flight, FlightSeatInventory, Passenger, Reservation, SeatHold, Ticket, Seat
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, Min, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Concat, Substr, TruncDate
+from django.db.models.lookups import Exact, In
 from django.utils import timezone
 
+class SeatInventoryService:
+    def build_seat_status(self, flight, seats=None, reservas=None):
+        """
+        Arma el inventario de un vuelo a partir de los asientos del avión y de
+        sus reservas activas, que pueden venir ya cargadas. Devuelve
+        (columnas, string de estados, libres por clase)
+        """
+        airplane = flight.airplane
+        if seats is None:
+            seats = list(Seat.objects.filter(airplane_id=airplane.id).values_list('id', 'row', 'column', 'type'))
+        rows = max([airplane.rows] + [row for _, row, _, _ in seats])
+        columns = max([airplane.columns] + [column for _, _, column, _ in seats])
+
+        codes = FlightSeatInventory.STATUS_CODES
+        seat_status = [FlightSeatInventory.NO_SEAT] * (rows * columns)
+        positions = {}
+        for seat_id, row, column, _ in seats:
+            positions[seat_id] = (row - 1) * columns + (column - 1)
+            seat_status[positions[seat_id]] = codes['available']
+
+        # Las reservas pendientes bloquean el asiento, las confirmadas lo ocupan
+        if reservas is None:
+            reservas = self.occupancy([flight])[flight.pk]
+        for seat_id, estado in reservas:
+            if seat_id in positions:
+                seat_status[positions[seat_id]] = codes['occupied' if estado == 'confirmed' else 'reserved']
+
+        available = dict.fromkeys(FlightSeatInventory.AVAILABLE_FIELDS.values(), 0)
+        for seat_id, _, _, seat_type in seats:
+            if seat_status[positions[seat_id]] == codes['available']:
+                available[FlightSeatInventory.AVAILABLE_FIELDS[seat_type]] += 1
+
+        return columns, ''.join(seat_status), available
+
+    def get_inventory(self, flight):
+        """
+        Obtiene el inventario del vuelo, creándolo la primera vez que se pide
+        """
+        try:
+            return FlightSeatInventory.objects.get(flight=flight)
+        except FlightSeatInventory.DoesNotExist:
+            columns, seat_status, available = self.build_seat_status(flight)
+            inventory, _ = FlightSeatInventory.objects.get_or_create(
+                flight=flight,
+                defaults={'columns': columns, 'seat_status': seat_status, **available}
+            )
+            return inventory
+
+    def occupancy(self, flights):
+        """(asiento, estado) de las reservas activas de cada vuelo"""
+        reservas = {flight.pk: [] for flight in flights}
+        for flight_id, seat_id, estado in Reservation.objects.filter(flight__in=flights).exclude(
+            status='canceled'
+        ).values_list('flight_id', 'seat_id', 'status'):
+            reservas[flight_id].append((seat_id, estado))
+        return reservas
+
+    def layout_seats(self, flights):
+        """Asientos (id, fila, columna, tipo) del avión de cada vuelo, por avión"""
+        seats = {}
+        for airplane_id, *seat in Seat.objects.filter(
+            airplane_id__in={flight.airplane_id for flight in flights}
+        ).values_list('airplane_id', 'id', 'row', 'column', 'type'):
+            seats.setdefault(airplane_id, []).append(tuple(seat))
+        return seats
+
+    def ensure_inventories(self, flights):
+        """
+        Crea los inventarios que falten para estos vuelos (los que nunca se
+        consultaron), para que los contadores de disponibilidad estén al día.
+        Los asientos y reservas de todos se leen de una vez
+        """
+        missing = list(flights.filter(seat_inventory__isnull=True).select_related('airplane'))
+        if not missing:
+            return
+
+        seats = self.layout_seats(missing)
+        reservas = self.occupancy(missing)
+        inventories = []
+        for flight in missing:
+            columns, seat_status, available = self.build_seat_status(
+                flight, seats.get(flight.airplane_id, []), reservas[flight.pk]
+            )
+            inventories.append(FlightSeatInventory(flight=flight, columns=columns, seat_status=seat_status, **available))
+        # Otro pedido pudo crearlos en paralelo: ese inventario gana
+        FlightSeatInventory.objects.bulk_create(inventories, ignore_conflicts=True)
+
+    def rebuild_inventories(self, flights):
+        """
+        Rearma los inventarios ya creados de estos vuelos con los asientos
+        actuales de su avión: después de un alta, baja o cambio de asiento, o
+        de un cambio de avión del vuelo. Los holds sobre asientos de otro
+        avión se descartan. La versión sigue subiendo, así que los mapas y
+        ETags anteriores quedan viejos
+        """
+        with transaction.atomic():
+            inventories = list(
+                FlightSeatInventory.objects.select_for_update(of=('self',))
+                .filter(flight__in=flights).select_related('flight__airplane')
+            )
+            if not inventories:
+                return
+            rebuilt = [inventory.flight for inventory in inventories]
+            SeatHold.objects.filter(flight__in=rebuilt).exclude(seat__airplane=F('flight__airplane')).delete()
+
+            seats = self.layout_seats(rebuilt)
+            reservas = self.occupancy(rebuilt)
+            # Un hold vigente bloquea el asiento como una reserva pendiente. Un vuelo
+            # sin inventario no tiene holds: hold() toma el asiento en el inventario
+            for flight_id, seat_id in SeatHold.objects.filter(
+                flight__in=rebuilt, expires_at__gt=timezone.now()
+            ).values_list('flight_id', 'seat_id'):
+                reservas[flight_id].append((seat_id, 'pending'))
+            for inventory in inventories:
+                flight = inventory.flight
+                inventory.columns, inventory.seat_status, available = self.build_seat_status(
+                    flight, seats.get(flight.airplane_id, []), reservas[flight.pk]
+                )
+                for field, value in available.items():
+                    setattr(inventory, field, value)
+                inventory.version = F('version') + 1
+            FlightSeatInventory.objects.bulk_update(
+                inventories, ['columns', 'seat_status', 'version', *FlightSeatInventory.AVAILABLE_FIELDS.values()]
+            )
+
+            flight_ids = [flight.pk for flight in rebuilt]
+            SeatMapService().invalidate_on_commit(flight_ids)
+            FlightSearchService().invalidate_flights_on_commit(flight_ids)
+            versioned_cache.bump_on_commit('availability')
+
+    def status_of(self, flight, seat):
+        """
+        Estado del asiento en este vuelo: available, reserved u occupied
+        """
+        return self.get_inventory(flight).status_of(seat)
+
+    def _update_seats(self, flight, seats, status, from_statuses=None):
+        """
+        Reescribe las posiciones de los asientos con un único UPDATE sobre el
+        string del vuelo. Si se indican from_statuses, el UPDATE sólo aplica
+        cuando todos los asientos siguen en alguno de esos estados
+        """
+        codes = FlightSeatInventory.STATUS_CODES
+        inventory = self.get_inventory(flight)
+        seat_types = {inventory.position(seat.row, seat.column): seat.type for seat in seats}
+        changes = dict.fromkeys(seat_types, codes[status])
+        if not changes:
+            return True
+
+        # El string nuevo se arma por tramos del original, ordenados por
+        # posición, para que la expresión crezca linealmente con los asientos.
+        # Cada asiento suma al contador de su clase si pasa a libre y resta si
+        # estaba libre, según el string previo al UPDATE
+        conditions = []
+        parts = []
+        counters = {}
+        start = 1
+        for index in sorted(changes):
+            # SUBSTR es 1-based
+            position = index + 1
+            if from_statuses is not None:
+                conditions.append(In(Substr('seat_status', position, 1), [codes[s] for s in from_statuses]))
+            if position > start:
+                parts.append(Substr('seat_status', start, position - start))
+            parts.append(Value(changes[index]))
+            start = position + 1
+
+            field = FlightSeatInventory.AVAILABLE_FIELDS[seat_types[index]]
+            was_available = Case(
+                When(Exact(Substr('seat_status', position, 1), codes['available']), then=Value(1)),
+                default=Value(0),
+            )
+            delta = Value(1) - was_available if status == 'available' else -was_available
+            counters[field] = counters.get(field, F(field)) + delta
+        parts.append(Substr('seat_status', start))
+
+        # Los contadores van antes que seat_status en el SET: todos leen el estado previo
+        updated = FlightSeatInventory.objects.filter(*conditions, flight_id=flight.pk).update(
+            **counters, seat_status=Concat(*parts), version=F('version') + 1
+        ) == 1
+        if updated:
+            SeatMapService().invalidate_on_commit([flight.pk])
+            self.publish_on_commit(flight.pk, changes)
+        return updated
+
+    def publish_on_commit(self, flight_id, changes):
+        """
+        Avisa los cambios {posición: código} del vuelo, recién cuando la
+        transacción se confirma: actualiza el índice de tramos libres, borra
+        las búsquedas cacheadas que lo incluyen, sube la versión de
+        disponibilidad (calendarios de tarifas) y los difunde a los clientes
+        conectados. Todo claim, liberación o barrido de holds pasa por acá
+        """
+        event = {'flight': flight_id, 'seats': changes}
+
+        def notify():
+            SeatRecommendationService().apply_changes(flight_id, changes)
+            FlightSearchService().invalidate_flights([flight_id])
+            versioned_cache.bump('availability')
+            seat_status_broadcaster.publish(flight_id, event)
+
+        transaction.on_commit(notify)
+
+    def claim(self, flight, seats, status, from_statuses=('available',)):
+        """
+        Toma los asientos para el vuelo de forma atómica: devuelve False si
+        alguno ya no está en from_statuses (otro usuario lo ganó)
+        """
+        return self._update_seats(flight, seats, status, from_statuses)
+
+    def set_status(self, flight, seats, status):
+        """
+        Cambia el estado de uno o más asientos dentro del inventario del vuelo
+        """
+        self._update_seats(flight, seats, status)
+
+
+class SeatMapService:
+    CACHE_TIMEOUT = 5 * 60
+
+    def cache_key(self, flight_id):
+        return f"seat_map:flight:{flight_id}"
+
+    def build_seat_map(self, flight, inventory=None):
+        """
+        Mapa compacto del vuelo: un código de tipo y uno de estado por
+        posición de la cabina, los ids de asiento y las dimensiones. version
+        cambia con cada cambio de estado y con cada cambio de los asientos
+        del avión: alcanza para el ETag del mapa
+        """
+        if inventory is None:
+            inventory = SeatInventoryService().get_inventory(flight)
+        size = len(inventory.seat_status)
+        types = [FlightSeatInventory.NO_SEAT] * size
+        ids = [None] * size
+        seats = list(Seat.objects.filter(airplane_id=flight.airplane_id).values_list(
+            'id', 'row', 'column', 'type', 'updated_at'
+        ))
+        for seat_id, row, column, seat_type, _ in seats:
+            position = inventory.position(row, column)
+            types[position] = Seat.TYPE_CODES[seat_type]
+            ids[position] = seat_id
+        layout_updated_at = max((updated_at for *_, updated_at in seats), default=None)
+        return {
+            'flight': flight.pk,
+            'rows': size // inventory.columns,
+            'columns': inventory.columns,
+            'types': ''.join(types),
+            'status': inventory.seat_status,
+            'ids': ids,
+            'version': SeatLayoutService.layout_version(len(seats), layout_updated_at, inventory.version),
+        }
+
+    def get_seat_map(self, flight):
+        """
+        Mapa compacto del vuelo, servido desde la caché mientras la versión
+        del inventario sea la misma con la que se armó. La versión se lee de
+        la base en cada pedido (una consulta por clave primaria) y sube con
+        cada cambio de estado y cada rearmado del layout, así que un worker
+        no sirve un mapa viejo aunque la invalidación no le haya llegado
+        (locmem es por proceso)
+        """
+        key = self.cache_key(flight.pk)
+        version = FlightSeatInventory.objects.filter(flight_id=flight.pk).values_list('version', flat=True).first()
+        entry = cache.get(key)
+        if entry is None or version is None or entry[0] != version:
+            inventory = SeatInventoryService().get_inventory(flight)
+            entry = (inventory.version, self.build_seat_map(flight, inventory))
+            cache.set(key, entry, self.CACHE_TIMEOUT)
+        return entry[1]
+
+    def invalidate(self, flight_ids):
+        cache.delete_many([self.cache_key(flight_id) for flight_id in flight_ids])
+
+    def invalidate_on_commit(self, flight_ids):
+        """
+        Invalida recién al confirmar la transacción, para que ningún lector
+        vuelva a cachear el estado anterior mientras tanto
+        """
+        flight_ids = list(flight_ids)
+        transaction.on_commit(lambda: self.invalidate(flight_ids))
+
+
+class SeatRecommendationService:
+    """
+    Sugiere bloques de asientos contiguos libres para grupos. Trabaja sobre un
+    índice por vuelo de tramos libres por fila y clase, cacheado junto con el
+    string de estados del que sale: cuando un asiento cambia sólo se
+    recalcula su fila
+    """
+    CACHE_TIMEOUT = SeatMapService.CACHE_TIMEOUT
+
+    def cache_key(self, flight_id):
+        return f"seat_runs:flight:{flight_id}"
+
+    def row_runs(self, types, status, columns, row):
+        """
+        Tramos libres de la fila (0-based) como (tipo, columna inicial, largo).
+        Un pasillo, un asiento tomado o un cambio de clase cortan el tramo
+        """
+        available = FlightSeatInventory.STATUS_CODES['available']
+        offset = row * columns
+        runs = []
+        start = None
+        for column in range(columns + 1):
+            position = offset + column
+            free = column < columns and status[position] == available
+            if start is not None and (not free or types[position] != types[offset + start]):
+                runs.append((types[offset + start], start + 1, column - start))
+                start = None
+            if free and start is None:
+                start = column
+        return runs
+
+    def build_index(self, seat_map):
+        types, status, columns = seat_map['types'], seat_map['status'], seat_map['columns']
+        return {
+            'types': types,
+            'status': status,
+            'columns': columns,
+            'runs': [self.row_runs(types, status, columns, row) for row in range(seat_map['rows'])],
+        }
+
+    def refresh_rows(self, index, status, rows):
+        index['status'] = status
+        for row in rows:
+            index['runs'][row] = self.row_runs(index['types'], status, index['columns'], row)
+
+    def get_index(self, flight):
+        """
+        Índice de tramos libres del vuelo. Se concilia con el mapa cacheado:
+        si algún cambio no llegó a aplicarse, sólo se recalculan las filas
+        cuyo estado difiere
+        """
+        seat_map = SeatMapService().get_seat_map(flight)
+        key = self.cache_key(flight.pk)
+        index = cache.get(key)
+        if index is None or index['types'] != seat_map['types'] or index['columns'] != seat_map['columns']:
+            index = self.build_index(seat_map)
+            cache.set(key, index, self.CACHE_TIMEOUT)
+        elif index['status'] != seat_map['status']:
+            columns = index['columns']
+            stale = [
+                row for row in range(seat_map['rows'])
+                if index['status'][row * columns:(row + 1) * columns] != seat_map['status'][row * columns:(row + 1) * columns]
+            ]
+            self.refresh_rows(index, seat_map['status'], stale)
+            cache.set(key, index, self.CACHE_TIMEOUT)
+        return index, seat_map
+
+    def apply_changes(self, flight_id, changes):
+        """
+        Aplica al índice cacheado los cambios {posición: código} de un claim o
+        una liberación, recalculando sólo las filas tocadas
+        """
+        key = self.cache_key(flight_id)
+        index = cache.get(key)
+        if index is None:
+            return
+        status = list(index['status'])
+        for position, code in changes.items():
+            status[position] = code
+        self.refresh_rows(index, ''.join(status), {position // index['columns'] for position in changes})
+        cache.set(key, index, self.CACHE_TIMEOUT)
+
+    def suggest(self, flight, count, seat_type='economy'):
+        """
+        Mejor bloque de count asientos libres de la clase: primero un tramo de
+        una misma fila (el más ajustado de la fila más adelante), si no, los
+        tramos libres de adelante hacia atrás. Devuelve (asientos, contiguos)
+        o None si no quedan suficientes asientos de la clase
+        """
+        index, seat_map = self.get_index(flight)
+        code = Seat.TYPE_CODES[seat_type]
+        columns = index['columns']
+
+        for row, runs in enumerate(index['runs']):
+            fitting = [(length, start) for run_type, start, length in runs if run_type == code and length >= count]
+            if fitting:
+                _, start = min(fitting)
+                positions = [row * columns + start - 1 + offset for offset in range(count)]
+                return self.seats_at(seat_map, positions), True
+
+        positions = []
+        for row, runs in enumerate(index['runs']):
+            for run_type, start, length in runs:
+                if run_type != code:
+                    continue
+                take = min(length, count - len(positions))
+                positions.extend(row * columns + start - 1 + offset for offset in range(take))
+                if len(positions) == count:
+                    return self.seats_at(seat_map, positions), False
+        return None
+
+    def seats_at(self, seat_map, positions):
+        ids = [seat_map['ids'][position] for position in positions]
+        seats = Seat.objects.in_bulk(ids)
+        return [seats[seat_id] for seat_id in ids]
+
+
+class SeatLayoutService:
+    """
+    Genera el layout de asientos de un avión a partir de una definición de
+    cabina: filas business y premium, columnas de pasillo y asientos
+    bloqueados. El resto de las filas toma el tipo por defecto
+    """
+    DEFAULT_CABIN = {
+        'business_rows': '1-3',
+        'premium_rows': '4-8',
+        'aisle_columns': '',
+        'blocked_seats': '',
+        'default_type': 'economy',
+    }
+
+    def parse_numbers(self, value):
+        """
+        Convierte "1-3, 7" en {1, 2, 3, 7}. Lanza ValueError si el texto no
+        es una lista de números o rangos válida
+        """
+        numbers = set()
+        for part in (value or '').replace(' ', '').split(','):
+            if not part:
+                continue
+            start, _, end = part.partition('-')
+            start, end = int(start), int(end or start)
+            if start < 1 or end < start:
+                raise ValueError(f"Rango inválido: {part}")
+            numbers.update(range(start, end + 1))
+        return numbers
+
+    def parse_seats(self, value):
+        """Convierte "1B, 12c" en {"1B", "12C"}"""
+        return {part.strip().upper() for part in (value or '').split(',') if part.strip()}
+
+    def build_seats(self, airplane, business_rows=(), premium_rows=(), aisle_columns=(),
+                    blocked_seats=(), default_type='economy'):
+        """Devuelve los asientos del avión sin guardar, en orden de fila y columna"""
+        seats = []
+        for row in range(1, airplane.rows + 1):
+            if row in business_rows:
+                seat_type = 'business'
+            elif row in premium_rows:
+                seat_type = 'premium'
+            else:
+                seat_type = default_type
+            for column in range(1, airplane.columns + 1):
+                number = f"{row}{chr(64 + column)}"
+                if column in aisle_columns or number in blocked_seats:
+                    continue
+                seats.append(Seat(airplane=airplane, number=number, row=row, column=column, type=seat_type))
+        return seats
+
+    @staticmethod
+    def run_length(grid):
+        """'BBBB--EE' -> '4B2-2E'"""
+        return ''.join(f"{len(list(group))}{code}" for code, group in itertools.groupby(grid))
+
+    def compact_layouts(self, airplanes, with_ids=False):
+        """
+        Layout compacto de cada avión, armado con un solo values_list de sus
+        asientos: dimensiones y los tipos de la cabina fila por fila en
+        run-length ('18B30P132E'; '-' es un lugar sin asiento). Con with_ids
+        agrega el id de asiento de cada posición
+        """
+        airplanes = list(airplanes)
+        seats = {airplane.pk: [] for airplane in airplanes}
+        for airplane_id, *seat in Seat.objects.filter(airplane_id__in=seats).values_list(
+            'airplane_id', 'id', 'row', 'column', 'type'
+        ):
+            seats[airplane_id].append(seat)
+
+        layouts = []
+        for airplane in airplanes:
+            # Las mismas dimensiones que el inventario de sus vuelos
+            rows = max([airplane.rows] + [row for _, row, _, _ in seats[airplane.pk]])
+            columns = max([airplane.columns] + [column for _, _, column, _ in seats[airplane.pk]])
+            types = [FlightSeatInventory.NO_SEAT] * (rows * columns)
+            ids = [None] * (rows * columns)
+            for seat_id, row, column, seat_type in seats[airplane.pk]:
+                position = (row - 1) * columns + (column - 1)
+                types[position] = Seat.TYPE_CODES[seat_type]
+                ids[position] = seat_id
+            layout = {
+                'id': airplane.pk,
+                'model': airplane.model,
+                'capacity': airplane.capacity,
+                'rows': rows,
+                'columns': columns,
+                'types': self.run_length(types),
+            }
+            if with_ids:
+                layout['ids'] = ids
+            layouts.append(layout)
+        return layouts
+
+    @staticmethod
+    def layout_version(seat_count, updated_at, inventory_version=None):
+        """
+        Versión de los asientos de un avión: cuántos son y el último cambio
+        (un alta o un borrado cambia la cantidad). Con inventory_version
+        también cubre el estado de los asientos en un vuelo
+        """
+        version = f"{seat_count}.{updated_at.timestamp() if updated_at else 0}"
+        return version if inventory_version is None else f"{version}.{inventory_version}"
+
+    def current_version(self, airplane, flight=None):
+        """
+        layout_version leída de la base con un aggregate sobre los asientos
+        y, si se pasa un vuelo, la versión de su inventario: no arma el layout
+        """
+        stats = Seat.objects.filter(airplane=airplane).aggregate(count=Count('id'), updated_at=Max('updated_at'))
+        inventory_version = None
+        if flight is not None:
+            inventory_version = SeatInventoryService().get_inventory(flight).version
+        return self.layout_version(stats['count'], stats['updated_at'], inventory_version)
+
+    def compact_layout(self, airplane, flight=None):
+        """
+        Layout compacto de un avión con los ids de sus asientos y, si se pasa
+        un vuelo, el estado de cada posición en ese vuelo, también en run-length
+        """
+        layout = self.compact_layouts([airplane], with_ids=True)[0]
+        if flight is not None:
+            layout['flight'] = flight.pk
+            layout['status'] = self.run_length(SeatInventoryService().get_inventory(flight).seat_status)
+        return layout
+
+    def generate(self, airplane, **cabin):
+        """
+        Reemplaza los asientos del avión en una sola transacción: un DELETE y
+        un bulk_create. Los inventarios de sus vuelos se rearman con el nuevo
+        layout, lo que sube su versión e invalida mapas y búsquedas al confirmar
+        """
+        seats = self.build_seats(airplane, **cabin)
+        with transaction.atomic():
+            Seat.objects.filter(airplane=airplane).delete()
+            Seat.objects.bulk_create(seats, batch_size=500)
+            SeatInventoryService().rebuild_inventories(Flight.objects.filter(airplane=airplane))
+        return seats
+
+
+class SeatHoldService:
+    COUNTER_KEYS = {
+        'created': 'seat_holds:created',
+        'converted': 'seat_holds:converted',
+        'released': 'seat_holds:released',
+    }
+
+    def __init__(self):
+        self.inventory_service = SeatInventoryService()
+
+    def _count(self, name, amount=1):
+        key = self.COUNTER_KEYS[name]
+        cache.add(key, 0, None)
+        cache.incr(key, amount)
+
+    def hold(self, flight, seat, user):
+        """
+        Bloquea el asiento para el usuario hasta que venza el TTL. Los holds
+        anteriores del usuario en el mismo vuelo se liberan. Devuelve None si
+        el asiento ya no está disponible
+        """
+        expires_at = timezone.now() + datetime.timedelta(seconds=settings.SEAT_HOLD_TTL_SECONDS)
+        with transaction.atomic():
+            # Volver a elegir el mismo asiento sólo renueva el vencimiento
+            if SeatHold.objects.filter(flight=flight, seat=seat, user=user).update(expires_at=expires_at):
+                return self.get_hold(flight, seat, user)
+            if not self.inventory_service.claim(flight, [seat], 'reserved'):
+                return None
+            previous = list(SeatHold.objects.filter(flight=flight, user=user).select_related('seat'))
+            # Cada asiento se libera por separado: si uno cambió de estado, los
+            # demás no quedan reservados sin un hold que los barra
+            for previous_hold in previous:
+                self.inventory_service.claim(flight, [previous_hold.seat], 'available', from_statuses=('reserved',))
+            if previous:
+                SeatHold.objects.filter(id__in=[h.id for h in previous]).delete()
+            hold = SeatHold.objects.create(flight=flight, seat=seat, user=user, expires_at=expires_at)
+        self._count('created')
+        return hold
+
+    def get_hold(self, flight, seat, user):
+        """Hold vigente del usuario sobre el asiento; uno vencido y sin barrer no cuenta"""
+        return SeatHold.objects.filter(flight=flight, seat=seat, user=user, expires_at__gt=timezone.now()).first()
+
+    def convert(self, flight, seat, user):
+        """
+        El hold se transforma en reserva: se borra sin liberar el asiento.
+        Se llama dentro de la transacción que toma el asiento y devuelve
+        True sólo si el usuario todavía tenía un hold vigente sobre él; si
+        venció, lo barrieron o ya es de otro, el asiento sólo puede tomarse
+        si está libre
+        """
+        converted = SeatHold.objects.filter(
+            flight=flight, seat=seat, user=user, expires_at__gt=timezone.now()
+        ).delete()[0] == 1
+        if converted:
+            transaction.on_commit(lambda: self._count('converted'))
+        return converted
+
+    def release_expired(self, now=None, batch_size=500):
+        """
+        Libera en lote los holds vencidos: por cada lote, un UPDATE sobre los
+        inventarios afectados y un DELETE de los holds. Devuelve cuántos liberó
+        """
+        now = now or timezone.now()
+        codes = FlightSeatInventory.STATUS_CODES
+        released = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    SeatHold.objects.select_for_update()
+                    .filter(expires_at__lte=now)
+                    .order_by('expires_at')
+                    .values_list('id', 'flight_id', 'seat__row', 'seat__column', 'seat__type')[:batch_size]
+                )
+                if not batch:
+                    break
+
+                inventories = {
+                    inventory.flight_id: inventory
+                    for inventory in FlightSeatInventory.objects.select_for_update().filter(
+                        flight_id__in={hold[1] for hold in batch}
+                    )
+                }
+                seat_status = {flight_id: list(inv.seat_status) for flight_id, inv in inventories.items()}
+                changes = {flight_id: {} for flight_id in inventories}
+                released_by_field = {flight_id: {} for flight_id in inventories}
+                for _, flight_id, row, column, seat_type in batch:
+                    if flight_id not in inventories:
+                        continue
+                    position = inventories[flight_id].position(row, column)
+                    # Sólo se libera si nadie lo ocupó mientras tanto
+                    if seat_status[flight_id][position] == codes['reserved']:
+                        seat_status[flight_id][position] = codes['available']
+                        changes[flight_id][position] = codes['available']
+                        field = FlightSeatInventory.AVAILABLE_FIELDS[seat_type]
+                        released_by_field[flight_id][field] = released_by_field[flight_id].get(field, 0) + 1
+                for flight_id, inventory in inventories.items():
+                    inventory.seat_status = ''.join(seat_status[flight_id])
+                    for field in FlightSeatInventory.AVAILABLE_FIELDS.values():
+                        setattr(inventory, field, F(field) + released_by_field[flight_id].get(field, 0))
+                    inventory.version = F('version') + 1
+
+                FlightSeatInventory.objects.bulk_update(
+                    inventories.values(),
+                    ['seat_status', 'version', *FlightSeatInventory.AVAILABLE_FIELDS.values()],
+                    batch_size=batch_size
+                )
+                SeatMapService().invalidate_on_commit(inventories.keys())
+                inventory_service = SeatInventoryService()
+                for flight_id, flight_changes in changes.items():
+                    if flight_changes:
+                        inventory_service.publish_on_commit(flight_id, flight_changes)
+                SeatHold.objects.filter(id__in=[hold[0] for hold in batch]).delete()
+            released += len(batch)
+
+        if released:
+            self._count('released', released)
+        return released
+
+    def metrics(self, now=None):
+        """
+        Holds activos, vencidos sin barrer y contadores acumulados para monitoreo
+        """
+        now = now or timezone.now()
+        data = {
+            'active': SeatHold.objects.filter(expires_at__gt=now).count(),
+            'expired_pending': SeatHold.objects.filter(expires_at__lte=now).count(),
+        }
+        for name, key in self.COUNTER_KEYS.items():
+            data[name] = cache.get(key, 0)
+        return data
+
+
 class ReservaService:
+    MAX_PASAJEROS_GRUPO = 6
+    MAX_RESERVAS_LOTE = 1000
+    # Transiciones de estado permitidas y el estado en que deja cada una al asiento
+    TRANSICIONES = {
+        'pending': {'confirmed', 'canceled'},
+        'confirmed': {'canceled'},
+        'canceled': set(),
+    }
+    ESTADO_ASIENTO = {
+        'confirmed': 'occupied',
+        'canceled': 'available',
+    }
+    PRICE_MULTIPLIERS = {
+        'economy': Decimal('1.0'),
+        'premium': Decimal('1.5'),
+        'business': Decimal('2.0'),
+    }
+
+    def __init__(self):
+        self.inventory_service = SeatInventoryService()
+
     def get_or_create_passenger(self, user):
         """
         Obtiene o crea un pasajero asociado al usuario
         """
-        from .models import Passenger
         try:
             # Intentar encontrar un pasajero con el email del usuario
             passenger = Passenger.objects.get(email=user.email)
@@ -41,59 +751,280 @@ class ReservaService:
         if seat.airplane != flight.airplane:
             raise ValidationError("El asiento no pertenece al avión de este vuelo")
 
-        # Validar que el asiento está disponible
-        if seat.status != 'available':
-            raise ValidationError("El asiento no está disponible")
-
-        print(passenger, flight, seat)
         # Generar código de reserva único
         reservation_code = str(uuid.uuid4())[:8].upper()
 
-        # Crear la reserva
-        reserva = Reservation.objects.create(
-            flight=flight,
-            passenger=passenger,
-            seat=seat,
-            status='pending',
-            price=flight.base_price,  # Aquí podrías aplicar lógica de precios
-            reservation_code=reservation_code
-        )
+        with transaction.atomic():
+            # Tomar el asiento con un UPDATE condicional: si otro pedido lo ganó, no hay reserva
+            if not self.inventory_service.claim(flight, [seat], 'reserved'):
+                raise ValidationError("El asiento no está disponible")
 
-        # Actualizar estado del asiento
-        seat.status = 'reserved'
-        seat.save()
+            # Crear la reserva
+            reserva = Reservation.objects.create(
+                flight=flight,
+                passenger=passenger,
+                seat=seat,
+                status='pending',
+                price=flight.base_price,  # Aquí podrías aplicar lógica de precios
+                reservation_code=reservation_code
+            )
 
         return reserva
 
-    def cambiar_estado_reserva(self, reserva, nuevo_estado):
+    @classmethod
+    def tarifa(cls, flight, seat_class):
         """
-        Cambiar el estado de una reserva
+        Tarifa de la clase en el vuelo, redondeada al centavo como se guarda.
+        Las búsquedas suman estas tarifas: el total cotizado es lo que se cobra
+        """
+        return (flight.base_price * cls.PRICE_MULTIPLIERS[seat_class or 'economy']).quantize(Decimal('0.01'))
+
+    def precio_asiento(self, flight, seat):
+        """
+        Precio del asiento según su clase
         """
+        return self.tarifa(flight, seat.type)
+
+    def crear_reservas_grupo(self, flight, pasajeros, user):
+        """
+        Reserva varios asientos del vuelo en una sola transacción: un UPDATE
+        condicional toma todos los asientos y los pasajeros, reservas y
+        boletos se insertan con bulk_create. Si algún asiento ya no está
+        libre falla el grupo entero. pasajeros es una lista de dicts con el
+        asiento ('seat') y los datos del pasajero; el email por defecto es
+        el del usuario que reserva
+        """
+        if flight.status != 'scheduled':
+            raise ValidationError("Solo se pueden hacer reservas para vuelos programados")
+
+        if not 1 <= len(pasajeros) <= self.MAX_PASAJEROS_GRUPO:
+            raise ValidationError(f"Un grupo debe tener entre 1 y {self.MAX_PASAJEROS_GRUPO} pasajeros")
+
+        seats = [data['seat'] for data in pasajeros]
+        if any(seat.airplane_id != flight.airplane_id for seat in seats):
+            raise ValidationError("Todos los asientos deben pertenecer al avión de este vuelo")
+        if len({seat.pk for seat in seats}) != len(seats):
+            raise ValidationError("No se puede asignar el mismo asiento a dos pasajeros")
+
+        documents = [data['document'] for data in pasajeros]
+        if len(set(documents)) != len(documents):
+            raise ValidationError("Hay pasajeros repetidos en el grupo")
+
+        # Corte rápido sobre el inventario antes de abrir la transacción
+        inventory = self.inventory_service.get_inventory(flight)
+        tomados = [seat.number for seat in seats if inventory.status_of(seat) != 'available']
+        if tomados:
+            raise ValidationError(f"Los asientos {', '.join(tomados)} no están disponibles")
+
+        with transaction.atomic():
+            # Todos los asientos o ninguno: si otro pedido ganó alguno, no hay reservas
+            if not self.inventory_service.claim(flight, seats, 'occupied'):
+                raise ValidationError("Alguno de los asientos ya no está disponible")
+
+            passengers = self.get_or_create_passengers(pasajeros, user)
+            if Reservation.objects.filter(flight=flight, passenger__in=passengers).exists():
+                raise ValidationError("Alguno de los pasajeros ya tiene una reserva para este vuelo")
+
+            reservas = Reservation.objects.bulk_create([
+                Reservation(
+                    flight=flight,
+                    passenger=passenger,
+                    seat=seat,
+                    status='confirmed',
+                    price=self.precio_asiento(flight, seat),
+                    reservation_code=str(uuid.uuid4())[:8].upper()
+                )
+                for passenger, seat in zip(passengers, seats)
+            ])
+            Ticket.objects.bulk_create([
+                Ticket(reservation=reserva, barcode=f"TKT-{str(uuid.uuid4())[:12].upper()}", status='issued')
+                for reserva in reservas
+            ])
+            # bulk_create no dispara post_save: la versión de reservas se sube a mano
+            versioned_cache.bump_on_commit('reservations')
+
+        return reservas
+
+    def crear_reserva_ida_vuelta(self, ida, vuelta, user):
+        """
+        Compra los dos tramos de un viaje de ida y vuelta en una sola
+        transacción, como el checkout de un tramo: reservas confirmadas, con
+        boleto y con la tarifa de la clase del asiento. Si el asiento de
+        alguno de los tramos ya no está libre, no queda ninguna reserva. ida
+        y vuelta son dicts con 'flight' y 'seat'
+        """
+        outbound, inbound = ida['flight'], vuelta['flight']
+        if (outbound.origin, outbound.destination) != (inbound.destination, inbound.origin):
+            raise ValidationError("El vuelo de vuelta debe hacer la ruta inversa al de ida")
+        if inbound.departure_time <= outbound.arrival_time:
+            raise ValidationError("El vuelo de vuelta debe salir después de la llegada del de ida")
+        for tramo in (ida, vuelta):
+            if tramo['flight'].status != 'scheduled':
+                raise ValidationError("Solo se pueden hacer reservas para vuelos programados")
+            if tramo['seat'].airplane_id != tramo['flight'].airplane_id:
+                raise ValidationError("El asiento no pertenece al avión de este vuelo")
+
+        passenger = self.get_or_create_passenger(user)
+        vuelos = [outbound, inbound]
+        if Reservation.objects.filter(flight__in=vuelos, passenger=passenger).exclude(status='canceled').exists():
+            raise ValidationError("Ya tienes una reserva en alguno de estos vuelos")
+
+        with transaction.atomic():
+            reservas = []
+            for tramo in (ida, vuelta):
+                flight, seat = tramo['flight'], tramo['seat']
+                if not self.inventory_service.claim(flight, [seat], 'occupied'):
+                    raise ValidationError("El asiento no está disponible")
+                # Una reserva cancelada del pasajero ocupa el lugar de (vuelo, pasajero): se reemplaza
+                Reservation.objects.filter(flight=flight, passenger=passenger, status='canceled').delete()
+                reserva = Reservation.objects.create(
+                    flight=flight,
+                    passenger=passenger,
+                    seat=seat,
+                    status='confirmed',
+                    price=self.precio_asiento(flight, seat),
+                    reservation_code=str(uuid.uuid4())[:8].upper()
+                )
+                Ticket.objects.create(reservation=reserva, barcode=f"TKT-{str(uuid.uuid4())[:12].upper()}", status='issued')
+                reservas.append(reserva)
+        return tuple(reservas)
+
+    def get_or_create_passengers(self, pasajeros, user):
+        """
+        Pasajeros del grupo en el mismo orden: reutiliza los existentes por
+        documento y crea el resto con un solo bulk_create
+        """
+        existentes = Passenger.objects.in_bulk([data['document'] for data in pasajeros], field_name='document')
+        nuevos = [
+            Passenger(
+                name=data['name'],
+                document=data['document'],
+                document_type=data['document_type'],
+                email=data.get('email') or user.email,
+                phone=data.get('phone', ''),
+                birth_date=data['birth_date']
+            )
+            for data in pasajeros if data['document'] not in existentes
+        ]
+        Passenger.objects.bulk_create(nuevos)
+        existentes.update({passenger.document: passenger for passenger in nuevos})
+        return [existentes[data['document']] for data in pasajeros]
+
+    def validar_estado(self, nuevo_estado):
         estados_validos = [choice[0] for choice in Reservation.STATUS_OPTIONS]
         if nuevo_estado not in estados_validos:
             raise ValidationError(f"Estado no válido. Opciones: {estados_validos}")
 
+    def error_de_transicion(self, estado, nuevo_estado):
+        """
+        Mensaje de error si la reserva no puede pasar de estado a
+        nuevo_estado, o None si la transición está permitida
+        """
+        if nuevo_estado in self.TRANSICIONES[estado]:
+            return None
+        if estado == 'pending':
+            return "Una reserva pendiente solo puede ser confirmada o cancelada"
+        if estado == 'confirmed':
+            return "Una reserva confirmada solo puede ser cancelada"
+        return "No se puede cambiar el estado de una reserva cancelada"
+
+    def cambiar_estado_reserva(self, reserva, nuevo_estado):
+        """
+        Cambiar el estado de una reserva
+        """
+        self.validar_estado(nuevo_estado)
+
         # Validar transiciones de estado permitidas
-        if reserva.status == 'pending' and nuevo_estado not in ['confirmed', 'canceled']:
-            raise ValidationError("Una reserva pendiente solo puede ser confirmada o cancelada")
-        elif reserva.status == 'confirmed' and nuevo_estado != 'canceled':
-            raise ValidationError("Una reserva confirmada solo puede ser cancelada")
-        elif reserva.status == 'canceled':
-            raise ValidationError("No se puede cambiar el estado de una reserva cancelada")
-
-        # Actualizar estado de la reserva
-        reserva.status = nuevo_estado
-        reserva.save()
-
-        # Actualizar estado del asiento
-        if nuevo_estado == 'confirmed':
-            reserva.seat.status = 'occupied'
-        elif nuevo_estado == 'canceled':
-            reserva.seat.status = 'available'
-        reserva.seat.save()
+        error = self.error_de_transicion(reserva.status, nuevo_estado)
+        if error:
+            raise ValidationError(error)
+
+        with transaction.atomic():
+            # Actualizar estado de la reserva
+            reserva.status = nuevo_estado
+            reserva.save()
+
+            # Actualizar estado del asiento en el vuelo
+            self.inventory_service.set_status(reserva.flight, [reserva.seat], self.ESTADO_ASIENTO[nuevo_estado])
 
         return reserva
 
+    def actualizar_reserva(self, reserva, data, nuevo_estado=None):
+        """
+        Aplica un PATCH/PUT de la API en una sola transacción: si algo falla
+        (asiento tomado, transición inválida) no queda nada a medias. Un
+        cambio de asiento toma el nuevo con un UPDATE condicional y libera el
+        anterior; el estado pasa por cambiar_estado_reserva
+        """
+        data = dict(data)
+        flight = data.pop('flight', reserva.flight)
+        seat = data.pop('seat', reserva.seat)
+        if flight.pk != reserva.flight_id:
+            raise ValidationError("No se puede cambiar el vuelo de una reserva")
+
+        with transaction.atomic():
+            reserva = Reservation.objects.select_for_update().select_related('flight', 'seat').get(pk=reserva.pk)
+            if seat.pk != reserva.seat_id:
+                if reserva.status == 'canceled':
+                    raise ValidationError("No se puede cambiar el asiento de una reserva cancelada")
+                if seat.airplane_id != reserva.flight.airplane_id:
+                    raise ValidationError("El asiento no pertenece al avión de este vuelo")
+                estado_asiento = 'occupied' if reserva.status == 'confirmed' else 'reserved'
+                if not self.inventory_service.claim(reserva.flight, [seat], estado_asiento):
+                    raise ValidationError("El asiento no está disponible")
+                self.inventory_service.claim(
+                    reserva.flight, [reserva.seat], 'available', from_statuses=('reserved', 'occupied')
+                )
+                reserva.seat = seat
+            for campo, valor in data.items():
+                setattr(reserva, campo, valor)
+            reserva.save()
+
+            if nuevo_estado and nuevo_estado != reserva.status:
+                reserva = self.cambiar_estado_reserva(reserva, nuevo_estado)
+        return reserva
+
+    def cambiar_estado_reservas(self, ids, nuevo_estado, reservas=None):
+        """
+        Cambia el estado de muchas reservas a la vez, por ejemplo para
+        confirmar las de una agencia o cancelar un bloque. Las reservas se
+        leen en una sola consulta y las transiciones se validan en memoria;
+        las válidas se aplican con un UPDATE de reservas y uno por vuelo
+        sobre su inventario. reservas limita las que se pueden tocar (las
+        del usuario). Devuelve (ids cambiados, {id: error})
+        """
+        self.validar_estado(nuevo_estado)
+        if reservas is None:
+            reservas = Reservation.objects.all()
+        ids = list(dict.fromkeys(ids))
+
+        with transaction.atomic():
+            lote = reservas.select_for_update(of=('self',)).filter(id__in=ids).select_related('flight', 'seat').only(
+                'id', 'status', 'flight__id', 'flight__airplane_id', 'seat__row', 'seat__column', 'seat__type'
+            )
+            encontradas = {reserva.id: reserva for reserva in lote}
+            errores = {}
+            validas = []
+            for reserva_id in ids:
+                reserva = encontradas.get(reserva_id)
+                error = "Reserva inexistente" if reserva is None else self.error_de_transicion(reserva.status, nuevo_estado)
+                if error:
+                    errores[reserva_id] = error
+                else:
+                    validas.append(reserva)
+
+            if validas:
+                Reservation.objects.filter(id__in=[reserva.id for reserva in validas]).update(status=nuevo_estado)
+                # update() no dispara post_save: la versión de reservas se sube a mano
+                versioned_cache.bump_on_commit('reservations')
+                por_vuelo = {}
+                for reserva in validas:
+                    por_vuelo.setdefault(reserva.flight_id, (reserva.flight, []))[1].append(reserva.seat)
+                for flight, seats in por_vuelo.values():
+                    self.inventory_service.set_status(flight, seats, self.ESTADO_ASIENTO[nuevo_estado])
+
+        return [reserva.id for reserva in validas], errores
+
     def generar_boleto(self, reserva):
         """
         Generar un boleto para una reserva confirmada
@@ -127,15 +1058,313 @@ class ReservaService:
         return ticket
 
 
+class FlightSearchService:
+    CALENDAR_DAYS = 3
+    CALENDAR_MAX_DAYS = 15
+    CALENDAR_CACHE_TIMEOUT = 5 * 60
+    ROUND_TRIP_LIMIT = 20
+    OFFERS_DAYS = 91
+    SEARCH_CACHE_TIMEOUT = 5 * 60
+    SEARCH_COUNTER_KEYS = {
+        'hits': 'flight_search:hits',
+        'misses': 'flight_search:misses',
+    }
+    CONNECTIONS_LIMIT = 20
+    MAX_STOPS = 2
+
+    def day_range(self, day, days=1):
+        """
+        Rango semiabierto [inicio, fin) de días completos en la zona horaria
+        actual. A diferencia de __date, compara la columna sin transformarla
+        y puede usar los índices de departure_time
+        """
+        start = timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+        return start, start + datetime.timedelta(days=days)
+
+    # iexact (LIKE en SQLite) sólo iguala mayúsculas y minúsculas ASCII
+    ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+    @classmethod
+    def route_text(cls, text):
+        """
+        Origen o destino normalizado como lo compara la base con iexact: sin
+        espacios en los extremos y en mayúsculas ASCII ('córdoba' ->
+        'CóRDOBA'). Búsquedas, claves de caché e invalidación usan esta forma
+        """
+        return (text or '').strip().translate(cls.ASCII_UPPER)
+
+    def route_key(self, origin, destination):
+        """
+        Ruta normalizada y hasheada para las claves de caché: el texto libre
+        puede traer espacios o caracteres que memcached no acepta en una clave
+        """
+        route = f"{self.route_text(origin)}\n{self.route_text(destination)}"
+        return hashlib.md5(route.encode(), usedforsecurity=False).hexdigest()
+
+    def route_flights(self, origin, destination, start, end, seat_class=None):
+        """
+        Vuelos programados de la ruta que salen en [start, end). Con clase,
+        sólo los que tienen lugar en ella, anotados con seats_left
+        """
+        flights = Flight.objects.filter(
+            origin__iexact=self.route_text(origin),
+            destination__iexact=self.route_text(destination),
+            status='scheduled',
+            departure_time__gte=start,
+            departure_time__lt=end,
+        )
+        if seat_class:
+            flights = self.with_availability(flights, seat_class)
+        return flights
+
+    def with_availability(self, flights, seat_class):
+        """
+        Deja sólo los vuelos con lugar en la clase, anotados con seats_left.
+        La disponibilidad sale de los contadores del inventario, sin tocar los asientos
+        """
+        SeatInventoryService().ensure_inventories(flights)
+        field = f"seat_inventory__{FlightSeatInventory.AVAILABLE_FIELDS[seat_class]}"
+        return flights.filter(**{f"{field}__gt": 0}).annotate(seats_left=F(field))
+
+    def search(self, origin, destination, departure_date, seat_class=None):
+        """
+        Vuelos programados de la ruta que salen ese día, por horario de salida.
+        El resultado (ids y lugares libres en la clase) se cachea por
+        búsqueda normalizada; con caché sólo se leen los vuelos por id
+        """
+        bucket = self.search_bucket(origin, destination, departure_date)
+        computed = None
+
+        def compute():
+            nonlocal computed
+            start, end = self.day_range(departure_date)
+            computed = list(self.route_flights(origin, destination, start, end, seat_class).order_by('departure_time'))
+            cache.set_many({self.flight_bucket_key(flight.id): bucket for flight in computed}, self.SEARCH_CACHE_TIMEOUT)
+            return [(flight.id, getattr(flight, 'seats_left', None)) for flight in computed]
+
+        # Un solo pedido recalcula una búsqueda que falta; los demás esperan su resultado
+        cached = versioned_cache.get_or_compute(
+            self.search_cache_key(bucket, seat_class), compute, self.SEARCH_CACHE_TIMEOUT
+        )
+        if computed is not None:
+            self._count('misses')
+            return computed
+
+        self._count('hits')
+        # Los cambios hechos sin señales (bulk, update) los filtra el estado; el resto expira con la caché
+        by_id = Flight.objects.filter(status='scheduled').in_bulk([flight_id for flight_id, _ in cached])
+        flights = []
+        for flight_id, seats_left in cached:
+            flight = by_id.get(flight_id)
+            if flight is None:
+                continue
+            if seats_left is not None:
+                flight.seats_left = seats_left
+            flights.append(flight)
+        return flights
+
+    def search_bucket(self, origin, destination, day):
+        return f"{self.route_key(origin, destination)}:{day.isoformat()}"
+
+    def search_cache_key(self, bucket, seat_class):
+        return f"flight_search:{bucket}:{seat_class or 'any'}"
+
+    def flight_bucket_key(self, flight_id):
+        return f"flight_search:flight:{flight_id}"
+
+    def offers_cache_key(self, day):
+        return versioned_cache.key(['flights'], 'flight_search', 'offers', day.isoformat())
+
+    def offers(self, days=OFFERS_DAYS):
+        """
+        Vuelos programados desde hoy hasta dentro de days - 1 días, por
+        horario de salida. Se cachean los ids con la versión de vuelos:
+        cualquier cambio de vuelo invalida la lista
+        """
+        today = timezone.localdate()
+        computed = False
+
+        def compute():
+            nonlocal computed
+            computed = True
+            start, end = self.day_range(today, days=days)
+            return list(Flight.objects.filter(
+                departure_time__gte=start,
+                departure_time__lt=end,
+                status='scheduled',
+            ).order_by('departure_time').values_list('id', flat=True))
+
+        flight_ids = versioned_cache.get_or_compute(self.offers_cache_key(today), compute, self.SEARCH_CACHE_TIMEOUT)
+        self._count('misses' if computed else 'hits')
+        by_id = Flight.objects.filter(status='scheduled').in_bulk(flight_ids)
+        return [by_id[flight_id] for flight_id in flight_ids if flight_id in by_id]
+
+    def invalidate_flights(self, flight_ids, flights=()):
+        """
+        Borra sólo las búsquedas cacheadas que incluyen estos vuelos (por su
+        puntero a la búsqueda) y las de la ruta y día actuales de flights,
+        que pueden no incluirlos todavía
+        """
+        buckets = set(cache.get_many([self.flight_bucket_key(flight_id) for flight_id in flight_ids]).values())
+        buckets.update(
+            self.search_bucket(flight.origin, flight.destination, timezone.localtime(flight.departure_time).date())
+            for flight in flights
+        )
+        seat_classes = [None, *FlightSeatInventory.AVAILABLE_FIELDS]
+        cache.delete_many([self.search_cache_key(bucket, seat_class) for bucket in buckets for seat_class in seat_classes])
+
+    def invalidate_flights_on_commit(self, flight_ids, flights=()):
+        flight_ids, flights = list(flight_ids), list(flights)
+        transaction.on_commit(lambda: self.invalidate_flights(flight_ids, flights))
+
+    def _count(self, name):
+        key = self.SEARCH_COUNTER_KEYS[name]
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+    def metrics(self):
+        """
+        Aciertos y fallos de la caché de búsquedas, para monitoreo
+        """
+        data = {name: cache.get(key, 0) for name, key in self.SEARCH_COUNTER_KEYS.items()}
+        total = data['hits'] + data['misses']
+        data['hit_ratio'] = round(data['hits'] / total, 3) if total else None
+        return data
+
+    def round_trip(self, origin, destination, departure_date, return_date, seat_class=None, limit=ROUND_TRIP_LIMIT):
+        """
+        Itinerarios de ida y vuelta: trae los candidatos de ambos tramos en
+        una sola consulta y los combina en pares donde la vuelta sale después
+        de que llega la ida. Devuelve los limit pares más baratos como
+        dicts {'outbound', 'return', 'total_price'}
+        """
+        origin, destination = self.route_text(origin), self.route_text(destination)
+        outbound_start, outbound_end = self.day_range(departure_date)
+        return_start, return_end = self.day_range(return_date)
+        flights = Flight.objects.filter(
+            Q(origin__iexact=origin, destination__iexact=destination,
+              departure_time__gte=outbound_start, departure_time__lt=outbound_end)
+            | Q(origin__iexact=destination, destination__iexact=origin,
+                departure_time__gte=return_start, departure_time__lt=return_end),
+            status='scheduled',
+        )
+        if seat_class:
+            flights = self.with_availability(flights, seat_class)
+
+        outbound, returns = [], []
+        for flight in flights:
+            (outbound if self.route_text(flight.origin) == origin else returns).append(flight)
+
+        pairs = (
+            (outbound_flight, return_flight)
+            for outbound_flight in outbound
+            for return_flight in returns
+            if return_flight.departure_time > outbound_flight.arrival_time
+        )
+        cheapest = heapq.nsmallest(
+            limit, pairs, key=lambda pair: (pair[0].base_price + pair[1].base_price, pair[0].departure_time)
+        )
+        # La suma de las tarifas de cada tramo, que es lo que guarda la reserva
+        return [
+            {
+                'outbound': outbound_flight,
+                'return': return_flight,
+                'total_price': ReservaService.tarifa(outbound_flight, seat_class) + ReservaService.tarifa(return_flight, seat_class),
+            }
+            for outbound_flight, return_flight in cheapest
+        ]
+
+    def connections(self, origin, destination, departure_date, seat_class=None, max_stops=MAX_STOPS, limit=CONNECTIONS_LIMIT):
+        """
+        Itinerarios con escalas que salen ese día, armados sobre el grafo de
+        rutas en memoria. Los vuelos de todos los candidatos (y su lugar en
+        la clase) se traen en una sola consulta. Devuelve los limit más
+        baratos como dicts {'flights', 'stops', 'total_price', 'duration'}
+        """
+        start, end = self.day_range(departure_date)
+        paths = route_graph.connections(origin, destination, start, end, max_stops=max_stops)
+        if not paths:
+            return []
+
+        flights = Flight.objects.filter(id__in={leg.id for legs in paths for leg in legs}, status='scheduled')
+        if seat_class:
+            flights = self.with_availability(flights, seat_class)
+        flights = flights.in_bulk()
+        # Un tramo sin lugar en la clase (o que cambió desde que se armó el grafo) descarta el itinerario
+        paths = [legs for legs in paths if all(leg.id in flights for leg in legs)]
+
+        cheapest = heapq.nsmallest(
+            limit, paths, key=lambda legs: (sum(leg.base_price for leg in legs), legs[-1].arrival_time)
+        )
+        return [
+            {
+                'flights': [flights[leg.id] for leg in legs],
+                'stops': len(legs) - 1,
+                'total_price': sum(ReservaService.tarifa(flights[leg.id], seat_class) for leg in legs),
+                'duration': legs[-1].arrival_time - legs[0].departure_time,
+            }
+            for legs in cheapest
+        ]
+
+    def calendar_cache_key(self, origin, destination, first_day, last_day, seat_class):
+        # Depende de los vuelos, de sus reservas y de los lugares libres, que también
+        # cambian con holds, barridos y reservas en lote: cualquier cambio sube la versión
+        return versioned_cache.key(
+            ['flights', 'reservations', 'availability'], 'fare_calendar', self.route_key(origin, destination),
+            first_day.isoformat(), last_day.isoformat(), seat_class
+        )
+
+    def fare_calendar(self, origin, destination, center_date, days=CALENDAR_DAYS, seat_class='economy'):
+        """
+        Tarifa más baja con lugar en la clase para cada día de la ventana
+        center_date ± days, sin días pasados. Sale de una única consulta
+        agrupada por día y se cachea por ruta y ventana. Devuelve una lista
+        de {'date', 'lowest_fare', 'flights'}; lowest_fare es None si ese día
+        no hay vuelos con lugar
+        """
+        first_day = max(center_date - datetime.timedelta(days=days), timezone.localdate())
+        last_day = center_date + datetime.timedelta(days=days)
+        if last_day < first_day:
+            return []
+
+        def compute():
+            start, end = self.day_range(first_day, days=(last_day - first_day).days + 1)
+            per_day = {
+                row['day']: row
+                for row in self.route_flights(origin, destination, start, end, seat_class)
+                .annotate(day=TruncDate('departure_time'))
+                .values('day')
+                .annotate(lowest=Min('base_price'), total=Count('id'))
+                .order_by('day')
+            }
+            # El multiplicador de la clase es el mismo para todos los vuelos
+            multiplier = ReservaService.PRICE_MULTIPLIERS[seat_class]
+            calendar = []
+            for offset in range((last_day - first_day).days + 1):
+                day = first_day + datetime.timedelta(days=offset)
+                row = per_day.get(day)
+                calendar.append({
+                    'date': day,
+                    'lowest_fare': (row['lowest'] * multiplier).quantize(Decimal('0.01')) if row else None,
+                    'flights': row['total'] if row else 0,
+                })
+            return calendar
+
+        key = self.calendar_cache_key(origin, destination, first_day, last_day, seat_class)
+        return versioned_cache.get_or_compute(key, compute, self.CALENDAR_CACHE_TIMEOUT)
+
+
 class FlightService:
-    def create_flight(self, data):
+    # Vuelos por pedido en las cargas por lote
+    MAX_LOTE = 5000
+    BATCH_SIZE = 1000
+
+    def validate_new_flight(self, data):
         """
-        Crear un nuevo vuelo con validaciones de negocio
+        Validaciones de negocio de un vuelo nuevo; lanza ValidationError
         """
         # Validar que el avión existe y tiene capacidad
-        airplane = data.get('airplane')
-        print(airplane, data)
-        if not airplane:
+        if not data.get('airplane'):
             raise ValidationError("Se requiere un avión válido")
 
         # Validar fechas
@@ -149,11 +1378,9 @@ class FlightService:
         if status not in [s[0] for s in Flight.STATUSES]:
             raise ValidationError(f"Estado no válido. Opciones permitidas: {[s[0] for s in Flight.STATUSES]}")
 
-        return Flight.objects.create(**data)
-
-    def update_flight(self, flight, data):
+    def validate_update(self, flight, data):
         """
-        Actualizar un vuelo existente con validaciones de negocio
+        Validaciones de negocio de un cambio sobre un vuelo; lanza ValidationError
         """
         # No permitir cambios en vuelos completados o cancelados
         if flight.status in ['completed', 'canceled']:
@@ -171,12 +1398,107 @@ class FlightService:
             elif flight.status == 'in_flight' and new_status not in ['completed']:
                 raise ValidationError("Un vuelo en progreso solo puede pasar a completado")
 
+        # Las reservas activas tienen asientos del avión actual
+        if self.changes_airplane(flight, data) and flight.reservations.exclude(status='canceled').exists():
+            raise ValidationError("No se puede cambiar el avión de un vuelo con reservas activas")
+
+        # Las fechas se comparan con las que quedarían después del cambio
+        departure_time = data.get('departure_time', flight.departure_time)
+        arrival_time = data.get('arrival_time', flight.arrival_time)
+        if departure_time >= arrival_time:
+            raise ValidationError("El tiempo de salida debe ser anterior al tiempo de llegada")
+
+    @staticmethod
+    def changes_airplane(flight, data):
+        return 'airplane' in data and data['airplane'].pk != flight.airplane_id
+
+    def create_flight(self, data):
+        """
+        Crear un nuevo vuelo con validaciones de negocio
+        """
+        self.validate_new_flight(data)
+        return Flight.objects.create(**data)
+
+    def update_flight(self, flight, data):
+        """
+        Actualizar un vuelo existente con validaciones de negocio
+        """
+        self.validate_update(flight, data)
+
         # Actualizar campos
         for key, value in data.items():
             setattr(flight, key, value)
         flight.save()
         return flight
 
+    def bulk_create_flights(self, items):
+        """
+        Crea los vuelos válidos de items (dicts ya validados por el
+        serializer) con bulk_create en una sola transacción. Devuelve
+        (vuelos creados, {posición: error}) con los que no pasaron las
+        validaciones de negocio
+        """
+        flights, errors = [], {}
+        for index, data in items:
+            try:
+                self.validate_new_flight(data)
+            except ValidationError as e:
+                errors[index] = e.detail
+                continue
+            flights.append(Flight(**data))
+
+        with transaction.atomic():
+            Flight.objects.bulk_create(flights, batch_size=self.BATCH_SIZE)
+            self.flights_changed_on_commit(flights)
+        return flights, errors
+
+    def bulk_update_flights(self, items):
+        """
+        Aplica los cambios válidos de items, pares (vuelo, dict validado),
+        con un solo bulk_update en una transacción. Devuelve (vuelos
+        actualizados, {posición: error})
+        """
+        flights, errors, fields = [], {}, set()
+        airplane_changed = []
+        now = timezone.now()
+        for index, flight, data in items:
+            try:
+                self.validate_update(flight, data)
+            except ValidationError as e:
+                errors[index] = e.detail
+                continue
+            if self.changes_airplane(flight, data):
+                airplane_changed.append(flight)
+            for key, value in data.items():
+                setattr(flight, key, value)
+            # bulk_update no aplica auto_now
+            flight.updated_at = now
+            fields.update(data)
+            flights.append(flight)
+
+        with transaction.atomic():
+            if flights and fields:
+                Flight.objects.bulk_update(flights, sorted({*fields, 'updated_at'}), batch_size=self.BATCH_SIZE)
+            # Sin señales: los inventarios de los vuelos que cambiaron de avión se rearman acá
+            if airplane_changed:
+                SeatInventoryService().rebuild_inventories(airplane_changed)
+            self.flights_changed_on_commit(flights)
+        return flights, errors
+
+    def flights_changed_on_commit(self, flights):
+        """
+        bulk_create y bulk_update no disparan señales: se invalida a mano lo
+        que las señales de Flight invalidan vuelo por vuelo
+        """
+        if not flights:
+            return
+        flight_ids = [flight.pk for flight in flights]
+        versioned_cache.bump_on_commit('flights')
+        FlightSearchService().invalidate_flights_on_commit(flight_ids, flights)
+        SeatMapService().invalidate_on_commit(flight_ids)
+        # Miles de vuelos: el grafo de rutas se rearma entero en la próxima búsqueda
+        transaction.on_commit(route_graph.invalidate)
+
     def delete_flight(self, flight):
         """
         Eliminar un vuelo con validaciones de negocio
@@ -188,4 +1510,109 @@ class FlightService:
         if flight.reservations.exists():
             raise ValidationError("No se puede eliminar un vuelo con reservas existentes")
             
-        flight.delete()
\ No newline at end of file
+        flight.delete()
+
+
+class ExportService:
+    """
+    Exportaciones del backoffice como (columnas, filas): las filas salen de
+    values_list sobre un iterator(chunk_size), de a CHUNK_SIZE por vez, sin
+    instancias ni listas en memoria. Cada columna es (clave, encabezado)
+    """
+    CHUNK_SIZE = 2000
+    MANIFEST_COLUMNS = [
+        ('id', 'ID Reserva'),
+        ('reservation_code', 'Código Reserva'),
+        ('passenger__name', 'Nombre Pasajero'),
+        ('passenger__document', 'Documento'),
+        ('passenger__document_type', 'Tipo de Documento'),
+        ('passenger__email', 'Email'),
+        ('passenger__phone', 'Teléfono'),
+        ('seat__number', 'Asiento'),
+        ('seat__type', 'Clase'),
+        ('price', 'Precio'),
+    ]
+    RESERVATION_COLUMNS = [
+        ('id', 'ID Reserva'),
+        ('reservation_code', 'Código Reserva'),
+        ('reservation_date', 'Fecha'),
+        ('status', 'Estado'),
+        ('flight_id', 'Vuelo'),
+        ('flight__origin', 'Origen'),
+        ('flight__destination', 'Destino'),
+        ('flight__departure_time', 'Salida'),
+        ('passenger__name', 'Pasajero'),
+        ('passenger__document', 'Documento'),
+        ('seat__number', 'Asiento'),
+        ('price', 'Precio'),
+    ]
+    FLIGHT_COLUMNS = [
+        ('id', 'ID Vuelo'),
+        ('origin', 'Origen'),
+        ('destination', 'Destino'),
+        ('departure_time', 'Salida'),
+        ('arrival_time', 'Llegada'),
+        ('duration', 'Duración'),
+        ('status', 'Estado'),
+        ('airplane__model', 'Avión'),
+        ('base_price', 'Precio Base'),
+    ]
+
+    def rows(self, queryset, columns):
+        return queryset.values_list(*[key for key, _ in columns]).iterator(chunk_size=self.CHUNK_SIZE)
+
+    def manifest(self, flight):
+        """Pasajeros de un vuelo, por asiento"""
+        reservations = Reservation.objects.filter(flight=flight).order_by('seat__row', 'seat__column')
+        seat_types = dict(Seat.SEAT_TYPES)
+        type_column = [key for key, _ in self.MANIFEST_COLUMNS].index('seat__type')
+        rows = (
+            row[:type_column] + (seat_types.get(row[type_column], row[type_column]),) + row[type_column + 1:]
+            for row in self.rows(reservations, self.MANIFEST_COLUMNS)
+        )
+        return self.MANIFEST_COLUMNS, rows
+
+    def reservations(self, start=None, end=None):
+        """Todas las reservas hechas en [start, end), por id"""
+        reservations = Reservation.objects.order_by('id')
+        if start is not None:
+            reservations = reservations.filter(reservation_date__gte=start)
+        if end is not None:
+            reservations = reservations.filter(reservation_date__lt=end)
+        return self.RESERVATION_COLUMNS, self.rows(reservations, self.RESERVATION_COLUMNS)
+
+    def flights(self, start=None, end=None):
+        """Horario de vuelos que salen en [start, end), por salida"""
+        flights = Flight.objects.order_by('departure_time', 'id')
+        if start is not None:
+            flights = flights.filter(departure_time__gte=start)
+        if end is not None:
+            flights = flights.filter(departure_time__lt=end)
+        return self.FLIGHT_COLUMNS, self.rows(flights, self.FLIGHT_COLUMNS)
+
+
+class DestinationCatalogService:
+    """
+    Catálogo de destinos con su primera imagen, leído con una sola consulta
+    y cacheado con la versión de destinos, que sube cuando cambia un destino
+    o una imagen. La elección de destinos al azar se hace en memoria sobre
+    el catálogo
+    """
+    def cache_key(self):
+        return versioned_cache.key(['destinations'], 'destinations', 'catalog')
+
+    def build_catalog(self):
+        first_image = DestinationImage.objects.filter(destination=OuterRef('pk')).order_by('pk').values('image_url')[:1]
+        return list(
+            Destination.objects.order_by('pk').annotate(image=Subquery(first_image)).values('id', 'name', 'image')
+        )
+
+    def catalog(self):
+        """
+        Lista de {'id', 'name', 'image'}; image es None si el destino no tiene imágenes
+        """
+        return versioned_cache.get_or_compute(self.cache_key(), self.build_catalog, None)
+
+    def sample(self, count):
+        catalog = self.catalog()
+        return random.sample(catalog, min(count, len(catalog)))
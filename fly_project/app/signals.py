@@ -0,0 +1,106 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .airport_index import airport_index
+from .caching import versioned_cache
+from .models import Airport, Destination, DestinationImage, Flight, Reservation, Seat
+from .route_graph import route_graph
+from .services import FlightSearchService, SeatInventoryService, SeatMapService
+
+# Espacio de nombres de caché que invalida cada modelo al cambiar
+CACHE_NAMESPACES = {
+    Flight: 'flights',
+    Seat: 'seats',
+    Reservation: 'reservations',
+    Destination: 'destinations',
+    DestinationImage: 'destinations',
+}
+
+
+@receiver(post_save, sender=Seat)
+@receiver(post_delete, sender=Seat)
+def rearmar_inventarios_por_asiento(sender, instance, origin=None, **kwargs):
+    # Cambió el layout del avión: las posiciones, dimensiones y contadores de sus
+    # vuelos salen de sus asientos. El rearmado sube la versión de sus mapas.
+    # El delete() de un queryset avisa asiento por asiento con todos ya borrados:
+    # alcanza con rearmar una vez por avión
+    if origin is not None and not isinstance(origin, Seat):
+        rearmados = origin.__dict__.setdefault('_aviones_rearmados', set())
+        if instance.airplane_id in rearmados:
+            return
+        rearmados.add(instance.airplane_id)
+    SeatInventoryService().rebuild_inventories(Flight.objects.filter(airplane_id=instance.airplane_id))
+
+
+@receiver(pre_save, sender=Flight)
+def recordar_avion_del_vuelo(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or (update_fields is not None and 'airplane' not in update_fields):
+        return
+    instance._avion_anterior = Flight.objects.filter(pk=instance.pk).values_list('airplane_id', flat=True).first()
+
+
+@receiver(post_save, sender=Flight)
+def rearmar_inventario_por_avion(sender, instance, **kwargs):
+    # Un vuelo que cambió de avión toma el layout del nuevo
+    avion_anterior = instance.__dict__.pop('_avion_anterior', None)
+    if avion_anterior is not None and avion_anterior != instance.airplane_id:
+        SeatInventoryService().rebuild_inventories([instance])
+
+
+@receiver(post_save, sender=Flight)
+@receiver(post_delete, sender=Flight)
+def invalidar_mapa_por_vuelo(sender, instance, **kwargs):
+    SeatMapService().invalidate_on_commit([instance.pk])
+
+
+@receiver(post_save, sender=Flight)
+def actualizar_grafo_por_vuelo(sender, instance, **kwargs):
+    # El grafo de rutas se actualiza sólo con el vuelo que cambió, una vez confirmado
+    transaction.on_commit(lambda: route_graph.update_flight(instance))
+
+
+@receiver(post_delete, sender=Flight)
+def quitar_vuelo_del_grafo(sender, instance, **kwargs):
+    flight_id = instance.pk
+    transaction.on_commit(lambda: route_graph.remove_flight(flight_id))
+
+
+@receiver(post_save, sender=Flight)
+@receiver(post_delete, sender=Flight)
+def invalidar_busquedas_por_vuelo(sender, instance, **kwargs):
+    # Las búsquedas donde estaba el vuelo y las de su ruta y día actuales
+    service = FlightSearchService()
+    service.invalidate_flights_on_commit([instance.pk], [instance])
+
+
+@receiver(m2m_changed, sender=Flight.users.through)
+def actualizar_vuelo_por_usuarios(sender, instance, action, reverse, pk_set, **kwargs):
+    # Los usuarios son parte del vuelo en la API: su ETag tiene que cambiar
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if not reverse:
+        flights = Flight.objects.filter(pk=instance.pk)
+    elif action == 'pre_clear':
+        flights = instance.managed_flights.all()
+    else:
+        flights = Flight.objects.filter(pk__in=pk_set)
+    flights.update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Airport)
+@receiver(post_delete, sender=Airport)
+def rearmar_indice_de_aeropuertos(sender, instance, **kwargs):
+    # El índice se rearma en la próxima búsqueda
+    transaction.on_commit(airport_index.invalidate)
+
+
+def subir_version_de_cache(sender, instance, **kwargs):
+    # Todas las claves que dependen del espacio de nombres del modelo quedan viejas
+    versioned_cache.bump_on_commit(CACHE_NAMESPACES[sender])
+
+
+for model in CACHE_NAMESPACES:
+    post_save.connect(subir_version_de_cache, sender=model, dispatch_uid=f"cache_version_{model.__name__}_save")
+    post_delete.connect(subir_version_de_cache, sender=model, dispatch_uid=f"cache_version_{model.__name__}_delete")
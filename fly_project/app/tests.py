@@ -1,7 +1,29 @@
 
+import asyncio
+from asgiref.sync import async_to_sync, sync_to_async
 from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.cache.backends.base import CacheKeyWarning
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
 from app.models import Airplane
-from app.models import Airplane, Passenger, Seat
+from app.broadcast import seat_status_broadcaster
+from app.route_graph import route_graph
+from app.airport_index import airport_index
+from app.caching import versioned_cache
+from app.models import Airplane, Airport, Destination, DestinationImage, Passenger, Seat, Flight, Reservation, SeatHold, Ticket
+from app.services import ReservaService, SeatHoldService, SeatInventoryService, SeatLayoutService, SeatMapService, SeatRecommendationService
+from app.services import DestinationCatalogService, ExportService, FlightSearchService, FlightService
+import datetime
+import json
+import tempfile
+import threading
+import time
+import warnings
+from decimal import Decimal
+from unittest import mock
 
 class AirplaneModelTest(TestCase):
 	def test_create_airplane(self):
@@ -29,10 +51,9 @@ class PassengerModelTest(TestCase):
 class SeatModelTest(TestCase):
 	def test_create_seat(self):
 		airplane = Airplane.objects.create(model="Airbus A320", capacity=150, rows=25, columns=6)
-		seat = Seat.objects.create(airplane=airplane, number="1A", row=1, column=1, type="economy", status="available")
+		seat = Seat.objects.create(airplane=airplane, number="1A", row=1, column=1, type="economy")
 		self.assertEqual(seat.number, "1A")
 		self.assertEqual(seat.type, "economy")
-		self.assertEqual(seat.status, "available")
 		self.assertEqual(str(seat), "Seat 1A (economy) - Airbus A320")
 
 class AirplaneModelTest(TestCase):
@@ -42,3 +63,901 @@ class AirplaneModelTest(TestCase):
 		self.assertEqual(airplane.capacity, 180)
 		self.assertEqual(airplane.rows, 30)
 		self.assertEqual(airplane.columns, 6)
+
+
+class FlightSeatInventoryTest(TestCase):
+	def setUp(self):
+		self.airplane = Airplane.objects.create(model="Airbus A320", capacity=4, rows=2, columns=2)
+		self.seat = Seat.objects.create(airplane=self.airplane, number="1A", row=1, column=1, type="economy")
+		Seat.objects.create(airplane=self.airplane, number="2B", row=2, column=2, type="premium")
+		self.flights = [
+			Flight.objects.create(
+				airplane=self.airplane,
+				origin="AEP",
+				destination="COR",
+				departure_time=timezone.now() + datetime.timedelta(days=day),
+				arrival_time=timezone.now() + datetime.timedelta(days=day, hours=1),
+				duration=datetime.timedelta(hours=1),
+				base_price=1000
+			)
+			for day in (1, 2)
+		]
+		self.user = User.objects.create_user(username="pax", email="pax@example.com", password="x")
+
+	def test_inventario_empaquetado_por_posicion(self):
+		inventory = SeatInventoryService().get_inventory(self.flights[0])
+		self.assertEqual(inventory.columns, 2)
+		self.assertEqual(inventory.seat_status, "A--A")
+
+	def test_reserva_no_afecta_otros_vuelos_del_mismo_avion(self):
+		ReservaService().crear_reserva({'flight': self.flights[0], 'seat': self.seat}, self.user)
+		service = SeatInventoryService()
+		self.assertEqual(service.status_of(self.flights[0], self.seat), 'reserved')
+		self.assertEqual(service.status_of(self.flights[1], self.seat), 'available')
+
+	def test_cambio_de_estado_en_lote(self):
+		service = ReservaService()
+		other = User.objects.create_user(username="pax2", email="pax2@example.com", password="x")
+		premium = Seat.objects.get(number="2B")
+		ida = service.crear_reserva({'flight': self.flights[0], 'seat': self.seat}, self.user)
+		vuelta = service.crear_reserva({'flight': self.flights[1], 'seat': self.seat}, self.user)
+		otra = service.crear_reserva({'flight': self.flights[0], 'seat': premium}, other)
+		service.cambiar_estado_reserva(otra, 'canceled')
+
+		# Savepoint y release, una lectura de reservas, un UPDATE de reservas y, por vuelo, su inventario y un UPDATE
+		with self.assertNumQueries(8):
+			cambiadas, errores = service.cambiar_estado_reservas([ida.id, vuelta.id, otra.id, 999], 'confirmed')
+		self.assertEqual(cambiadas, [ida.id, vuelta.id])
+		self.assertEqual(errores, {
+			otra.id: "No se puede cambiar el estado de una reserva cancelada",
+			999: "Reserva inexistente",
+		})
+		self.assertEqual(Reservation.objects.get(id=ida.id).status, 'confirmed')
+		self.assertEqual(SeatInventoryService().get_inventory(self.flights[0]).seat_status, "O--A")
+		self.assertEqual(SeatInventoryService().get_inventory(self.flights[1]).seat_status, "O--A")
+
+		# Cancelar un bloque libera los asientos; sólo se tocan las reservas permitidas
+		cambiadas, errores = service.cambiar_estado_reservas(
+			[ida.id, vuelta.id], 'canceled', Reservation.objects.filter(passenger__email="pax@example.com").exclude(id=vuelta.id)
+		)
+		self.assertEqual((cambiadas, errores), ([ida.id], {vuelta.id: "Reserva inexistente"}))
+		inventory = SeatInventoryService().get_inventory(self.flights[0])
+		self.assertEqual((inventory.seat_status, inventory.available_economy), ("A--A", 1))
+
+	def test_claim_condicional_solo_gana_una_vez(self):
+		service = SeatInventoryService()
+		self.assertTrue(service.claim(self.flights[0], [self.seat], 'reserved'))
+		self.assertFalse(service.claim(self.flights[0], [self.seat], 'reserved'))
+		self.assertEqual(service.get_inventory(self.flights[0]).seat_status, "R--A")
+
+	def test_asiento_tomado_no_crea_reserva(self):
+		ReservaService().crear_reserva({'flight': self.flights[0], 'seat': self.seat}, self.user)
+		other = User.objects.create_user(username="pax2", email="pax2@example.com", password="x")
+		with self.assertRaises(ValidationError):
+			ReservaService().crear_reserva({'flight': self.flights[0], 'seat': self.seat}, other)
+		self.assertEqual(Reservation.objects.filter(flight=self.flights[0]).count(), 1)
+
+	def test_hold_vencido_se_libera_en_lote(self):
+		service = SeatHoldService()
+		other_seat = Seat.objects.get(number="2B")
+		self.assertIsNotNone(service.hold(self.flights[0], self.seat, self.user))
+		self.assertIsNotNone(service.hold(self.flights[1], other_seat, self.user))
+		self.assertIsNone(service.hold(self.flights[0], self.seat, User.objects.create_user(username="pax2")))
+
+		released = service.release_expired(now=timezone.now() + datetime.timedelta(days=1))
+		self.assertEqual(released, 2)
+		self.assertFalse(SeatHold.objects.exists())
+		inventory_service = SeatInventoryService()
+		self.assertEqual(inventory_service.status_of(self.flights[0], self.seat), 'available')
+		self.assertEqual(inventory_service.status_of(self.flights[1], other_seat), 'available')
+
+	def test_hold_vencido_sin_barrer_no_cuenta(self):
+		service = SeatHoldService()
+		hold = service.hold(self.flights[0], self.seat, self.user)
+		self.assertEqual(service.get_hold(self.flights[0], self.seat, self.user), hold)
+		SeatHold.objects.filter(id=hold.id).update(expires_at=timezone.now() - datetime.timedelta(seconds=1))
+		self.assertIsNone(service.get_hold(self.flights[0], self.seat, self.user))
+
+	def test_nuevo_hold_libera_cada_asiento_anterior_por_separado(self):
+		premium = Seat.objects.get(number="2B")
+		tercero = Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="economy")
+		inventory_service = SeatInventoryService()
+		expires_at = timezone.now() + datetime.timedelta(minutes=5)
+		for seat in (self.seat, premium):
+			inventory_service.claim(self.flights[0], [seat], 'reserved')
+			SeatHold.objects.create(flight=self.flights[0], seat=seat, user=self.user, expires_at=expires_at)
+		# Uno de los asientos bloqueados se vendió mientras tanto: el otro igual se libera
+		inventory_service.set_status(self.flights[0], [self.seat], 'occupied')
+
+		SeatHoldService().hold(self.flights[0], tercero, self.user)
+		self.assertEqual(inventory_service.status_of(self.flights[0], self.seat), 'occupied')
+		self.assertEqual(inventory_service.status_of(self.flights[0], premium), 'available')
+		self.assertEqual(list(SeatHold.objects.values_list('seat_id', flat=True)), [tercero.id])
+
+	def test_checkout_con_hold_vencido_y_retomado_no_gana_el_asiento(self):
+		service = SeatHoldService()
+		service.hold(self.flights[0], self.seat, self.user)
+		SeatHold.objects.update(expires_at=timezone.now() - datetime.timedelta(seconds=1))
+		self.client.force_login(self.user)
+		finalizar = reverse('finalize_reservation', args=[self.flights[0].id])
+
+		# Vencido y sin barrer: el asiento sigue reservado, pero ya no es del usuario
+		self.client.post(finalizar, {'seat_id': self.seat.id})
+		self.assertFalse(Reservation.objects.exists())
+
+		# Con el hold vigente al entrar, pero vencido, barrido y bloqueado por otro
+		# usuario mientras el pedido verifica el asiento
+		other = User.objects.create_user(username="pax2", email="pax2@example.com", password="x")
+		SeatHold.objects.update(expires_at=timezone.now() + datetime.timedelta(minutes=5))
+		status_of = SeatInventoryService.status_of
+
+		def vence_y_lo_toma_otro(inventory_service, flight, seat):
+			SeatHold.objects.update(expires_at=timezone.now() - datetime.timedelta(seconds=1))
+			service.release_expired()
+			service.hold(flight, seat, other)
+			return status_of(inventory_service, flight, seat)
+
+		with mock.patch.object(SeatInventoryService, 'status_of', autospec=True, side_effect=vence_y_lo_toma_otro):
+			with tempfile.TemporaryDirectory() as media, self.settings(MEDIA_ROOT=media):
+				self.client.post(finalizar, {'seat_id': self.seat.id})
+		self.assertFalse(Reservation.objects.exists())
+		self.assertEqual(SeatInventoryService().status_of(self.flights[0], self.seat), 'reserved')
+		self.assertEqual(service.get_hold(self.flights[0], self.seat, other).user, other)
+
+	def test_cambio_de_asiento_de_reserva_confirmada_lo_ocupa(self):
+		service = ReservaService()
+		premium = Seat.objects.get(number="2B")
+		reserva = service.cambiar_estado_reserva(service.crear_reserva({'flight': self.flights[0], 'seat': self.seat}, self.user), 'confirmed')
+		self.client.force_login(self.user)
+		self.client.post(reverse('seat_selection', args=[self.flights[0].id]), {'seat_id': premium.id})
+		reserva.refresh_from_db()
+		self.assertEqual((reserva.seat, reserva.status), (premium, 'confirmed'))
+		inventory = SeatInventoryService().get_inventory(self.flights[0])
+		self.assertEqual((inventory.seat_status, inventory.available_economy, inventory.available_premium), ("A--O", 1, 0))
+
+	def test_barrido_no_libera_asientos_ya_ocupados(self):
+		service = SeatHoldService()
+		service.hold(self.flights[0], self.seat, self.user)
+		SeatInventoryService().set_status(self.flights[0], [self.seat], 'occupied')
+		service.release_expired(now=timezone.now() + datetime.timedelta(days=1))
+		self.assertEqual(SeatInventoryService().status_of(self.flights[0], self.seat), 'occupied')
+
+	def test_mapa_compacto_cacheado_e_invalidado(self):
+		cache.clear()
+		service = SeatMapService()
+		seat_map = service.get_seat_map(self.flights[0])
+		self.assertEqual((seat_map['rows'], seat_map['columns']), (2, 2))
+		self.assertEqual(seat_map['types'], "E--P")
+		self.assertEqual(seat_map['status'], "A--A")
+		self.assertEqual(seat_map['ids'][0], self.seat.id)
+
+		# Sólo la versión del inventario, para no servir un mapa que otro worker ya cambió
+		with self.assertNumQueries(1):
+			service.get_seat_map(self.flights[0])
+
+		with self.captureOnCommitCallbacks(execute=True):
+			SeatInventoryService().claim(self.flights[0], [self.seat], 'reserved')
+		self.assertEqual(service.get_seat_map(self.flights[0])['status'], "R--A")
+
+		# Otro worker cambió el asiento y la invalidación no llegó a esta caché
+		SeatInventoryService().set_status(self.flights[0], [self.seat], 'occupied')
+		self.assertEqual(service.get_seat_map(self.flights[0])['status'], "O--A")
+
+	def test_contadores_de_disponibilidad_por_clase(self):
+		def disponibles():
+			inventory = SeatInventoryService().get_inventory(self.flights[0])
+			return inventory.available_economy, inventory.available_premium, inventory.available_business
+
+		premium_seat = Seat.objects.get(number="2B")
+		self.assertEqual(disponibles(), (1, 1, 0))
+		SeatHoldService().hold(self.flights[0], self.seat, self.user)
+		self.assertEqual(disponibles(), (0, 1, 0))
+		SeatHoldService().release_expired(now=timezone.now() + datetime.timedelta(days=1))
+		self.assertEqual(disponibles(), (1, 1, 0))
+
+		service = ReservaService()
+		reserva = service.crear_reserva({'flight': self.flights[0], 'seat': premium_seat}, self.user)
+		self.assertEqual(disponibles(), (1, 0, 0))
+		service.cambiar_estado_reserva(reserva, 'confirmed')
+		self.assertEqual(disponibles(), (1, 0, 0))
+		service.cambiar_estado_reserva(reserva, 'canceled')
+		self.assertEqual(disponibles(), (1, 1, 0))
+
+	def test_grupo_se_revierte_entero(self):
+		other_seat = Seat.objects.get(number="2B")
+		passenger = Passenger.objects.create(name="Pax", document="P-1", document_type="DNI", email="pax@example.com", phone="", birth_date="1990-01-01")
+		Reservation.objects.create(flight=self.flights[0], passenger=passenger, seat=self.seat, status="canceled", price=1000, reservation_code="CANC0001")
+
+		# Los dos asientos se toman, pero P-1 ya tiene reserva en el vuelo: se revierte todo
+		grupo = [
+			{'seat': self.seat, 'name': "Nuevo", 'document': "P-2", 'document_type': "DNI", 'birth_date': "2010-01-01"},
+			{'seat': other_seat, 'name': "Pax", 'document': "P-1", 'document_type': "DNI", 'birth_date': "1990-01-01"},
+		]
+		with self.assertRaises(ValidationError):
+			ReservaService().crear_reservas_grupo(self.flights[0], grupo, self.user)
+		self.assertEqual(SeatInventoryService().get_inventory(self.flights[0]).seat_status, "A--A")
+		self.assertFalse(Passenger.objects.filter(document="P-2").exists())
+
+		grupo[1]['document'] = "P-3"
+		reservas = ReservaService().crear_reservas_grupo(self.flights[0], grupo, self.user)
+		self.assertEqual([reserva.ticket.status for reserva in reservas], ['issued', 'issued'])
+		self.assertEqual(SeatInventoryService().get_inventory(self.flights[0]).seat_status, "O--O")
+
+	def test_cambios_se_difunden_al_confirmar(self):
+		flight = self.flights[0]
+
+		def reservar():
+			with self.captureOnCommitCallbacks(execute=True):
+				SeatInventoryService().claim(flight, [self.seat], 'reserved')
+
+		async def escuchar():
+			queue = seat_status_broadcaster.subscribe(flight.pk)
+			try:
+				await sync_to_async(reservar)()
+				return await asyncio.wait_for(queue.get(), 1)
+			finally:
+				seat_status_broadcaster.unsubscribe(flight.pk, queue)
+
+		self.assertEqual(async_to_sync(escuchar)(), {'flight': flight.pk, 'seats': {0: 'R'}})
+		self.assertEqual(seat_status_broadcaster.subscriber_count(flight.pk), 0)
+
+	def test_layout_por_cabina_en_bulk(self):
+		cache.clear()
+		airplane = Airplane.objects.create(model="Wide", capacity=50, rows=10, columns=5)
+		flight = Flight.objects.create(
+			airplane=airplane,
+			origin="AEP",
+			destination="MDZ",
+			departure_time=timezone.now() + datetime.timedelta(days=3),
+			arrival_time=timezone.now() + datetime.timedelta(days=3, hours=2),
+			duration=datetime.timedelta(hours=2),
+			base_price=1000
+		)
+		service = SeatLayoutService()
+		SeatMapService().get_seat_map(flight)
+
+		cabin = {
+			'business_rows': service.parse_numbers("1-3"),
+			'premium_rows': service.parse_numbers("4-8"),
+			'aisle_columns': {3},
+			'blocked_seats': service.parse_seats("1b"),
+		}
+		with self.captureOnCommitCallbacks(execute=True):
+			# SAVEPOINT, asientos a borrar, INSERT, el rearmado de los inventarios del avión
+			# (SAVEPOINT, inventarios, holds de otro avión, asientos, reservas, holds, UPDATE
+			# y RELEASE) y RELEASE
+			with self.assertNumQueries(12):
+				seats = service.generate(airplane, **cabin)
+		self.assertEqual(len(seats), 10 * 4 - 1)
+		self.assertEqual(Seat.objects.filter(airplane=airplane, type="business").count(), 11)
+		self.assertEqual(Seat.objects.filter(airplane=airplane, type="premium").count(), 20)
+		self.assertFalse(Seat.objects.filter(airplane=airplane, number__in=["1B", "5C"]).exists())
+
+		seat_map = SeatMapService().get_seat_map(flight)
+		self.assertEqual(seat_map['types'][:10], "B--BBBB-BB")
+		self.assertEqual(seat_map['status'][:5], "A--AA")
+
+	def test_sugerencia_de_asientos_contiguos(self):
+		cache.clear()
+		airplane = Airplane.objects.create(model="Narrow", capacity=16, rows=4, columns=5)
+		SeatLayoutService().generate(airplane, aisle_columns={3})
+		flight = Flight.objects.create(
+			airplane=airplane,
+			origin="AEP",
+			destination="USH",
+			departure_time=timezone.now() + datetime.timedelta(days=3),
+			arrival_time=timezone.now() + datetime.timedelta(days=3, hours=3),
+			duration=datetime.timedelta(hours=3),
+			base_price=1000
+		)
+		service = SeatRecommendationService()
+		seats, contiguous = service.suggest(flight, 2)
+		self.assertEqual([seat.number for seat in seats], ["1A", "1B"])
+		self.assertTrue(contiguous)
+
+		seats = Seat.objects.filter(airplane=airplane)
+		with self.captureOnCommitCallbacks(execute=True):
+			SeatInventoryService().claim(flight, [seats.get(number="1A"), seats.get(number="1D")], 'reserved')
+		# El índice cacheado se actualizó sólo en la fila tocada
+		self.assertEqual(cache.get(service.cache_key(flight.pk))['runs'][0], [('E', 2, 1), ('E', 5, 1)])
+
+		seats, contiguous = service.suggest(flight, 2)
+		self.assertEqual([seat.number for seat in seats], ["2A", "2B"])
+		seats, contiguous = service.suggest(flight, 3)
+		self.assertEqual([seat.number for seat in seats], ["1B", "1E", "2A"])
+		self.assertFalse(contiguous)
+		self.assertIsNone(service.suggest(flight, 15))
+		self.assertIsNone(service.suggest(flight, 1, 'business'))
+
+
+class FlightSearchTest(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.airplane = Airplane.objects.create(model="Embraer E190", capacity=4, rows=2, columns=2)
+		Seat.objects.create(airplane=self.airplane, number="1A", row=1, column=1, type="economy")
+		self.day = timezone.localdate() + datetime.timedelta(days=10)
+
+	def crear_vuelo(self, departure, origin="AEP", destination="COR", **kwargs):
+		return Flight.objects.create(
+			airplane=self.airplane,
+			origin=origin,
+			destination=destination,
+			departure_time=departure,
+			arrival_time=departure + datetime.timedelta(hours=1),
+			duration=datetime.timedelta(hours=1),
+			base_price=kwargs.pop('base_price', 1000),
+			**kwargs
+		)
+
+	def test_rutas_con_nombres_de_ciudad(self):
+		start, _ = FlightSearchService().day_range(self.day)
+		ida = self.crear_vuelo(start + datetime.timedelta(hours=8), origin="Buenos Aires", destination="Córdoba")
+		vuelta = self.crear_vuelo(start + datetime.timedelta(hours=14), origin="Córdoba", destination="Buenos Aires", base_price=500)
+
+		service = FlightSearchService()
+		# Espacios y tildes no llegan a las claves de caché: memcached las rechazaría
+		with warnings.catch_warnings():
+			warnings.simplefilter('error', CacheKeyWarning)
+			self.assertEqual(service.search(" Buenos Aires ", "Córdoba", self.day), [ida])
+			self.assertEqual(service.search("Buenos Aires", "Córdoba", self.day), [ida])
+			itineraries = service.round_trip("Buenos Aires", " Córdoba", self.day, self.day)
+			calendar = service.fare_calendar("Buenos Aires ", "Córdoba", self.day, days=0)
+		self.assertEqual([(itinerary['outbound'], itinerary['return']) for itinerary in itineraries], [(ida, vuelta)])
+		self.assertEqual([(day['date'], day['flights']) for day in calendar], [(self.day, 1)])
+
+	def test_busqueda_por_rango_semiabierto(self):
+		start, end = FlightSearchService().day_range(self.day)
+		self.crear_vuelo(start - datetime.timedelta(seconds=1))
+		primero = self.crear_vuelo(start)
+		ultimo = self.crear_vuelo(end - datetime.timedelta(seconds=1))
+		self.crear_vuelo(end)
+		self.crear_vuelo(start, status="canceled")
+
+		flights = FlightSearchService().search("AEP", "COR", self.day)
+		self.assertEqual(list(flights), [primero, ultimo])
+		self.assertEqual(list(FlightSearchService().search("AEP", "COR", self.day, "business")), [])
+
+		# Con clase, la disponibilidad sale de los contadores del inventario
+		SeatInventoryService().claim(primero, [Seat.objects.get()], 'reserved')
+		flights = FlightSearchService().search("AEP", "COR", self.day, "economy")
+		self.assertEqual(list(flights), [ultimo])
+		self.assertEqual(flights[0].seats_left, 1)
+
+	def test_calendario_de_tarifas_agrupado_y_cacheado(self):
+		cache.clear()
+		start, _ = FlightSearchService().day_range(self.day)
+		self.crear_vuelo(start + datetime.timedelta(hours=8), base_price=1000)
+		self.crear_vuelo(start + datetime.timedelta(hours=20), base_price=800)
+		self.crear_vuelo(start - datetime.timedelta(hours=12), base_price=900)
+		self.crear_vuelo(start + datetime.timedelta(days=2), base_price=500, status="canceled")
+
+		service = FlightSearchService()
+		with self.assertNumQueries(5):
+			# Los inventarios que faltan se crean en bloque: vuelos sin inventario, asientos, reservas e INSERT
+			calendar = service.fare_calendar("AEP", "COR", self.day, days=2)
+		self.assertEqual([day['date'] for day in calendar], [self.day + datetime.timedelta(days=offset) for offset in range(-2, 3)])
+		self.assertEqual([day['lowest_fare'] for day in calendar], [None, Decimal('900.00'), Decimal('800.00'), None, None])
+		self.assertEqual(calendar[2]['flights'], 2)
+
+		with self.assertNumQueries(0):
+			service.fare_calendar("AEP", "COR", self.day, days=2)
+
+	def test_calendario_se_invalida_con_holds_barridos_y_grupos(self):
+		start, _ = FlightSearchService().day_range(self.day)
+		flight = self.crear_vuelo(start + datetime.timedelta(hours=8), base_price=1000)
+		seat = Seat.objects.get()
+		user = User.objects.create_user(username="viajero", email="viajero@example.com", password="x")
+		service = FlightSearchService()
+
+		def tarifa():
+			return service.fare_calendar("AEP", "COR", self.day, days=0)[0]['lowest_fare']
+
+		self.assertEqual(tarifa(), Decimal('1000.00'))
+		with self.captureOnCommitCallbacks(execute=True):
+			SeatHoldService().hold(flight, seat, user)
+		self.assertIsNone(tarifa())
+		with self.captureOnCommitCallbacks(execute=True):
+			SeatHoldService().release_expired(now=timezone.now() + datetime.timedelta(days=1))
+		self.assertEqual(tarifa(), Decimal('1000.00'))
+		with self.captureOnCommitCallbacks(execute=True):
+			ReservaService().crear_reservas_grupo(flight, [
+				{'seat': seat, 'name': "Pax", 'document': "P-1", 'document_type': "DNI", 'birth_date': "1990-01-01"},
+			], user)
+		self.assertIsNone(tarifa())
+
+	def test_ida_y_vuelta_emparejada_y_reservada_en_bloque(self):
+		start, _ = FlightSearchService().day_range(self.day)
+		ida_cara = self.crear_vuelo(start + datetime.timedelta(hours=8), base_price=1000)
+		ida_barata = self.crear_vuelo(start + datetime.timedelta(hours=20), base_price=700)
+		vuelta_temprana = self.crear_vuelo(start + datetime.timedelta(hours=10), origin="COR", destination="AEP", base_price=100)
+		vuelta = self.crear_vuelo(start + datetime.timedelta(days=3), origin="COR", destination="AEP", base_price=600)
+
+		# Ambos tramos salen de una sola consulta y la vuelta temprana sólo combina con la ida que ya llegó
+		with self.assertNumQueries(1):
+			itineraries = FlightSearchService().round_trip("AEP", "COR", self.day, self.day + datetime.timedelta(days=3))
+		self.assertEqual(
+			[(itinerary['outbound'], itinerary['return'], itinerary['total_price']) for itinerary in itineraries],
+			[(ida_barata, vuelta, Decimal('1300.00')), (ida_cara, vuelta, Decimal('1600.00'))]
+		)
+		itineraries = FlightSearchService().round_trip("AEP", "COR", self.day, self.day, "economy")
+		self.assertEqual([(itinerary['outbound'], itinerary['return']) for itinerary in itineraries], [(ida_cara, vuelta_temprana)])
+
+		# Si el asiento de la vuelta ya no está libre, tampoco queda la reserva de la ida
+		user = User.objects.create_user(username="viajero", email="viajero@example.com", password="x")
+		seat = Seat.objects.get()
+		SeatInventoryService().claim(vuelta, [seat], 'occupied')
+		with self.assertRaises(ValidationError):
+			ReservaService().crear_reserva_ida_vuelta({'flight': ida_cara, 'seat': seat}, {'flight': vuelta, 'seat': seat}, user)
+		self.assertFalse(Reservation.objects.exists())
+		self.assertEqual(SeatInventoryService().status_of(ida_cara, seat), 'available')
+
+		ida, regreso = ReservaService().crear_reserva_ida_vuelta({'flight': ida_cara, 'seat': seat}, {'flight': vuelta_temprana, 'seat': seat}, user)
+		self.assertEqual((ida.flight, regreso.flight), (ida_cara, vuelta_temprana))
+		self.assertEqual(SeatInventoryService().status_of(vuelta_temprana, seat), 'occupied')
+
+		# Ids que no son números se rechazan con 400 antes de llegar al ORM
+		self.client.force_login(user)
+		for datos in ({'outbound_id': 'abc', 'return_id': vuelta.id}, {'outbound_id': ida_cara.id}):
+			self.assertEqual(self.client.post(reverse('round_trip_booking'), datos).status_code, 400)
+
+	def test_ida_y_vuelta_cobra_lo_cotizado(self):
+		Seat.objects.create(airplane=self.airplane, number="2A", row=2, column=1, type="premium")
+		start, _ = FlightSearchService().day_range(self.day)
+		ida = self.crear_vuelo(start + datetime.timedelta(hours=8), base_price=Decimal('100.01'))
+		vuelta = self.crear_vuelo(start + datetime.timedelta(days=2), origin="COR", destination="AEP", base_price=Decimal('200.03'))
+		[itinerary] = FlightSearchService().round_trip("AEP", "COR", self.day, self.day + datetime.timedelta(days=2), "premium")
+		self.assertEqual(itinerary['total_price'], Decimal('450.06'))
+
+		user = User.objects.create_user(username="viajero", email="viajero@example.com", password="x")
+		self.client.force_login(user)
+		with tempfile.TemporaryDirectory() as media, self.settings(MEDIA_ROOT=media):
+			self.client.post(reverse('round_trip_booking'), {'outbound_id': ida.id, 'return_id': vuelta.id, 'seat_class': "premium"})
+		reservas = Reservation.objects.filter(passenger__email=user.email).select_related('ticket', 'seat')
+		self.assertEqual(sum(reserva.price for reserva in reservas), itinerary['total_price'])
+		self.assertEqual(
+			sorted((reserva.flight_id, reserva.seat.number, reserva.status, reserva.ticket.status) for reserva in reservas),
+			[(ida.id, "2A", 'confirmed', 'issued'), (vuelta.id, "2A", 'confirmed', 'issued')]
+		)
+
+	def test_conexiones_sobre_el_grafo_de_rutas(self):
+		start, _ = FlightSearchService().day_range(self.day)
+		hora = lambda horas: start + datetime.timedelta(hours=horas)
+		directo = self.crear_vuelo(hora(8), origin="AEP", destination="USH")
+		aep_cor = self.crear_vuelo(hora(8), origin="AEP", destination="COR", base_price=300)
+		cor_ush = self.crear_vuelo(hora(10), origin="COR", destination="USH", base_price=400)
+		# Sale 30 minutos después de la llegada: no alcanza la conexión mínima
+		self.crear_vuelo(hora(9) + datetime.timedelta(minutes=30), origin="COR", destination="USH", base_price=100)
+		aep_mdz = self.crear_vuelo(hora(7), origin="aep ", destination="MDZ", base_price=100)
+		mdz_brc = self.crear_vuelo(hora(9), origin="MDZ", destination="BRC", base_price=100)
+		brc_ush = self.crear_vuelo(hora(11), origin="BRC", destination="USH", base_price=100)
+		route_graph.invalidate()
+
+		conexiones = FlightSearchService().connections("AEP", "USH", self.day)
+		self.assertEqual(
+			[(conexion['flights'], conexion['stops'], conexion['total_price']) for conexion in conexiones],
+			[([aep_mdz, mdz_brc, brc_ush], 2, Decimal('300.00')), ([aep_cor, cor_ush], 1, Decimal('700.00'))]
+		)
+		self.assertNotIn([directo], [conexion['flights'] for conexion in conexiones])
+		self.assertEqual(len(FlightSearchService().connections("AEP", "USH", self.day, max_stops=1)), 1)
+
+		# Los cambios de vuelos actualizan el grafo sin reconstruirlo: sólo se consultan los vuelos elegidos
+		with self.captureOnCommitCallbacks(execute=True):
+			mdz_brc.status = "canceled"
+			mdz_brc.save()
+		with self.assertNumQueries(1):
+			conexiones = FlightSearchService().connections("AEP", "USH", self.day)
+		self.assertEqual([conexion['flights'] for conexion in conexiones], [[aep_cor, cor_ush]])
+
+	def test_cache_de_busquedas_con_invalidacion_precisa(self):
+		start, _ = FlightSearchService().day_range(self.day)
+		vuelo = self.crear_vuelo(start + datetime.timedelta(hours=8))
+		otra_ruta = self.crear_vuelo(start + datetime.timedelta(hours=8), origin="AEP", destination="MDZ")
+		service = FlightSearchService()
+
+		self.assertEqual(service.search(" aep", "cor", self.day, "economy"), [vuelo])
+		# La misma búsqueda normalizada sale de la caché: sólo se leen los vuelos por id
+		with self.assertNumQueries(1):
+			flights = service.search("AEP", "COR", self.day, "economy")
+		self.assertEqual(flights, [vuelo])
+		self.assertEqual(flights[0].seats_left, 1)
+		service.search("AEP", "MDZ", self.day)
+
+		# Un cambio de asientos del vuelo sólo borra las búsquedas que lo incluyen
+		with self.captureOnCommitCallbacks(execute=True):
+			SeatInventoryService().claim(vuelo, [Seat.objects.get()], 'reserved')
+		self.assertIsNone(cache.get(service.search_cache_key(service.search_bucket("AEP", "COR", self.day), "economy")))
+		self.assertIsNotNone(cache.get(service.search_cache_key(service.search_bucket("AEP", "MDZ", self.day), None)))
+		self.assertEqual(service.search("AEP", "COR", self.day, "economy"), [])
+
+		# Un vuelo nuevo invalida las búsquedas de su ruta y día aunque todavía no figure en ellas
+		with self.captureOnCommitCallbacks(execute=True):
+			nuevo = self.crear_vuelo(start + datetime.timedelta(hours=12), origin="AEP", destination="MDZ")
+		self.assertEqual(service.search("AEP", "MDZ", self.day), [otra_ruta, nuevo])
+		self.assertEqual(service.metrics(), {'hits': 1, 'misses': 4, 'hit_ratio': 0.2})
+
+
+class AirportIndexTest(TestCase):
+	def setUp(self):
+		Airport.objects.create(code="COR", name="Aeropuerto Internacional Ingeniero Ambrosio Taravella", city="Córdoba", synonyms="Pajas Blancas")
+		Airport.objects.create(code="CRD", name="Aeropuerto General Mosconi", city="Comodoro Rivadavia")
+		Airport.objects.create(code="IGR", name="Aeropuerto Internacional Cataratas del Iguazú", city="Puerto Iguazú", synonyms="Iguazú, Cataratas")
+		airport_index.build()
+
+	def test_autocompletado_por_prefijo_sin_tildes_ni_base(self):
+		with self.assertNumQueries(0):
+			self.assertEqual([airport['code'] for airport in airport_index.search("CO")], ["COR", "CRD"])
+			self.assertEqual([airport['code'] for airport in airport_index.search("cór")], ["COR"])
+			self.assertEqual([airport['code'] for airport in airport_index.search("iguazu")], ["IGR"])
+			self.assertEqual([airport['code'] for airport in airport_index.search("pajas")], ["COR"])
+			self.assertEqual([airport['code'] for airport in airport_index.search("rivad")], ["CRD"])
+			self.assertEqual(airport_index.search(" "), [])
+		# El código exacto va primero aunque otro aeropuerto empiece igual
+		self.assertEqual([airport['code'] for airport in airport_index.search("crd")], ["CRD"])
+
+		with self.captureOnCommitCallbacks(execute=True):
+			Airport.objects.create(code="MDZ", name="Aeropuerto El Plumerillo", city="Mendoza")
+		self.assertEqual(airport_index.search("mendo"), [{'code': "MDZ", 'name': "Aeropuerto El Plumerillo", 'city': "Mendoza"}])
+
+
+class DestinationCatalogTest(TestCase):
+	def setUp(self):
+		cache.clear()
+		bariloche = Destination.objects.create(name="Bariloche")
+		DestinationImage.objects.create(destination=bariloche, image_url="bariloche.jpg")
+		DestinationImage.objects.create(destination=bariloche, image_url="bariloche-2.jpg")
+		Destination.objects.create(name="Madrid")
+
+	def test_catalogo_cacheado_y_renovado_al_cambiar(self):
+		service = DestinationCatalogService()
+		with self.assertNumQueries(1):
+			catalog = service.catalog()
+		self.assertEqual([(dest['name'], dest['image']) for dest in catalog], [("Bariloche", "bariloche.jpg"), ("Madrid", None)])
+
+		# Con el catálogo en caché, elegir destinos al azar no consulta la base
+		with self.assertNumQueries(0):
+			self.assertEqual(len(service.sample(3)), 2)
+
+		with self.captureOnCommitCallbacks(execute=True):
+			DestinationImage.objects.create(destination=Destination.objects.get(name="Madrid"), image_url="madrid.jpg")
+		self.assertEqual(service.catalog()[1]['image'], "madrid.jpg")
+
+
+class VersionedCacheTest(TestCase):
+	def setUp(self):
+		cache.clear()
+
+	def test_version_sube_con_las_senales_del_modelo(self):
+		clave = versioned_cache.key(['flights'], 'offers', 'hoy')
+		self.assertEqual(versioned_cache.key(['flights'], 'offers', 'hoy'), clave)
+		airplane = Airplane.objects.create(model="Boeing 737", capacity=1, rows=1, columns=1)
+		departure = timezone.now() + datetime.timedelta(days=3)
+		with self.captureOnCommitCallbacks(execute=True):
+			Flight.objects.create(
+				airplane=airplane, origin="AEP", destination="COR", departure_time=departure,
+				arrival_time=departure + datetime.timedelta(hours=1), duration=datetime.timedelta(hours=1), base_price=1000
+			)
+		self.assertNotEqual(versioned_cache.key(['flights'], 'offers', 'hoy'), clave)
+		# Otro espacio de nombres no se entera
+		self.assertEqual(versioned_cache.key(['destinations'], 'catalogo'), versioned_cache.key(['destinations'], 'catalogo'))
+
+	def test_un_solo_calculo_ante_la_estampida(self):
+		calculos = []
+
+		def compute():
+			calculos.append(1)
+			time.sleep(0.2)
+			return ['resultado']
+
+		resultados = []
+		hilos = [
+			threading.Thread(target=lambda: resultados.append(versioned_cache.get_or_compute('estampida', compute, 60)))
+			for _ in range(8)
+		]
+		for hilo in hilos:
+			hilo.start()
+		for hilo in hilos:
+			hilo.join()
+		self.assertEqual(len(calculos), 1)
+		self.assertEqual(resultados, [['resultado']] * 8)
+
+
+class QueryBudgetTest(TestCase):
+	"""Cada listado hace las mismas consultas con 2 filas que con 10: un N+1 rompe estos tests"""
+	def setUp(self):
+		cache.clear()
+		self.admin = User.objects.create_superuser(username="admin", password="adminpass", email="admin@example.com")
+		self.passenger = Passenger.objects.create(
+			name="Admin", document="10000000", document_type="DNI", email="admin@example.com", phone="1", birth_date="1980-01-01"
+		)
+		self.airplane = Airplane.objects.create(model="Airbus A320", capacity=30, rows=10, columns=3)
+		self.flight = self.crear_vuelo(0)
+		self.client.force_login(self.admin)
+
+	def crear_vuelo(self, numero):
+		departure = timezone.now() + datetime.timedelta(days=1, hours=numero)
+		return Flight.objects.create(
+			airplane=self.airplane, origin="AEP", destination="COR", departure_time=departure,
+			arrival_time=departure + datetime.timedelta(hours=1), duration=datetime.timedelta(hours=1), base_price=1000
+		)
+
+	def agregar_filas(self, cantidad):
+		"""Vuelos, asientos, pasajeros, reservas con boleto y bloqueos hasta tener cantidad de cada uno"""
+		while Reservation.objects.filter(flight=self.flight).count() < cantidad:
+			numero = Seat.objects.count() + 1
+			seat = Seat.objects.create(airplane=self.airplane, number=f"{numero}A", row=numero, column=1, type="economy")
+			passenger = Passenger.objects.create(
+				name=f"Pasajero {numero}", document=f"2000{numero}", document_type="DNI",
+				email=f"pasajero{numero}@example.com", phone="1", birth_date="1990-01-01"
+			)
+			reservation = Reservation.objects.create(
+				flight=self.flight, passenger=passenger, seat=seat, price=1000, reservation_code=f"R{numero}"
+			)
+			Ticket.objects.create(reservation=reservation, barcode=f"BC{numero}")
+			flight = self.crear_vuelo(numero)
+			Reservation.objects.create(
+				flight=flight, passenger=self.passenger, seat=seat, price=1000, reservation_code=f"M{numero}"
+			)
+			SeatHold.objects.create(
+				flight=flight, seat=seat, user=self.admin, expires_at=timezone.now() + datetime.timedelta(minutes=10)
+			)
+
+	def test_consultas_fijas_por_listado(self):
+		listados = [
+			(reverse('backoffice:flight_list'), 3),
+			(reverse('backoffice:flight_detail', args=[self.flight.id]), 4),
+			(reverse('backoffice:flight_passengers', args=[self.flight.id]), 10),
+			(reverse('my_flights'), 13),
+			(reverse('admin:app_reservation_changelist'), 7),
+			(reverse('admin:app_ticket_changelist'), 5),
+			(reverse('admin:app_seat_changelist'), 6),
+			(reverse('admin:app_seathold_changelist'), 5),
+		]
+		for cantidad in (2, 10):
+			self.agregar_filas(cantidad)
+			for url, consultas in listados:
+				with self.assertNumQueries(consultas):
+					response = self.client.get(url)
+				self.assertEqual(response.status_code, 200)
+
+
+class ExportTest(TestCase):
+	def setUp(self):
+		self.admin = User.objects.create_superuser(username="admin", password="adminpass", email="admin@example.com")
+		self.client.force_login(self.admin)
+		self.airplane = Airplane.objects.create(model="Airbus A320", capacity=4, rows=2, columns=2)
+		self.seats = [
+			Seat.objects.create(airplane=self.airplane, number="1A", row=1, column=1, type="business"),
+			Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="economy"),
+		]
+		departure = timezone.now() + datetime.timedelta(days=2)
+		self.flight = Flight.objects.create(
+			airplane=self.airplane, origin="AEP", destination="COR", departure_time=departure,
+			arrival_time=departure + datetime.timedelta(hours=1), duration=datetime.timedelta(hours=1), base_price=1000
+		)
+		for numero, seat in enumerate(self.seats):
+			passenger = Passenger.objects.create(
+				name=f"Pasajero {numero}", document=f"3000{numero}", document_type="DNI",
+				email=f"pasajero{numero}@example.com", phone="1", birth_date="1990-01-01"
+			)
+			Reservation.objects.create(flight=self.flight, passenger=passenger, seat=seat, price=1000, reservation_code=f"X{numero}")
+
+	def leer(self, response):
+		self.assertTrue(response.streaming)
+		return b''.join(response.streaming_content).decode()
+
+	def test_manifiesto_en_csv_y_ndjson(self):
+		url = reverse('backoffice:flight_passengers', args=[self.flight.id])
+		lineas = self.leer(self.client.get(url + '?export=csv')).splitlines()
+		self.assertEqual(lineas[0].split(',')[:3], ['ID Reserva', 'Código Reserva', 'Nombre Pasajero'])
+		self.assertEqual([linea.split(',')[7:9] for linea in lineas[1:]], [['1A', 'Business'], ['1B', 'Economy']])
+
+		filas = [json.loads(linea) for linea in self.leer(self.client.get(url + '?export=ndjson')).splitlines()]
+		self.assertEqual([fila['passenger_name'] for fila in filas], ["Pasajero 0", "Pasajero 1"])
+		self.assertEqual(filas[0]['price'], "1000.00")
+		self.assertEqual(self.client.get(url + '?export=xml').status_code, 400)
+
+	def test_reservas_y_horario_en_una_consulta(self):
+		hoy = timezone.localdate()
+		url = reverse('backoffice:reservations_export') + f'?desde={hoy}&hasta={hoy}&format=ndjson'
+		response = self.client.get(url)
+		# Las filas se leen recién al consumir la respuesta, con una sola consulta
+		with self.assertNumQueries(1):
+			filas = [json.loads(linea) for linea in self.leer(response).splitlines()]
+		self.assertEqual([fila['reservation_code'] for fila in filas], ["X0", "X1"])
+
+		ayer = hoy - datetime.timedelta(days=1)
+		self.assertEqual(self.leer(self.client.get(reverse('backoffice:reservations_export') + f'?hasta={ayer}')).count('\n'), 1)
+		self.assertEqual(self.client.get(reverse('backoffice:reservations_export') + '?desde=2025-02-30').status_code, 400)
+
+		lineas = self.leer(self.client.get(reverse('backoffice:flights_export'))).splitlines()
+		self.assertEqual(len(lineas), 2)
+		self.assertIn("Airbus A320", lineas[1])
+
+	def test_exportacion_no_acumula_filas(self):
+		columns, rows = ExportService().flights()
+		self.assertNotIsInstance(rows, list)
+		self.assertEqual(next(rows)[0], self.flight.id)
+
+class ConditionalGetTest(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.user = User.objects.create_user(username="cliente", password="clientepass", email="cliente@example.com")
+		self.client.force_login(self.user)
+		self.airplane = Airplane.objects.create(model="Embraer 190", capacity=4, rows=2, columns=2)
+		self.seats = [
+			Seat.objects.create(airplane=self.airplane, number="1A", row=1, column=1, type="economy"),
+			Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="economy"),
+		]
+		departure = timezone.now() + datetime.timedelta(days=1)
+		self.flight = Flight.objects.create(
+			airplane=self.airplane, origin="AEP", destination="BRC", departure_time=departure,
+			arrival_time=departure + datetime.timedelta(hours=2), duration=datetime.timedelta(hours=2), base_price=1000
+		)
+
+	def revalidar(self, url, etag, estado):
+		response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+		self.assertEqual(response.status_code, estado)
+		return response
+
+	def test_mapa_de_asientos_responde_304_hasta_que_cambia(self):
+		url = reverse('seat_map', args=[self.flight.id])
+		etag = self.client.get(url)['ETag']
+		# Sesión, usuario, vuelo y la versión del inventario: el mapa sale de la caché
+		with self.assertNumQueries(4):
+			response = self.revalidar(url, etag, 304)
+		self.assertEqual(response['ETag'], etag)
+		self.assertEqual(response.content, b'')
+
+		with self.captureOnCommitCallbacks(execute=True):
+			SeatInventoryService().claim(self.flight, [self.seats[0]], 'reserved')
+		response = self.revalidar(url, etag, 200)
+		self.assertEqual(response.json()['status'][0], 'R')
+
+		# Un cambio de tipo de asiento no toca el inventario pero sí el mapa
+		etag = response['ETag']
+		with self.captureOnCommitCallbacks(execute=True):
+			self.seats[1].type = "business"
+			self.seats[1].save()
+		self.assertEqual(self.revalidar(url, etag, 200).json()['types'][1], 'B')
+
+	def test_ofertas_responden_304_hasta_que_cambia_un_vuelo(self):
+		url = reverse('offers')
+		response = self.client.get(url)
+		self.assertContains(response, "BRC")
+		etag = response['ETag']
+		self.revalidar(url, etag, 304)
+
+		with self.captureOnCommitCallbacks(execute=True):
+			self.flight.base_price = 800
+			self.flight.save()
+		self.assertContains(self.revalidar(url, etag, 200), "800")
+
+		# Otro usuario no reusa la página
+		self.client.force_login(User.objects.create_user(username="otro", password="otropass"))
+		self.revalidar(url, etag, 200)
+
+class CanceledReservationSeatTest(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.user = User.objects.create_user(username="viajero", password="viajeropass", email="viajero@example.com")
+		self.client.force_login(self.user)
+		self.airplane = Airplane.objects.create(model="Embraer 190", capacity=4, rows=2, columns=2)
+		self.seats = [
+			Seat.objects.create(airplane=self.airplane, number="1A", row=1, column=1, type="economy"),
+			Seat.objects.create(airplane=self.airplane, number="1B", row=1, column=2, type="economy"),
+		]
+		departure = timezone.now() + datetime.timedelta(days=1)
+		self.flight = Flight.objects.create(
+			airplane=self.airplane, origin="AEP", destination="BRC", departure_time=departure,
+			arrival_time=departure + datetime.timedelta(hours=2), duration=datetime.timedelta(hours=2), base_price=1000
+		)
+		self.passenger = Passenger.objects.create(
+			name="Viajero", document="40000001", document_type="DNI",
+			email=self.user.email, phone="1", birth_date="1990-01-01"
+		)
+		otro = Passenger.objects.create(
+			name="Otro", document="40000002", document_type="DNI",
+			email="otro@example.com", phone="1", birth_date="1990-01-01"
+		)
+		# La reserva cancelada dejó el asiento 1A, que se vendió a otro pasajero
+		self.canceled = Reservation.objects.create(
+			flight=self.flight, passenger=self.passenger, seat=self.seats[0], price=1000,
+			status="canceled", reservation_code="CANC1"
+		)
+		Reservation.objects.create(
+			flight=self.flight, passenger=otro, seat=self.seats[0], price=1000,
+			status="confirmed", reservation_code="VEND1"
+		)
+		self.service = SeatInventoryService()
+
+	def test_borrar_reserva_cancelada_no_libera_el_asiento_revendido(self):
+		self.client.post(reverse('delete_reservation', args=[self.canceled.id]))
+		self.assertFalse(Reservation.objects.filter(id=self.canceled.id).exists())
+		inventory = self.service.get_inventory(self.flight)
+		self.assertEqual(inventory.status_of(self.seats[0]), 'occupied')
+		self.assertEqual(inventory.available_economy, 1)
+
+	def test_reserva_cancelada_cuenta_como_ninguna(self):
+		# Elegir asiento no mueve la reserva cancelada: bloquea el asiento como una reserva nueva
+		self.client.post(reverse('seat_selection', args=[self.flight.id]), {'seat_id': self.seats[1].id})
+		self.canceled.refresh_from_db()
+		self.assertEqual(self.canceled.seat, self.seats[0])
+		self.assertTrue(SeatHold.objects.filter(flight=self.flight, seat=self.seats[1], user=self.user).exists())
+
+		with tempfile.TemporaryDirectory() as media, self.settings(MEDIA_ROOT=media):
+			self.client.post(reverse('finalize_reservation', args=[self.flight.id]), {'seat_id': self.seats[1].id})
+		reserva = Reservation.objects.get(flight=self.flight, passenger=self.passenger)
+		self.assertEqual((reserva.seat, reserva.status), (self.seats[1], 'confirmed'))
+		self.assertEqual(self.service.status_of(self.flight, self.seats[0]), 'occupied')
+		self.assertEqual(self.service.status_of(self.flight, self.seats[1]), 'occupied')
+
+
+class SeatLayoutChangeTest(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.admin = User.objects.create_superuser(username="admin", password="adminpass", email="admin@example.com")
+		self.user = User.objects.create_user(username="viajero", password="viajeropass", email="viajero@example.com")
+		self.airplane = Airplane.objects.create(model="Embraer 190", capacity=4, rows=2, columns=2)
+		self.seat = Seat.objects.create(airplane=self.airplane, number="1A", row=1, column=1, type="economy")
+		self.premium = Seat.objects.create(airplane=self.airplane, number="2B", row=2, column=2, type="premium")
+		departure = timezone.now() + datetime.timedelta(days=1)
+		self.flight = Flight.objects.create(
+			airplane=self.airplane, origin="AEP", destination="BRC", departure_time=departure,
+			arrival_time=departure + datetime.timedelta(hours=2), duration=datetime.timedelta(hours=2), base_price=1000
+		)
+		self.service = SeatInventoryService()
+		# El inventario ya existe y el 1A está bloqueado por un hold
+		SeatHoldService().hold(self.flight, self.seat, self.user)
+		SeatMapService().get_seat_map(self.flight)
+
+	def disponibles(self):
+		inventory = self.service.get_inventory(self.flight)
+		return inventory.available_economy, inventory.available_premium, inventory.available_business
+
+	def test_alta_cambio_y_baja_de_asientos_desde_el_backoffice(self):
+		self.client.force_login(self.admin)
+		with self.captureOnCommitCallbacks(execute=True):
+			self.client.post(
+				reverse('backoffice:seat_management', args=[self.airplane.id]),
+				{'number': "3A", 'row': 3, 'column': 1, 'type': "business"}
+			)
+		seat_map = SeatMapService().get_seat_map(self.flight)
+		self.assertEqual((seat_map['rows'], seat_map['types'], seat_map['status']), (3, "E--PB-", "R--AA-"))
+		self.assertEqual(self.disponibles(), (0, 1, 1))
+
+		with self.captureOnCommitCallbacks(execute=True):
+			self.client.post(
+				reverse('backoffice:seat_update', args=[self.premium.id]),
+				{'number': "2B", 'row': 2, 'column': 2, 'type': "economy"}
+			)
+		self.assertEqual(self.disponibles(), (1, 0, 1))
+
+		with self.captureOnCommitCallbacks(execute=True):
+			self.client.post(reverse('backoffice:seat_delete', args=[Seat.objects.get(number="3A").id]))
+		self.assertEqual(self.service.get_inventory(self.flight).seat_status, "R--A")
+		self.assertEqual(self.disponibles(), (1, 0, 0))
+
+		self.client.force_login(self.user)
+		self.assertEqual(self.client.get(reverse('seat_selection', args=[self.flight.id])).status_code, 200)
+
+	def test_cambio_de_avion_toma_el_nuevo_layout(self):
+		otro = Airplane.objects.create(model="ATR 72", capacity=3, rows=1, columns=3)
+		nuevos = [
+			Seat.objects.create(airplane=otro, number=f"1{letra}", row=1, column=columna, type="economy")
+			for columna, letra in enumerate("ABC", start=1)
+		]
+		with self.captureOnCommitCallbacks(execute=True):
+			FlightService().update_flight(self.flight, {'airplane': otro})
+		self.assertEqual(self.service.status_of(self.flight, nuevos[2]), 'available')
+		self.assertEqual(SeatMapService().get_seat_map(self.flight)['ids'], [seat.id for seat in nuevos])
+		self.assertEqual(self.disponibles(), (3, 0, 0))
+		# El hold era sobre un asiento del avión anterior
+		self.assertFalse(SeatHold.objects.exists())
+
+		# Por lote, sin señales, también se rearma
+		FlightService().bulk_update_flights([(0, self.flight, {'airplane': self.airplane})])
+		self.assertEqual(self.service.get_inventory(self.flight).seat_status, "A--A")
+
+		ReservaService().crear_reserva({'flight': self.flight, 'seat': self.seat}, self.user)
+		with self.assertRaises(ValidationError):
+			FlightService().update_flight(self.flight, {'airplane': otro})
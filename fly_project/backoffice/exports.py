@@ -0,0 +1,42 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Echo:
+    """Archivo que devuelve lo que se le escribe: csv.writer arma cada línea sin acumularlas"""
+    def write(self, value):
+        return value
+
+
+def csv_lines(columns, rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow([header for _, header in columns])
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def ndjson_lines(columns, rows):
+    keys = [key.replace('__', '_') for key, _ in columns]
+    for row in rows:
+        yield json.dumps(dict(zip(keys, row)), cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def streaming_export(columns, rows, export_format, name):
+    """
+    Respuesta que se escribe a medida que se leen las filas: la memoria no
+    depende de cuántas sean. export_format es 'csv' o 'ndjson'
+    """
+    lines = csv_lines(columns, rows) if export_format == 'csv' else ndjson_lines(columns, rows)
+    response = StreamingHttpResponse(lines, content_type=FORMATS[export_format])
+    filename = f"{name}_{timezone.now().strftime('%Y%m%d')}.{export_format}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
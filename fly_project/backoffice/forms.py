@@ -1,5 +1,6 @@
 from django import forms
 from app.models import Airplane, Flight, Seat
+from app.services import SeatLayoutService
 from datetime import timedelta
 
 class AirplaneForm(forms.ModelForm):
@@ -73,6 +74,12 @@ class FlightForm(forms.ModelForm):
         if departure_time and arrival_time:
             if arrival_time <= departure_time:
                 raise forms.ValidationError("La hora de llegada debe ser posterior a la hora de salida.")
+
+        # Las reservas activas tienen asientos del avión actual
+        airplane = cleaned_data.get('airplane')
+        if (self.instance.pk and airplane and airplane.pk != self.instance.airplane_id
+                and self.instance.reservations.exclude(status='canceled').exists()):
+            raise forms.ValidationError("No se puede cambiar el avión de un vuelo con reservas activas.")
         
         duration_hours = cleaned_data.get('duration_hours', 0)
         duration_minutes = cleaned_data.get('duration_minutes', 0)
@@ -94,18 +101,81 @@ class FlightForm(forms.ModelForm):
 class SeatForm(forms.ModelForm):
     class Meta:
         model = Seat
-        fields = ['number', 'row', 'column', 'type', 'status']
+        fields = ['number', 'row', 'column', 'type']
         widgets = {
             'number': forms.TextInput(attrs={'class': 'form-control'}),
             'row': forms.NumberInput(attrs={'class': 'form-control', 'min': 1}),
             'column': forms.NumberInput(attrs={'class': 'form-control', 'min': 1}),
             'type': forms.Select(attrs={'class': 'form-control'}),
-            'status': forms.Select(attrs={'class': 'form-control'}),
         }
         labels = {
             'number': 'Número de asiento',
             'row': 'Fila',
             'column': 'Columna',
             'type': 'Tipo',
-            'status': 'Estado',
-        }
\ No newline at end of file
+        }
+class SeatLayoutForm(forms.Form):
+    seat_type = forms.ChoiceField(
+        choices=Seat.SEAT_TYPES,
+        initial=SeatLayoutService.DEFAULT_CABIN['default_type'],
+        label='Tipo de asiento por defecto',
+        widget=forms.Select(attrs={'class': 'form-control'}),
+    )
+    business_rows = forms.CharField(
+        required=False,
+        initial=SeatLayoutService.DEFAULT_CABIN['business_rows'],
+        label='Filas Business',
+        widget=forms.TextInput(attrs={'class': 'form-control', 'placeholder': '1-3'}),
+    )
+    premium_rows = forms.CharField(
+        required=False,
+        initial=SeatLayoutService.DEFAULT_CABIN['premium_rows'],
+        label='Filas Premium',
+        widget=forms.TextInput(attrs={'class': 'form-control', 'placeholder': '4-8'}),
+    )
+    aisle_columns = forms.CharField(
+        required=False,
+        label='Columnas de pasillo',
+        widget=forms.TextInput(attrs={'class': 'form-control', 'placeholder': '4'}),
+    )
+    blocked_seats = forms.CharField(
+        required=False,
+        label='Asientos bloqueados',
+        widget=forms.TextInput(attrs={'class': 'form-control', 'placeholder': '1B, 12C'}),
+    )
+
+    def clean_numbers(self, field):
+        try:
+            return SeatLayoutService().parse_numbers(self.cleaned_data.get(field))
+        except ValueError:
+            raise forms.ValidationError("Use números o rangos separados por coma, por ejemplo 1-3, 7.")
+
+    def clean_business_rows(self):
+        return self.clean_numbers('business_rows')
+
+    def clean_premium_rows(self):
+        return self.clean_numbers('premium_rows')
+
+    def clean_aisle_columns(self):
+        return self.clean_numbers('aisle_columns')
+
+    def clean_blocked_seats(self):
+        return SeatLayoutService().parse_seats(self.cleaned_data.get('blocked_seats'))
+
+    def clean(self):
+        cleaned_data = super().clean()
+        business_rows = cleaned_data.get('business_rows')
+        premium_rows = cleaned_data.get('premium_rows')
+        if business_rows and premium_rows and business_rows & premium_rows:
+            raise forms.ValidationError("Una fila no puede ser Business y Premium a la vez.")
+        return cleaned_data
+
+    def cabin(self):
+        """Definición de cabina para SeatLayoutService.generate"""
+        return {
+            'business_rows': self.cleaned_data['business_rows'],
+            'premium_rows': self.cleaned_data['premium_rows'],
+            'aisle_columns': self.cleaned_data['aisle_columns'],
+            'blocked_seats': self.cleaned_data['blocked_seats'],
+            'default_type': self.cleaned_data['seat_type'],
+        }
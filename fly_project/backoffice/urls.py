@@ -32,4 +32,8 @@ urlpatterns = [
     # Statistics URLs
     path('statistics/flights/', views.flight_statistics, name='flight_statistics'),
     path('statistics/reservations/', views.reservation_statistics, name='reservation_statistics'),
+
+    # Export URLs
+    path('exports/reservations/', views.reservations_export, name='reservations_export'),
+    path('exports/flights/', views.flights_export, name='flights_export'),
 ]
\ No newline at end of file
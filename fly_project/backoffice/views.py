@@ -1,14 +1,17 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import user_passes_test
 from django.contrib import messages
+from django.db.models import ProtectedError
 from django.urls import reverse_lazy
 from django.utils.decorators import method_decorator
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView, DetailView, TemplateView
 from app.models import Airplane, Flight, Seat, Reservation, Ticket, Passenger, Destination, DestinationImage
-from .forms import AirplaneForm, FlightForm, SeatForm
-import csv
-from django.http import HttpResponse
+from app.services import DestinationCatalogService, ExportService, FlightSearchService, SeatLayoutService
+from .exports import FORMATS, streaming_export
+from .forms import AirplaneForm, FlightForm, SeatForm, SeatLayoutForm
+from django.http import HttpResponse, HttpResponseBadRequest
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from datetime import datetime
 import io
 
@@ -84,7 +87,7 @@ class AirplaneDetailView(DetailView):
 # Vistas para Vuelos (Flight)
 @method_decorator(superuser_required, name='dispatch')
 class FlightListView(ListView):
-    model = Flight
+    queryset = Flight.objects.select_related('airplane')
     template_name = 'backoffice/flight_list.html'
     context_object_name = 'flights'
 
@@ -122,13 +125,13 @@ class FlightDeleteView(DeleteView):
 
 @method_decorator(superuser_required, name='dispatch')
 class FlightDetailView(DetailView):
-    model = Flight
+    queryset = Flight.objects.select_related('airplane')
     template_name = 'backoffice/flight_detail.html'
     context_object_name = 'flight'
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['reservations'] = Reservation.objects.filter(flight=self.object)
+        context['reservations'] = Reservation.objects.filter(flight=self.object).select_related('passenger', 'seat')
         return context
 
 class PopularDestinationsView(TemplateView):
@@ -138,14 +141,11 @@ class PopularDestinationsView(TemplateView):
         context = super().get_context_data(**kwargs)
         context['destinations'] = [
             {
-                "name": dest.name,
-                "image": img.image_url if img else "img/default.jpg"
+                "name": dest['name'],
+                "image": dest['image'] or "img/default.jpg"
             }
-            for dest in Destination.objects.all()
-            for img in [dest.images.first()]
+            for dest in DestinationCatalogService().catalog()
         ]
-
-        print(context['destinations'])  # Debugging line to check the context data
         return context
 
 # Vistas para Asientos (Seat)
@@ -204,31 +204,19 @@ def generate_seats(request, airplane_id):
     airplane = get_object_or_404(Airplane, id=airplane_id)
     
     if request.method == 'POST':
-        # Eliminar asientos existentes
-        Seat.objects.filter(airplane=airplane).delete()
-        
-        # Obtener parámetros del formulario
-        rows = airplane.rows
-        cols = airplane.columns
-        seat_type = request.POST.get('seat_type', 'economy')
-        
-        # Generar asientos
-        for row in range(1, rows + 1):
-            for col in range(1, cols + 1):
-                seat_number = f"{row}{chr(64 + col)}"  # 1A, 1B, etc.
-                Seat.objects.create(
-                    airplane=airplane,
-                    number=seat_number,
-                    row=row,
-                    column=col,
-                    type=seat_type,
-                    status='available'
-                )
-        
-        messages.success(request, f"Se generaron {rows * cols} asientos exitosamente.")
-        return redirect('backoffice:seat_management', airplane_id=airplane_id)
+        form = SeatLayoutForm(request.POST)
+        if form.is_valid():
+            try:
+                seats = SeatLayoutService().generate(airplane, **form.cabin())
+            except ProtectedError:
+                messages.error(request, "No se puede regenerar el layout: hay reservas sobre asientos de este avión.")
+                return redirect('backoffice:seat_management', airplane_id=airplane_id)
+            messages.success(request, f"Se generaron {len(seats)} asientos exitosamente.")
+            return redirect('backoffice:seat_management', airplane_id=airplane_id)
+    else:
+        form = SeatLayoutForm()
     
-    return render(request, 'backoffice/generate_seats.html', {'airplane': airplane})
+    return render(request, 'backoffice/generate_seats.html', {'airplane': airplane, 'form': form})
 
 # Vistas para informes y estadísticas
 @superuser_required
@@ -275,48 +263,13 @@ def flight_passengers(request, flight_id):
     flight = get_object_or_404(Flight, id=flight_id)
     reservations = Reservation.objects.filter(flight=flight).select_related('passenger', 'seat')
     
-    # Verificar si se solicita exportar como CSV
-    if 'export' in request.GET:
-        # Crear un archivo CSV en memoria
-        buffer = io.StringIO()
-        writer = csv.writer(buffer)
-        
-        # Escribir encabezados
-        writer.writerow([
-            'ID Reserva', 
-            'Código Reserva', 
-            'Nombre Pasajero', 
-            'Documento', 
-            'Tipo de Documento', 
-            'Email', 
-            'Teléfono', 
-            'Asiento', 
-            'Clase', 
-            'Precio'
-        ])
-        
-        # Escribir datos
-        for r in reservations:
-            writer.writerow([
-                r.id,
-                r.reservation_code,
-                r.passenger.name,
-                r.passenger.document,
-                r.passenger.document_type,
-                r.passenger.email,
-                r.passenger.phone,
-                r.seat.number,
-                r.seat.get_type_display(),
-                r.price
-            ])
-        
-        # Crear respuesta HTTP con el CSV
-        response = HttpResponse(buffer.getvalue(), content_type='text/csv')
-        current_date = timezone.now().strftime('%Y%m%d')
-        filename = f"pasajeros_vuelo_{flight.id}_{current_date}.csv"
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        
-        return response
+    # Exportar el listado (?export=csv o ?export=ndjson) sin armarlo en memoria
+    export_format = request.GET.get('export')
+    if export_format:
+        if export_format not in FORMATS:
+            return HttpResponseBadRequest(f"Formato no válido. Opciones: {list(FORMATS)}")
+        columns, rows = ExportService().manifest(flight)
+        return streaming_export(columns, rows, export_format, f"pasajeros_vuelo_{flight.id}")
         
     # Estadísticas
     stats = {
@@ -442,4 +395,46 @@ def flight_passengers_pdf(request, flight_id):
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     response.write(pdf_value)
     
-    return response
\ No newline at end of file
+    return response
+
+def export_range(request):
+    """
+    Rango [inicio, fin) de ?desde=AAAA-MM-DD&hasta=AAAA-MM-DD, ambos días
+    incluidos y opcionales. Lanza ValueError si alguna fecha no es válida
+    """
+    start = end = None
+    for param in ('desde', 'hasta'):
+        if not request.GET.get(param):
+            continue
+        day = parse_date(request.GET[param])
+        if day is None:
+            raise ValueError(request.GET[param])
+        day_start, day_end = FlightSearchService().day_range(day)
+        if param == 'desde':
+            start = day_start
+        else:
+            end = day_end
+    return start, end
+
+
+def range_export(request, export, name):
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in FORMATS:
+        return HttpResponseBadRequest(f"Formato no válido. Opciones: {list(FORMATS)}")
+    try:
+        start, end = export_range(request)
+    except ValueError:
+        return HttpResponseBadRequest("Fechas no válidas: use desde y hasta con formato AAAA-MM-DD")
+    columns, rows = export(start, end)
+    return streaming_export(columns, rows, export_format, name)
+
+
+# Exportaciones completas en CSV o NDJSON (?format=ndjson), escritas a medida que se leen
+@superuser_required
+def reservations_export(request):
+    return range_export(request, ExportService().reservations, "reservas")
+
+
+@superuser_required
+def flights_export(request):
+    return range_export(request, ExportService().flights, "vuelos")
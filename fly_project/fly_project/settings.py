@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -105,6 +106,12 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Las reservas toman el lock de escritura al abrir la transacción:
+        # con el modo diferido, dos reservas concurrentes fallan con "database is locked"
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
     }
 }
 
@@ -160,6 +167,35 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 # Default primary key field type
 
+# Tiempo que un asiento queda bloqueado en la selección antes de liberarse (segundos)
+SEAT_HOLD_TTL_SECONDS = 600
+
+# Caché: el backend se elige con CACHE_BACKEND (locmem, file, memcached o redis)
+# y CACHE_LOCATION. Con varios workers conviene file, memcached o redis, que se
+# comparten entre procesos; locmem es por proceso y sus invalidaciones no llegan
+# a los demás (el mapa de asientos igual se valida contra la base). memcached necesita pymemcache
+# y redis el paquete redis, que no están en requeriments.txt
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'volando-ando'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', str(BASE_DIR / '.cache')),
+    'memcached': ('django.core.cache.backends.memcached.PyMemcacheCache', '127.0.0.1:11211'),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
+}
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ValueError(f"CACHE_BACKEND desconocido: {CACHE_BACKEND}. Opciones: {', '.join(CACHE_BACKENDS)}")
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND][0],
+        'LOCATION': os.environ.get('CACHE_LOCATION', CACHE_BACKENDS[CACHE_BACKEND][1]),
+        # Todas las claves del proyecto quedan bajo este prefijo; subir CACHE_VERSION descarta la caché entera
+        'KEY_PREFIX': 'volando',
+        'VERSION': int(os.environ.get('CACHE_VERSION', 1)),
+        'TIMEOUT': 300,
+    }
+}
+
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -169,7 +205,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 2,
+    'PAGE_SIZE': 50,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from app.models import Airplane, Flight, Passenger, Seat, Reservation, Ticket, Destination, DestinationImage
+from app.models import Airplane, Flight, Passenger, Seat, SeatHold, Reservation, Ticket, Destination, DestinationImage
 
 @admin.register(Airplane)
 class AirplaneAdmin(admin.ModelAdmin):
@@ -21,18 +21,27 @@ class PassengerAdmin(admin.ModelAdmin):
 
 @admin.register(Seat)
 class SeatAdmin(admin.ModelAdmin):
-    list_display = ('number', 'row', 'column', 'type', 'status', 'get_airplane_model')
-    list_filter = ('status', 'type', 'airplane__model')
+    list_display = ('number', 'row', 'column', 'type', 'get_airplane_model')
+    list_filter = ('type', 'airplane__model')
+    list_select_related = ('airplane',)
     search_fields = ('number',)
 
     def get_airplane_model(self, obj):
         return obj.airplane.model
     get_airplane_model.short_description = 'Airplane Model'
 
+@admin.register(SeatHold)
+class SeatHoldAdmin(admin.ModelAdmin):
+    list_display = ('seat', 'flight', 'user', 'created_at', 'expires_at')
+    list_filter = ('expires_at',)
+    list_select_related = ('seat__airplane', 'flight', 'user')
+    search_fields = ('user__username', 'seat__number')
+
 @admin.register(Reservation)
 class ReservationAdmin(admin.ModelAdmin):
     list_display = ('reservation_code', 'get_flight_info', 'get_passenger_name', 'status', 'reservation_date', 'price')
     list_filter = ('status', 'reservation_date', 'flight__origin', 'flight__destination')
+    list_select_related = ('flight', 'passenger')
     search_fields = ('reservation_code', 'passenger__name', 'flight__origin', 'flight__destination')
 
     def get_flight_info(self, obj):
@@ -47,6 +56,7 @@ class ReservationAdmin(admin.ModelAdmin):
 class TicketAdmin(admin.ModelAdmin):
     list_display = ('barcode', 'get_passenger', 'get_flight', 'issue_date', 'status')
     list_filter = ('status', 'issue_date')
+    list_select_related = ('reservation__flight', 'reservation__passenger')
     search_fields = ('barcode', 'reservation__reservation_code')
 
     def get_passenger(self, obj):
@@ -68,3 +78,4 @@ class DestinationImageAdmin(admin.ModelAdmin):
     list_display = ('id', 'destination', 'image_url')
     search_fields = ('image_url',)
     list_filter = ('destination',)
+    list_select_related = ('destination',)
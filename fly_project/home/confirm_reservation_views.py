@@ -2,7 +2,9 @@ from django.contrib.auth.decorators import login_required
 from django.utils.decorators import method_decorator
 from django.shortcuts import redirect, get_object_or_404, render
 from django.contrib import messages
+from django.db import transaction
 from app.models import Flight, Seat, Passenger, Reservation, Ticket
+from app.services import SeatHoldService, SeatInventoryService
 from django.views import View
 from django.conf import settings
 import random
@@ -24,12 +26,17 @@ class ConfirmReservationView(View):
             return redirect('seat_selection', flight_id=flight_id)
             
         flight = get_object_or_404(Flight, id=flight_id, status='scheduled')
-        seat = get_object_or_404(Seat, id=seat_id, status='reserved')
+        seat = get_object_or_404(Seat, id=seat_id)
         
         # Verificar que el asiento pertenezca al avión del vuelo
         if seat.airplane != flight.airplane:
             messages.error(request, "El asiento seleccionado no pertenece a este vuelo.")
             return redirect('seat_selection', flight_id=flight_id)
+
+        # Verificar que el asiento esté reservado en este vuelo
+        if SeatInventoryService().status_of(flight, seat) != 'reserved':
+            messages.error(request, "El asiento seleccionado ya no está disponible.")
+            return redirect('seat_selection', flight_id=flight_id)
             
         passenger = Passenger.objects.filter(email=request.user.email).first()
         if passenger and Reservation.objects.filter(flight=flight, passenger=passenger).exists():
@@ -37,6 +44,10 @@ class ConfirmReservationView(View):
             if reservation.seat.id != seat.id:
                 messages.error(request, "Ya tienes una reserva para este vuelo con un asiento diferente.")
                 return redirect('my_flights')
+        elif not SeatHoldService().get_hold(flight, seat, request.user):
+            # El asiento está bloqueado por otro usuario o el bloqueo ya venció
+            messages.error(request, "El asiento seleccionado ya no está disponible.")
+            return redirect('seat_selection', flight_id=flight_id)
             
         # Definir el precio basado en el tipo de asiento
         price = flight.base_price
@@ -62,10 +73,12 @@ class FinalizeReservationView(View):
             messages.error(request, "No se ha seleccionado un asiento.")
             return redirect('seat_selection', flight_id=flight_id)
             
-        seat = get_object_or_404(Seat, id=seat_id)
+        seat = get_object_or_404(Seat, id=seat_id, airplane=flight.airplane)
+        inventory_service = SeatInventoryService()
+        hold_service = SeatHoldService()
         
-        # Verificar que el asiento esté disponible o reservado
-        if seat.status not in ['available', 'reserved']:
+        # Verificar que el asiento esté disponible o reservado en este vuelo
+        if inventory_service.status_of(flight, seat) not in ['available', 'reserved']:
             messages.error(request, "El asiento seleccionado ya no está disponible.")
             return redirect('seat_selection', flight_id=flight_id)
             
@@ -80,43 +93,48 @@ class FinalizeReservationView(View):
             }
         )
         
-        # Verificar si ya existe una reserva
-        existing_reservation = Reservation.objects.filter(flight=flight, passenger=passenger).first()
+        # Verificar si ya existe una reserva; una cancelada no tiene asiento y cuenta como ninguna
+        existing_reservation = Reservation.objects.filter(
+            flight=flight, passenger=passenger
+        ).exclude(status='canceled').first()
         if existing_reservation:
             # Si la reserva es para un asiento diferente, actualizarla
             if existing_reservation.seat.id != seat.id:
-                # Liberar el antiguo asiento
-                old_seat = existing_reservation.seat
-                old_seat.status = 'available'
-                old_seat.save()
-                
-                # Actualizar la reserva con el nuevo asiento
-                existing_reservation.seat = seat
-                existing_reservation.save()
-                
-                # Actualizar el boleto si existe
-                if hasattr(existing_reservation, 'ticket'):
-                    ticket = existing_reservation.ticket
-                else:
-                    # Generar código de barras para el boleto
-                    barcode = ''.join(random.choices(string.ascii_uppercase + string.digits, k=12))
-                    while Ticket.objects.filter(barcode=barcode).exists():
-                        barcode = ''.join(random.choices(string.ascii_uppercase + string.digits, k=12))
-                    
-                    # Crear boleto
-                    ticket = Ticket.objects.create(
-                        reservation=existing_reservation,
-                        barcode=barcode,
-                        status="issued"
+                with transaction.atomic():
+                    # Tomar el nuevo asiento de forma atómica; uno reservado sólo si el hold del usuario sigue vigente
+                    claimable = ('available', 'reserved') if hold_service.convert(flight, seat, request.user) else ('available',)
+                    if not inventory_service.claim(flight, [seat], 'occupied', from_statuses=claimable):
+                        messages.error(request, "El asiento seleccionado ya no está disponible.")
+                        return redirect('seat_selection', flight_id=flight_id)
+
+                    # Liberar el antiguo asiento, sólo si sigue siendo de esta reserva
+                    inventory_service.claim(
+                        flight, [existing_reservation.seat], 'available', from_statuses=('reserved', 'occupied')
                     )
+                    
+                    # Actualizar la reserva con el nuevo asiento
+                    existing_reservation.seat = seat
+                    existing_reservation.save()
+                    
+                    # Actualizar el boleto si existe
+                    if hasattr(existing_reservation, 'ticket'):
+                        ticket = existing_reservation.ticket
+                    else:
+                        # Generar código de barras para el boleto
+                        barcode = ''.join(random.choices(string.ascii_uppercase + string.digits, k=12))
+                        while Ticket.objects.filter(barcode=barcode).exists():
+                            barcode = ''.join(random.choices(string.ascii_uppercase + string.digits, k=12))
+                        
+                        # Crear boleto
+                        ticket = Ticket.objects.create(
+                            reservation=existing_reservation,
+                            barcode=barcode,
+                            status="issued"
+                        )
                 
                 # Generar PDF del boleto
                 generate_ticket_pdf(existing_reservation)
                 
-                # Marcar el asiento como ocupado
-                seat.status = 'occupied'
-                seat.save()
-                
                 messages.success(request, "Tu reserva ha sido actualizada exitosamente.")
                 return render(request, 'confirm_reservation.html', {
                     'reservation': existing_reservation,
@@ -138,31 +156,40 @@ class FinalizeReservationView(View):
         elif seat.type == 'business':
             price = flight.base_price * Decimal('2.0')
             
-        # Crear la reserva
-        reservation = Reservation.objects.create(
-            flight=flight,
-            passenger=passenger,
-            seat=seat,
-            status='confirmed',
-            price=price,
-            reservation_code=code
-        )
-        
-        # Actualizar el estado del asiento
-        seat.status = 'occupied'
-        seat.save()
-        
         # Generar código de barras para el boleto
         barcode = ''.join(random.choices(string.ascii_uppercase + string.digits, k=12))
         while Ticket.objects.filter(barcode=barcode).exists():
             barcode = ''.join(random.choices(string.ascii_uppercase + string.digits, k=12))
         
-        # Crear boleto
-        ticket = Ticket.objects.create(
-            reservation=reservation,
-            barcode=barcode,
-            status="issued"
-        )
+        with transaction.atomic():
+            # Un asiento reservado sólo puede tomarlo quien lo tiene bloqueado: el hold se
+            # consume acá, así que uno vencido, barrido o ya de otro usuario no alcanza
+            claimable = ('available', 'reserved') if hold_service.convert(flight, seat, request.user) else ('available',)
+
+            # Ocupar el asiento con un UPDATE condicional: si otro usuario lo ganó, no se crea nada
+            if not inventory_service.claim(flight, [seat], 'occupied', from_statuses=claimable):
+                messages.error(request, "El asiento seleccionado ya no está disponible.")
+                return redirect('seat_selection', flight_id=flight_id)
+            
+            # La reserva cancelada del pasajero ocupa el lugar de (vuelo, pasajero): se reemplaza
+            Reservation.objects.filter(flight=flight, passenger=passenger, status='canceled').delete()
+
+            # Crear la reserva
+            reservation = Reservation.objects.create(
+                flight=flight,
+                passenger=passenger,
+                seat=seat,
+                status='confirmed',
+                price=price,
+                reservation_code=code
+            )
+            
+            # Crear boleto
+            ticket = Ticket.objects.create(
+                reservation=reservation,
+                barcode=barcode,
+                status="issued"
+            )
         
         # Generar PDF del boleto
         generate_ticket_pdf(reservation)
@@ -2,15 +2,20 @@ from django.views import View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect, get_object_or_404
 from django.contrib import messages
+from django.db import transaction
 from app.models import Reservation, Seat
+from app.services import SeatInventoryService
 
 class DeleteReservationView(LoginRequiredMixin, View):
     def post(self, request, reservation_id):
         reservation = get_object_or_404(Reservation, id=reservation_id, passenger__email=request.user.email)
-        # Liberar el asiento
-        seat = reservation.seat
-        seat.status = 'available'
-        seat.save()
-        reservation.delete()
+        with transaction.atomic():
+            # Liberar el asiento en el vuelo. Una reserva cancelada ya no lo
+            # tiene: puede estar vendido a otro pasajero
+            if reservation.status != 'canceled':
+                SeatInventoryService().claim(
+                    reservation.flight, [reservation.seat], 'available', from_statuses=('reserved', 'occupied')
+                )
+            reservation.delete()
         messages.success(request, "Reserva eliminada correctamente.")
         return redirect('my_flights')
@@ -149,3 +149,16 @@ class FlightSearchForm(forms.Form):
     trip_type = forms.ChoiceField(choices=[('roundtrip', 'Ida y vuelta'), ('oneway', 'Solo ida')], widget=forms.RadioSelect)
     passengers = forms.IntegerField(min_value=1, max_value=6, label="Pasajeros", widget=forms.NumberInput(attrs={'class': 'form-control'}))
     seat_class = forms.ChoiceField(choices=[('economy', 'Económica'), ('premium', 'Premium'), ('business', 'Business')], label="Clase", widget=forms.Select(attrs={'class': 'form-control'}))
+    flexible_dates = forms.BooleanField(required=False, label="Fechas flexibles (±3 días)", widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}))
+
+    def clean(self):
+        cleaned_data = super().clean()
+        departure_date = cleaned_data.get("departure_date")
+        return_date = cleaned_data.get("return_date")
+
+        if cleaned_data.get("trip_type") == "roundtrip":
+            if not return_date:
+                self.add_error("return_date", "Ingresá la fecha de vuelta para un viaje de ida y vuelta.")
+            elif departure_date and return_date < departure_date:
+                self.add_error("return_date", "La fecha de vuelta no puede ser anterior a la de ida.")
+        return cleaned_data
@@ -1,22 +1,36 @@
 from django.views import View
-from django.utils import timezone
 from django.shortcuts import render
-from app.models import Flight, Reservation
-from datetime import timedelta
+from django.contrib.messages import get_messages
+from django.middleware.csrf import get_token
+from django.utils import translation
+from app.conditional import conditional_response, make_etag, set_validators
+from app.models import Reservation
+from app.services import FlightSearchService
 
 class OffersView(View):
     def get(self, request):
-        today = timezone.now().date()
-        three_months = today + timedelta(days=90)
-        offers = Flight.objects.filter(
-            departure_time__date__gte=today,
-            departure_time__date__lte=three_months,
-            status='scheduled',
-        ).order_by('departure_time')
+        # Desde hoy hasta dentro de 90 días inclusive; la lista sale de la caché de búsquedas
+        offers = FlightSearchService().offers()
         user_reservations = []
         if request.user.is_authenticated:
+            # Las reservas del usuario no se cachean
             user_reservations = list(Reservation.objects.filter(
                 passenger__email=request.user.email,
-                flight__in=offers
+                flight_id__in=[flight.id for flight in offers]
             ).values_list('flight_id', flat=True))
-        return render(request, 'offers.html', {'offers': offers, 'user_reservations': user_reservations})
+
+        # The ETag covers what the page shows: the offered flights and when they
+        # last changed, the user's reservations, language, user and the CSRF
+        # secret its forms embed. Pages with pending messages are always
+        # rendered so they get shown
+        get_token(request)
+        etag = make_etag(
+            'offers', translation.get_language(), request.user.pk, request.META['CSRF_COOKIE'],
+            *((flight.id, flight.updated_at) for flight in offers), sorted(user_reservations),
+        )
+        if not get_messages(request):
+            not_modified = conditional_response(request, etag)
+            if not_modified is not None:
+                return not_modified
+        response = render(request, 'offers.html', {'offers': offers, 'user_reservations': user_reservations})
+        return set_validators(response, etag)
@@ -0,0 +1,54 @@
+from django.contrib.auth.decorators import login_required
+from django.utils.decorators import method_decorator
+from django.shortcuts import redirect, get_object_or_404
+from django.contrib import messages
+from django.views import View
+from django.http import HttpResponseBadRequest
+from rest_framework.exceptions import ValidationError
+from app.models import Flight, Seat
+from app.services import ReservaService, SeatRecommendationService
+from .utils.ticket_generator import generate_ticket_pdf
+
+@method_decorator(login_required, name='dispatch')
+class RoundTripBookingView(View):
+    def post(self, request):
+        # Ids come straight from the form: anything but an integer is a bad request, not a 500
+        try:
+            outbound_id, return_id = int(request.POST.get('outbound_id')), int(request.POST.get('return_id'))
+        except (TypeError, ValueError):
+            return HttpResponseBadRequest("outbound_id y return_id deben ser números de vuelo.")
+        outbound = get_object_or_404(Flight, id=outbound_id, status='scheduled')
+        inbound = get_object_or_404(Flight, id=return_id, status='scheduled')
+        seat_types = dict(Seat.SEAT_TYPES)
+        seat_class = request.POST.get('seat_class')
+        if seat_class not in seat_types:
+            seat_class = 'economy'
+
+        # Pick the best free seat of the class on each leg from the free-run index
+        recommendation_service = SeatRecommendationService()
+        legs = []
+        for flight in (outbound, inbound):
+            suggestion = recommendation_service.suggest(flight, 1, seat_class)
+            if suggestion is None:
+                messages.error(request, f"No quedan asientos {seat_types[seat_class]} en el vuelo {flight.id}.")
+                return redirect('index')
+            seats, _ = suggestion
+            legs.append({'flight': flight, 'seat': seats[0]})
+
+        # Both legs are bought in one transaction, confirmed and ticketed like a one-way checkout:
+        # either both reservations exist or none
+        try:
+            ida, vuelta = ReservaService().crear_reserva_ida_vuelta(legs[0], legs[1], request.user)
+        except ValidationError as e:
+            messages.error(request, e.detail[0])
+            return redirect('index')
+
+        for reservation in (ida, vuelta):
+            generate_ticket_pdf(reservation)
+
+        messages.success(
+            request,
+            f"Compraste ida y vuelta por ${ida.price + vuelta.price}: asiento {ida.seat.number} en el vuelo {outbound.id} "
+            f"y asiento {vuelta.seat.number} en el vuelo {inbound.id}."
+        )
+        return redirect('my_flights')
@@ -3,20 +3,57 @@ from django.utils.decorators import method_decorator
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.views import View
-from app.models import Flight, Seat, Passenger, Reservation, Ticket
-from django.http import HttpResponse
+from app.models import Flight, FlightSeatInventory, Seat, Passenger, Reservation, Ticket
+from app.broadcast import seat_status_broadcaster
+from app.conditional import conditional_response, make_etag, set_validators
+from app.services import ReservaService, SeatHoldService, SeatMapService
+from rest_framework.exceptions import ValidationError
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+import asyncio
+import json
 import os
 from django.conf import settings
 import mimetypes
 from decimal import Decimal
 
+SEAT_TYPE_NAMES = {code: name for name, code in Seat.TYPE_CODES.items()}
+SEAT_TYPE_LABELS = dict(Seat.SEAT_TYPES)
+SSE_HEARTBEAT_SECONDS = 15
+
+def build_seat_rows(seat_map, prices):
+    """
+    Expand the compact seat map into rows of seat cells for the template
+    """
+    columns = seat_map['columns']
+    letters = [chr(65 + col) for col in range(columns)]  # 0=A, 1=B, etc.
+    rows = []
+    for row in range(seat_map['rows']):
+        cells = []
+        for col in range(columns):
+            position = row * columns + col
+            seat_id = seat_map['ids'][position]
+            if seat_id is None:
+                cells.append(None)
+                continue
+            seat_type = SEAT_TYPE_NAMES[seat_map['types'][position]]
+            cells.append({
+                'id': seat_id,
+                'position': position,
+                'number': f"{row + 1}{letters[col]}",
+                'type': seat_type,
+                'type_label': SEAT_TYPE_LABELS[seat_type],
+                'status': FlightSeatInventory.STATUS_NAMES[seat_map['status'][position]],
+                'price': prices[seat_type],
+            })
+        rows.append({'number': row + 1, 'seats': cells})
+    return rows, letters
+
 @method_decorator(login_required, name='dispatch')
 class SeatSelectionView(View):
     def get(self, request, flight_id):
-        flight = get_object_or_404(Flight, id=flight_id, status='scheduled')
-        
-        # Get all seats for the flight's airplane
-        seats = Seat.objects.filter(airplane=flight.airplane)
+        flight = get_object_or_404(Flight.objects.select_related('airplane'), id=flight_id, status='scheduled')
         
         # Check if user already has a reservation for this flight
         passenger = Passenger.objects.filter(email=request.user.email).first()
@@ -24,24 +61,13 @@ class SeatSelectionView(View):
         user_seat = None
         
         if passenger:
-            reservation = Reservation.objects.filter(flight=flight, passenger=passenger).first()
+            reservation = Reservation.objects.filter(
+                flight=flight, passenger=passenger
+            ).exclude(status='canceled').select_related('seat').first()
             if reservation:
                 has_reservation = True
                 user_seat = reservation.seat
         
-        # Organize seats by rows and columns for better display
-        seat_map = {}
-        for row in range(1, flight.airplane.rows + 1):
-            seat_map[row] = {}
-            for col in range(1, flight.airplane.columns + 1):
-                col_letter = chr(64 + col)  # Convert column number to letter (1=A, 2=B, etc.)
-                seat_map[row][col_letter] = None
-        
-        # Fill the seat map with actual seat data
-        for seat in seats:
-            col_letter = chr(64 + seat.column)
-            seat_map[seat.row][col_letter] = seat
-        
         # Get prices for different seat types
         prices = {
             'economy': flight.base_price,
@@ -49,14 +75,16 @@ class SeatSelectionView(View):
             'business': flight.base_price * Decimal('2.0')
         }
         
+        # Build the cabin from the cached compact seat map, without loading Seat objects
+        seat_rows, columns = build_seat_rows(SeatMapService().get_seat_map(flight), prices)
+        
         return render(request, 'seat_selection.html', {
             'flight': flight,
-            'seat_map': seat_map,
+            'seat_rows': seat_rows,
             'has_reservation': has_reservation,
             'user_seat': user_seat,
             'prices': prices,
-            'rows': range(1, flight.airplane.rows + 1),
-            'columns': [chr(64 + col) for col in range(1, flight.airplane.columns + 1)]
+            'columns': columns
         })
     
     def post(self, request, flight_id):
@@ -67,41 +95,86 @@ class SeatSelectionView(View):
             messages.error(request, "Debes seleccionar un asiento.")
             return redirect('seat_selection', flight_id=flight_id)
         
-        seat = get_object_or_404(Seat, id=seat_id)
+        seat = get_object_or_404(Seat, id=seat_id, airplane=flight.airplane)
         
-        # Check if seat is available
-        if seat.status != 'available':
-            messages.error(request, "El asiento seleccionado ya no está disponible.")
-            return redirect('seat_selection', flight_id=flight_id)
-        
-        # Check if user already has a reservation
+        # Check if user already has a reservation; a canceled one no longer holds a seat
         passenger = Passenger.objects.filter(email=request.user.email).first()
+        existing_reservation = None
         if passenger:
-            existing_reservation = Reservation.objects.filter(flight=flight, passenger=passenger).first()
-            if existing_reservation:
-                # Release the previously reserved seat
-                old_seat = existing_reservation.seat
-                old_seat.status = 'available'
-                old_seat.save()
-                
-                # Update with the new seat
-                existing_reservation.seat = seat
-                existing_reservation.save()
-                
-                # Mark the new seat as reserved
-                seat.status = 'reserved'
-                seat.save()
-                
-                messages.success(request, "Tu asiento ha sido actualizado correctamente.")
-                return redirect('confirm_reservation', flight_id=flight_id, seat_id=seat.id)
+            existing_reservation = Reservation.objects.filter(
+                flight=flight, passenger=passenger
+            ).exclude(status='canceled').first()
         
-        # If no existing reservation, mark the seat as reserved
-        seat.status = 'reserved'
-        seat.save()
+        if existing_reservation:
+            # The service claims the new seat with the status that matches the reservation
+            # (occupied once confirmed) and releases the old one in the same transaction
+            try:
+                ReservaService().actualizar_reserva(existing_reservation, {'seat': seat})
+            except ValidationError:
+                messages.error(request, "El asiento seleccionado ya no está disponible.")
+                return redirect('seat_selection', flight_id=flight_id)
+            
+            messages.success(request, "Tu asiento ha sido actualizado correctamente.")
+        elif not SeatHoldService().hold(flight, seat, request.user):
+            # Hold the seat for a limited time while the user confirms
+            messages.error(request, "El asiento seleccionado ya no está disponible.")
+            return redirect('seat_selection', flight_id=flight_id)
         
         # Redirect to the confirmation page
         return redirect('confirm_reservation', flight_id=flight_id, seat_id=seat.id)
 
+@login_required
+def seat_map(request, flight_id):
+    flight = get_object_or_404(Flight, id=flight_id, status='scheduled')
+    compact_map = SeatMapService().get_seat_map(flight)
+    # Polling clients revalidate with If-None-Match: the version travels in
+    # the cached map, so an unchanged map costs one version lookup and no body
+    etag = make_etag('seat-map', flight.pk, compact_map['version'])
+    not_modified = conditional_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return set_validators(JsonResponse(compact_map), etag)
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@login_required
+async def seat_map_stream(request, flight_id):
+    """
+    Server-sent events with the seat status deltas of the flight. Every client
+    waits on its own queue of the in-process broadcaster, so open seat
+    selection pages never poll the database
+    """
+    if not isinstance(request, ASGIRequest):
+        # Under WSGI an endless stream would pin a worker; 204 tells
+        # EventSource not to reconnect and the page falls back to refetching
+        return HttpResponse(status=204)
+    flight = await Flight.objects.filter(id=flight_id, status='scheduled').afirst()
+    if flight is None:
+        raise Http404
+
+    async def events():
+        queue = seat_status_broadcaster.subscribe(flight.pk)
+        try:
+            # The snapshot is read after subscribing; deltas carry absolute
+            # statuses, so one applied twice is harmless
+            seat_map = await sync_to_async(SeatMapService().get_seat_map)(flight)
+            yield f"retry: 5000\n{sse_event('snapshot', {'status': seat_map['status']})}"
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield sse_event('resync' if event is seat_status_broadcaster.RESYNC else 'seats', event)
+        finally:
+            seat_status_broadcaster.unsubscribe(flight.pk, queue)
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
 def download_ticket(request, reservation_id):
     reservation = get_object_or_404(Reservation, id=reservation_id)
     
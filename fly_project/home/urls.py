@@ -13,9 +13,10 @@ from home.views import (
     ConfirmReservationView,
     FinalizeReservationView,
     ProfileView,
+    RoundTripBookingView,
 )
 from home.confirm_reservation_views import ConfirmReservationView, FinalizeReservationView
-from home.seat_selection_view import SeatSelectionView, download_ticket
+from home.seat_selection_view import SeatSelectionView, download_ticket, seat_map, seat_map_stream
 from backoffice.views import PopularDestinationsView
 
 urlpatterns = [
@@ -24,11 +25,14 @@ urlpatterns = [
     path('logout/', LogoutView.as_view(), name='logout'),
     path('offers/', OffersView.as_view(), name='offers'),
     path('buy-offer/<int:flight_id>/', BuyOfferView.as_view(), name='buy_offer'),
+    path('round-trip/book/', RoundTripBookingView.as_view(), name='round_trip_booking'),
     path('my-flights/', MyFlightsView.as_view(), name='my_flights'),
     path('delete-reservation/<int:reservation_id>/', DeleteReservationView.as_view(), name='delete_reservation'),
     path('confirm-reservation/<int:flight_id>/', ConfirmReservationView.as_view(), name='confirm_reservation_prompt'),
     path('confirm-reservation/<int:flight_id>/<int:seat_id>/', ConfirmReservationView.as_view(), name='confirm_reservation'),
     path('seat-selection/<int:flight_id>/', SeatSelectionView.as_view(), name='seat_selection'),
+    path('seat-map/<int:flight_id>/', seat_map, name='seat_map'),
+    path('seat-map/<int:flight_id>/stream/', seat_map_stream, name='seat_map_stream'),
     path('finalize-reservation/<int:flight_id>/', FinalizeReservationView.as_view(), name='finalize_reservation'),
     path('profile/', ProfileView.as_view(), name='profile'),
     path('download-ticket/<int:reservation_id>/', download_ticket, name='download_ticket'),
@@ -10,59 +10,91 @@ from django.views.generic import TemplateView
 from home.forms import LoginForm, RegisterForm, FlightSearchForm
 from home.forms_profile import ProfileForm
 from app.models import Flight, Reservation, Passenger, Destination, DestinationImage
+from app.services import DestinationCatalogService, FlightSearchService
 from .offers_view import OffersView
 from .buy_offer_view import BuyOfferView
+from .round_trip_view import RoundTripBookingView
 from .my_flights_view import MyFlightsView
 from .delete_reservation_view import DeleteReservationView
 from .confirm_reservation_views import ConfirmReservationView, FinalizeReservationView
-import random
 
 # Create your views here.
 class HomeView(View):
     def get(self, request):
         form = FlightSearchForm(request.GET or None)
         flights = None
+        itineraries = None
+        connections = None
+        fare_calendar = None
         user_reservations = []
-        # Obtener 3 destinos aleatorios con imagen
-        all_destinations = list(Destination.objects.all())
-        random_destinations = random.sample(all_destinations, min(3, len(all_destinations)))
-        popular_destinations = []
-        for dest in random_destinations:
-            img = dest.images.first()
-            popular_destinations.append({
-                'name': dest.name,
-                'image': img.image_url if img else '',
+        # Obtener 3 destinos aleatorios con imagen, elegidos en memoria sobre el catálogo cacheado
+        popular_destinations = [
+            {
+                'name': dest['name'],
+                'image': dest['image'] or '',
                 'description': ''
-            })
+            }
+            for dest in DestinationCatalogService().sample(3)
+        ]
         if request.user.is_authenticated and request.GET:
             if form.is_valid():
                 origin = form.cleaned_data['origin']
                 destination = form.cleaned_data['destination']
                 departure_date = form.cleaned_data['departure_date']
                 seat_class = form.cleaned_data['seat_class']
-                flights = Flight.objects.filter(
-                    origin=origin,
-                    destination=destination,
-                    departure_time__date=departure_date,
-                    status='scheduled',
-                )
-                if seat_class:
-                    flights = flights.filter(
-                        airplane__seats__type=seat_class,
-                        airplane__seats__status='available'
-                    ).distinct()
+                search_service = FlightSearchService()
+                if form.cleaned_data['trip_type'] == 'roundtrip':
+                    # Both legs come from a single query, already paired and sorted by total price
+                    itineraries = search_service.round_trip(
+                        origin, destination, departure_date, form.cleaned_data['return_date'], seat_class
+                    )
+                    flights = [leg for itinerary in itineraries for leg in (itinerary['outbound'], itinerary['return'])]
+                else:
+                    flights = search_service.search(origin, destination, departure_date, seat_class)
+                    # Itineraries with stops come from the in-memory route graph, not from self-joins
+                    connections = search_service.connections(origin, destination, departure_date, seat_class)
+                if form.cleaned_data['flexible_dates']:
+                    fare_calendar = self.build_fare_calendar(
+                        request, search_service.fare_calendar(origin, destination, departure_date, seat_class=seat_class)
+                    )
+                # The user's own reservations are an uncached overlay on top of the cached search
+                flight_ids = [flight.id for flight in flights]
+                flight_ids += [leg.id for connection in connections or [] for leg in connection['flights']]
                 user_reservations = list(Reservation.objects.filter(
                     passenger__email=request.user.email,
-                    flight__in=flights
+                    flight_id__in=flight_ids
                 ).values_list('flight_id', flat=True))
         else:
             form = FlightSearchForm()
         return render(request, 'index.html', {
             'form': form,
             'flights': flights,
+            'itineraries': itineraries,
+            'connections': connections,
+            'fare_calendar': fare_calendar,
             'user_reservations': user_reservations,
             'popular_destinations': popular_destinations
         })
+
+    def build_fare_calendar(self, request, calendar):
+        """
+        Add to each day of the fare calendar the search link for that date and
+        flag the selected and the cheapest days
+        """
+        fares = [day['lowest_fare'] for day in calendar if day['lowest_fare'] is not None]
+        cheapest = min(fares) if fares else None
+        selected = request.GET.get('departure_date')
+        days = []
+        for day in calendar:
+            query = request.GET.copy()
+            query['departure_date'] = day['date'].isoformat()
+            days.append(dict(
+                day,
+                query=query.urlencode(),
+                selected=day['date'].isoformat() == selected,
+                cheapest=day['lowest_fare'] is not None and day['lowest_fare'] == cheapest,
+            ))
+        return days
     
     def post(self, request):
         # Get the flight_id from the form
@@ -0,0 +1,11 @@
+-- seed_airports.sql
+-- Tabla: Airport (autocompletado de origen y destino)
+INSERT INTO app_airport (id, code, name, city, synonyms) VALUES
+(1, 'AEP', 'Aeroparque Jorge Newbery', 'Buenos Aires', 'Aeroparque, Buenos Aires (Aeroparque), Capital Federal, CABA'),
+(2, 'EZE', 'Aeropuerto Internacional Ministro Pistarini', 'Buenos Aires', 'Ezeiza, Buenos Aires (Ezeiza)'),
+(3, 'COR', 'Aeropuerto Internacional Ingeniero Ambrosio Taravella', 'Córdoba', 'Pajas Blancas'),
+(4, 'MDZ', 'Aeropuerto Internacional Gobernador Francisco Gabrielli', 'Mendoza', 'El Plumerillo'),
+(5, 'BRC', 'Aeropuerto Internacional Teniente Luis Candelaria', 'San Carlos de Bariloche', 'Bariloche'),
+(6, 'USH', 'Aeropuerto Internacional Malvinas Argentinas', 'Ushuaia', 'Tierra del Fuego'),
+(7, 'IGR', 'Aeropuerto Internacional Cataratas del Iguazú', 'Puerto Iguazú', 'Iguazú, Cataratas'),
+(8, 'NQN', 'Aeropuerto Internacional Presidente Perón', 'Neuquén', '');
@@ -6,6 +6,7 @@ BEGIN TRANSACTION;
 DELETE FROM app_ticket;
 DELETE FROM app_reservation;
 DELETE FROM app_seat;
+DELETE FROM app_flightseatinventory;
 DELETE FROM app_passenger;
 DELETE FROM app_flight;
 DELETE FROM app_airplane;
@@ -16,711 +17,711 @@ INSERT INTO app_airplane (id, model, capacity, rows, columns) VALUES (2, 'Airbus
 INSERT INTO app_airplane (id, model, capacity, rows, columns) VALUES (3, 'Embraer E190', 96, 24, 4);
 INSERT INTO app_airplane (id, model, capacity, rows, columns) VALUES (4, 'Boeing 787-8', 248, 31, 8);
 
--- Seats
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (1, 1, '1A', 1, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (2, 1, '1B', 1, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (3, 1, '1C', 1, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (4, 1, '1D', 1, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (5, 1, '1E', 1, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (6, 1, '1F', 1, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (7, 1, '2A', 2, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (8, 1, '2B', 2, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (9, 1, '2C', 2, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (10, 1, '2D', 2, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (11, 1, '2E', 2, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (12, 1, '2F', 2, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (13, 1, '3A', 3, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (14, 1, '3B', 3, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (15, 1, '3C', 3, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (16, 1, '3D', 3, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (17, 1, '3E', 3, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (18, 1, '3F', 3, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (19, 1, '4A', 4, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (20, 1, '4B', 4, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (21, 1, '4C', 4, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (22, 1, '4D', 4, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (23, 1, '4E', 4, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (24, 1, '4F', 4, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (25, 1, '5A', 5, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (26, 1, '5B', 5, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (27, 1, '5C', 5, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (28, 1, '5D', 5, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (29, 1, '5E', 5, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (30, 1, '5F', 5, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (31, 1, '6A', 6, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (32, 1, '6B', 6, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (33, 1, '6C', 6, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (34, 1, '6D', 6, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (35, 1, '6E', 6, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (36, 1, '6F', 6, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (37, 1, '7A', 7, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (38, 1, '7B', 7, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (39, 1, '7C', 7, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (40, 1, '7D', 7, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (41, 1, '7E', 7, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (42, 1, '7F', 7, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (43, 1, '8A', 8, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (44, 1, '8B', 8, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (45, 1, '8C', 8, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (46, 1, '8D', 8, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (47, 1, '8E', 8, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (48, 1, '8F', 8, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (49, 1, '9A', 9, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (50, 1, '9B', 9, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (51, 1, '9C', 9, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (52, 1, '9D', 9, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (53, 1, '9E', 9, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (54, 1, '9F', 9, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (55, 1, '10A', 10, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (56, 1, '10B', 10, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (57, 1, '10C', 10, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (58, 1, '10D', 10, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (59, 1, '10E', 10, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (60, 1, '10F', 10, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (61, 1, '11A', 11, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (62, 1, '11B', 11, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (63, 1, '11C', 11, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (64, 1, '11D', 11, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (65, 1, '11E', 11, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (66, 1, '11F', 11, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (67, 1, '12A', 12, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (68, 1, '12B', 12, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (69, 1, '12C', 12, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (70, 1, '12D', 12, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (71, 1, '12E', 12, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (72, 1, '12F', 12, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (73, 1, '13A', 13, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (74, 1, '13B', 13, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (75, 1, '13C', 13, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (76, 1, '13D', 13, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (77, 1, '13E', 13, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (78, 1, '13F', 13, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (79, 1, '14A', 14, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (80, 1, '14B', 14, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (81, 1, '14C', 14, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (82, 1, '14D', 14, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (83, 1, '14E', 14, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (84, 1, '14F', 14, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (85, 1, '15A', 15, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (86, 1, '15B', 15, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (87, 1, '15C', 15, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (88, 1, '15D', 15, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (89, 1, '15E', 15, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (90, 1, '15F', 15, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (91, 1, '16A', 16, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (92, 1, '16B', 16, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (93, 1, '16C', 16, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (94, 1, '16D', 16, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (95, 1, '16E', 16, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (96, 1, '16F', 16, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (97, 1, '17A', 17, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (98, 1, '17B', 17, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (99, 1, '17C', 17, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (100, 1, '17D', 17, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (101, 1, '17E', 17, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (102, 1, '17F', 17, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (103, 1, '18A', 18, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (104, 1, '18B', 18, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (105, 1, '18C', 18, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (106, 1, '18D', 18, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (107, 1, '18E', 18, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (108, 1, '18F', 18, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (109, 1, '19A', 19, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (110, 1, '19B', 19, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (111, 1, '19C', 19, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (112, 1, '19D', 19, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (113, 1, '19E', 19, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (114, 1, '19F', 19, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (115, 1, '20A', 20, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (116, 1, '20B', 20, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (117, 1, '20C', 20, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (118, 1, '20D', 20, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (119, 1, '20E', 20, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (120, 1, '20F', 20, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (121, 1, '21A', 21, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (122, 1, '21B', 21, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (123, 1, '21C', 21, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (124, 1, '21D', 21, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (125, 1, '21E', 21, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (126, 1, '21F', 21, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (127, 1, '22A', 22, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (128, 1, '22B', 22, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (129, 1, '22C', 22, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (130, 1, '22D', 22, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (131, 1, '22E', 22, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (132, 1, '22F', 22, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (133, 1, '23A', 23, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (134, 1, '23B', 23, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (135, 1, '23C', 23, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (136, 1, '23D', 23, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (137, 1, '23E', 23, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (138, 1, '23F', 23, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (139, 1, '24A', 24, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (140, 1, '24B', 24, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (141, 1, '24C', 24, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (142, 1, '24D', 24, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (143, 1, '24E', 24, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (144, 1, '24F', 24, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (145, 1, '25A', 25, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (146, 1, '25B', 25, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (147, 1, '25C', 25, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (148, 1, '25D', 25, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (149, 1, '25E', 25, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (150, 1, '25F', 25, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (151, 1, '26A', 26, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (152, 1, '26B', 26, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (153, 1, '26C', 26, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (154, 1, '26D', 26, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (155, 1, '26E', 26, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (156, 1, '26F', 26, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (157, 1, '27A', 27, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (158, 1, '27B', 27, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (159, 1, '27C', 27, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (160, 1, '27D', 27, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (161, 1, '27E', 27, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (162, 1, '27F', 27, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (163, 1, '28A', 28, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (164, 1, '28B', 28, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (165, 1, '28C', 28, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (166, 1, '28D', 28, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (167, 1, '28E', 28, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (168, 1, '28F', 28, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (169, 1, '29A', 29, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (170, 1, '29B', 29, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (171, 1, '29C', 29, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (172, 1, '29D', 29, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (173, 1, '29E', 29, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (174, 1, '29F', 29, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (175, 1, '30A', 30, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (176, 1, '30B', 30, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (177, 1, '30C', 30, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (178, 1, '30D', 30, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (179, 1, '30E', 30, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (180, 1, '30F', 30, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (181, 1, '31A', 31, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (182, 1, '31B', 31, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (183, 1, '31C', 31, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (184, 1, '31D', 31, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (185, 1, '31E', 31, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (186, 1, '31F', 31, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (187, 2, '1A', 1, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (188, 2, '1B', 1, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (189, 2, '1C', 1, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (190, 2, '1D', 1, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (191, 2, '1E', 1, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (192, 2, '1F', 1, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (193, 2, '2A', 2, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (194, 2, '2B', 2, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (195, 2, '2C', 2, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (196, 2, '2D', 2, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (197, 2, '2E', 2, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (198, 2, '2F', 2, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (199, 2, '3A', 3, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (200, 2, '3B', 3, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (201, 2, '3C', 3, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (202, 2, '3D', 3, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (203, 2, '3E', 3, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (204, 2, '3F', 3, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (205, 2, '4A', 4, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (206, 2, '4B', 4, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (207, 2, '4C', 4, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (208, 2, '4D', 4, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (209, 2, '4E', 4, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (210, 2, '4F', 4, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (211, 2, '5A', 5, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (212, 2, '5B', 5, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (213, 2, '5C', 5, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (214, 2, '5D', 5, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (215, 2, '5E', 5, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (216, 2, '5F', 5, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (217, 2, '6A', 6, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (218, 2, '6B', 6, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (219, 2, '6C', 6, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (220, 2, '6D', 6, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (221, 2, '6E', 6, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (222, 2, '6F', 6, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (223, 2, '7A', 7, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (224, 2, '7B', 7, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (225, 2, '7C', 7, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (226, 2, '7D', 7, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (227, 2, '7E', 7, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (228, 2, '7F', 7, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (229, 2, '8A', 8, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (230, 2, '8B', 8, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (231, 2, '8C', 8, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (232, 2, '8D', 8, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (233, 2, '8E', 8, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (234, 2, '8F', 8, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (235, 2, '9A', 9, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (236, 2, '9B', 9, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (237, 2, '9C', 9, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (238, 2, '9D', 9, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (239, 2, '9E', 9, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (240, 2, '9F', 9, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (241, 2, '10A', 10, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (242, 2, '10B', 10, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (243, 2, '10C', 10, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (244, 2, '10D', 10, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (245, 2, '10E', 10, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (246, 2, '10F', 10, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (247, 2, '11A', 11, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (248, 2, '11B', 11, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (249, 2, '11C', 11, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (250, 2, '11D', 11, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (251, 2, '11E', 11, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (252, 2, '11F', 11, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (253, 2, '12A', 12, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (254, 2, '12B', 12, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (255, 2, '12C', 12, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (256, 2, '12D', 12, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (257, 2, '12E', 12, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (258, 2, '12F', 12, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (259, 2, '13A', 13, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (260, 2, '13B', 13, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (261, 2, '13C', 13, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (262, 2, '13D', 13, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (263, 2, '13E', 13, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (264, 2, '13F', 13, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (265, 2, '14A', 14, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (266, 2, '14B', 14, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (267, 2, '14C', 14, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (268, 2, '14D', 14, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (269, 2, '14E', 14, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (270, 2, '14F', 14, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (271, 2, '15A', 15, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (272, 2, '15B', 15, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (273, 2, '15C', 15, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (274, 2, '15D', 15, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (275, 2, '15E', 15, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (276, 2, '15F', 15, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (277, 2, '16A', 16, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (278, 2, '16B', 16, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (279, 2, '16C', 16, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (280, 2, '16D', 16, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (281, 2, '16E', 16, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (282, 2, '16F', 16, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (283, 2, '17A', 17, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (284, 2, '17B', 17, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (285, 2, '17C', 17, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (286, 2, '17D', 17, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (287, 2, '17E', 17, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (288, 2, '17F', 17, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (289, 2, '18A', 18, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (290, 2, '18B', 18, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (291, 2, '18C', 18, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (292, 2, '18D', 18, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (293, 2, '18E', 18, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (294, 2, '18F', 18, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (295, 2, '19A', 19, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (296, 2, '19B', 19, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (297, 2, '19C', 19, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (298, 2, '19D', 19, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (299, 2, '19E', 19, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (300, 2, '19F', 19, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (301, 2, '20A', 20, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (302, 2, '20B', 20, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (303, 2, '20C', 20, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (304, 2, '20D', 20, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (305, 2, '20E', 20, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (306, 2, '20F', 20, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (307, 2, '21A', 21, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (308, 2, '21B', 21, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (309, 2, '21C', 21, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (310, 2, '21D', 21, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (311, 2, '21E', 21, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (312, 2, '21F', 21, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (313, 2, '22A', 22, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (314, 2, '22B', 22, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (315, 2, '22C', 22, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (316, 2, '22D', 22, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (317, 2, '22E', 22, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (318, 2, '22F', 22, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (319, 2, '23A', 23, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (320, 2, '23B', 23, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (321, 2, '23C', 23, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (322, 2, '23D', 23, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (323, 2, '23E', 23, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (324, 2, '23F', 23, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (325, 2, '24A', 24, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (326, 2, '24B', 24, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (327, 2, '24C', 24, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (328, 2, '24D', 24, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (329, 2, '24E', 24, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (330, 2, '24F', 24, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (331, 2, '25A', 25, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (332, 2, '25B', 25, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (333, 2, '25C', 25, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (334, 2, '25D', 25, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (335, 2, '25E', 25, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (336, 2, '25F', 25, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (337, 2, '26A', 26, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (338, 2, '26B', 26, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (339, 2, '26C', 26, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (340, 2, '26D', 26, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (341, 2, '26E', 26, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (342, 2, '26F', 26, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (343, 2, '27A', 27, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (344, 2, '27B', 27, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (345, 2, '27C', 27, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (346, 2, '27D', 27, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (347, 2, '27E', 27, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (348, 2, '27F', 27, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (349, 2, '28A', 28, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (350, 2, '28B', 28, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (351, 2, '28C', 28, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (352, 2, '28D', 28, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (353, 2, '28E', 28, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (354, 2, '28F', 28, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (355, 2, '29A', 29, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (356, 2, '29B', 29, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (357, 2, '29C', 29, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (358, 2, '29D', 29, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (359, 2, '29E', 29, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (360, 2, '29F', 29, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (361, 3, '1A', 1, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (362, 3, '1B', 1, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (363, 3, '1C', 1, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (364, 3, '1D', 1, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (365, 3, '2A', 2, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (366, 3, '2B', 2, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (367, 3, '2C', 2, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (368, 3, '2D', 2, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (369, 3, '3A', 3, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (370, 3, '3B', 3, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (371, 3, '3C', 3, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (372, 3, '3D', 3, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (373, 3, '4A', 4, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (374, 3, '4B', 4, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (375, 3, '4C', 4, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (376, 3, '4D', 4, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (377, 3, '5A', 5, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (378, 3, '5B', 5, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (379, 3, '5C', 5, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (380, 3, '5D', 5, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (381, 3, '6A', 6, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (382, 3, '6B', 6, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (383, 3, '6C', 6, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (384, 3, '6D', 6, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (385, 3, '7A', 7, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (386, 3, '7B', 7, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (387, 3, '7C', 7, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (388, 3, '7D', 7, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (389, 3, '8A', 8, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (390, 3, '8B', 8, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (391, 3, '8C', 8, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (392, 3, '8D', 8, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (393, 3, '9A', 9, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (394, 3, '9B', 9, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (395, 3, '9C', 9, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (396, 3, '9D', 9, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (397, 3, '10A', 10, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (398, 3, '10B', 10, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (399, 3, '10C', 10, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (400, 3, '10D', 10, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (401, 3, '11A', 11, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (402, 3, '11B', 11, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (403, 3, '11C', 11, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (404, 3, '11D', 11, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (405, 3, '12A', 12, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (406, 3, '12B', 12, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (407, 3, '12C', 12, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (408, 3, '12D', 12, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (409, 3, '13A', 13, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (410, 3, '13B', 13, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (411, 3, '13C', 13, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (412, 3, '13D', 13, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (413, 3, '14A', 14, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (414, 3, '14B', 14, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (415, 3, '14C', 14, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (416, 3, '14D', 14, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (417, 3, '15A', 15, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (418, 3, '15B', 15, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (419, 3, '15C', 15, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (420, 3, '15D', 15, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (421, 3, '16A', 16, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (422, 3, '16B', 16, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (423, 3, '16C', 16, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (424, 3, '16D', 16, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (425, 3, '17A', 17, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (426, 3, '17B', 17, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (427, 3, '17C', 17, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (428, 3, '17D', 17, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (429, 3, '18A', 18, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (430, 3, '18B', 18, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (431, 3, '18C', 18, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (432, 3, '18D', 18, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (433, 3, '19A', 19, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (434, 3, '19B', 19, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (435, 3, '19C', 19, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (436, 3, '19D', 19, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (437, 3, '20A', 20, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (438, 3, '20B', 20, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (439, 3, '20C', 20, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (440, 3, '20D', 20, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (441, 3, '21A', 21, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (442, 3, '21B', 21, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (443, 3, '21C', 21, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (444, 3, '21D', 21, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (445, 3, '22A', 22, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (446, 3, '22B', 22, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (447, 3, '22C', 22, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (448, 3, '22D', 22, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (449, 3, '23A', 23, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (450, 3, '23B', 23, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (451, 3, '23C', 23, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (452, 3, '23D', 23, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (453, 3, '24A', 24, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (454, 3, '24B', 24, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (455, 3, '24C', 24, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (456, 3, '24D', 24, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (457, 4, '1A', 1, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (458, 4, '1B', 1, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (459, 4, '1C', 1, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (460, 4, '1D', 1, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (461, 4, '1E', 1, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (462, 4, '1F', 1, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (463, 4, '1G', 1, 7, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (464, 4, '1H', 1, 8, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (465, 4, '2A', 2, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (466, 4, '2B', 2, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (467, 4, '2C', 2, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (468, 4, '2D', 2, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (469, 4, '2E', 2, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (470, 4, '2F', 2, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (471, 4, '2G', 2, 7, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (472, 4, '2H', 2, 8, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (473, 4, '3A', 3, 1, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (474, 4, '3B', 3, 2, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (475, 4, '3C', 3, 3, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (476, 4, '3D', 3, 4, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (477, 4, '3E', 3, 5, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (478, 4, '3F', 3, 6, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (479, 4, '3G', 3, 7, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (480, 4, '3H', 3, 8, 'business', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (481, 4, '4A', 4, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (482, 4, '4B', 4, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (483, 4, '4C', 4, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (484, 4, '4D', 4, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (485, 4, '4E', 4, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (486, 4, '4F', 4, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (487, 4, '4G', 4, 7, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (488, 4, '4H', 4, 8, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (489, 4, '5A', 5, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (490, 4, '5B', 5, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (491, 4, '5C', 5, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (492, 4, '5D', 5, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (493, 4, '5E', 5, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (494, 4, '5F', 5, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (495, 4, '5G', 5, 7, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (496, 4, '5H', 5, 8, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (497, 4, '6A', 6, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (498, 4, '6B', 6, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (499, 4, '6C', 6, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (500, 4, '6D', 6, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (501, 4, '6E', 6, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (502, 4, '6F', 6, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (503, 4, '6G', 6, 7, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (504, 4, '6H', 6, 8, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (505, 4, '7A', 7, 1, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (506, 4, '7B', 7, 2, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (507, 4, '7C', 7, 3, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (508, 4, '7D', 7, 4, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (509, 4, '7E', 7, 5, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (510, 4, '7F', 7, 6, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (511, 4, '7G', 7, 7, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (512, 4, '7H', 7, 8, 'premium', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (513, 4, '8A', 8, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (514, 4, '8B', 8, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (515, 4, '8C', 8, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (516, 4, '8D', 8, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (517, 4, '8E', 8, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (518, 4, '8F', 8, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (519, 4, '8G', 8, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (520, 4, '8H', 8, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (521, 4, '9A', 9, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (522, 4, '9B', 9, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (523, 4, '9C', 9, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (524, 4, '9D', 9, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (525, 4, '9E', 9, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (526, 4, '9F', 9, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (527, 4, '9G', 9, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (528, 4, '9H', 9, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (529, 4, '10A', 10, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (530, 4, '10B', 10, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (531, 4, '10C', 10, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (532, 4, '10D', 10, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (533, 4, '10E', 10, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (534, 4, '10F', 10, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (535, 4, '10G', 10, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (536, 4, '10H', 10, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (537, 4, '11A', 11, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (538, 4, '11B', 11, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (539, 4, '11C', 11, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (540, 4, '11D', 11, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (541, 4, '11E', 11, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (542, 4, '11F', 11, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (543, 4, '11G', 11, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (544, 4, '11H', 11, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (545, 4, '12A', 12, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (546, 4, '12B', 12, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (547, 4, '12C', 12, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (548, 4, '12D', 12, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (549, 4, '12E', 12, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (550, 4, '12F', 12, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (551, 4, '12G', 12, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (552, 4, '12H', 12, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (553, 4, '13A', 13, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (554, 4, '13B', 13, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (555, 4, '13C', 13, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (556, 4, '13D', 13, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (557, 4, '13E', 13, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (558, 4, '13F', 13, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (559, 4, '13G', 13, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (560, 4, '13H', 13, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (561, 4, '14A', 14, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (562, 4, '14B', 14, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (563, 4, '14C', 14, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (564, 4, '14D', 14, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (565, 4, '14E', 14, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (566, 4, '14F', 14, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (567, 4, '14G', 14, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (568, 4, '14H', 14, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (569, 4, '15A', 15, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (570, 4, '15B', 15, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (571, 4, '15C', 15, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (572, 4, '15D', 15, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (573, 4, '15E', 15, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (574, 4, '15F', 15, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (575, 4, '15G', 15, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (576, 4, '15H', 15, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (577, 4, '16A', 16, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (578, 4, '16B', 16, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (579, 4, '16C', 16, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (580, 4, '16D', 16, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (581, 4, '16E', 16, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (582, 4, '16F', 16, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (583, 4, '16G', 16, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (584, 4, '16H', 16, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (585, 4, '17A', 17, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (586, 4, '17B', 17, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (587, 4, '17C', 17, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (588, 4, '17D', 17, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (589, 4, '17E', 17, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (590, 4, '17F', 17, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (591, 4, '17G', 17, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (592, 4, '17H', 17, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (593, 4, '18A', 18, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (594, 4, '18B', 18, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (595, 4, '18C', 18, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (596, 4, '18D', 18, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (597, 4, '18E', 18, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (598, 4, '18F', 18, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (599, 4, '18G', 18, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (600, 4, '18H', 18, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (601, 4, '19A', 19, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (602, 4, '19B', 19, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (603, 4, '19C', 19, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (604, 4, '19D', 19, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (605, 4, '19E', 19, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (606, 4, '19F', 19, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (607, 4, '19G', 19, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (608, 4, '19H', 19, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (609, 4, '20A', 20, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (610, 4, '20B', 20, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (611, 4, '20C', 20, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (612, 4, '20D', 20, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (613, 4, '20E', 20, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (614, 4, '20F', 20, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (615, 4, '20G', 20, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (616, 4, '20H', 20, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (617, 4, '21A', 21, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (618, 4, '21B', 21, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (619, 4, '21C', 21, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (620, 4, '21D', 21, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (621, 4, '21E', 21, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (622, 4, '21F', 21, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (623, 4, '21G', 21, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (624, 4, '21H', 21, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (625, 4, '22A', 22, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (626, 4, '22B', 22, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (627, 4, '22C', 22, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (628, 4, '22D', 22, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (629, 4, '22E', 22, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (630, 4, '22F', 22, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (631, 4, '22G', 22, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (632, 4, '22H', 22, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (633, 4, '23A', 23, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (634, 4, '23B', 23, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (635, 4, '23C', 23, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (636, 4, '23D', 23, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (637, 4, '23E', 23, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (638, 4, '23F', 23, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (639, 4, '23G', 23, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (640, 4, '23H', 23, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (641, 4, '24A', 24, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (642, 4, '24B', 24, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (643, 4, '24C', 24, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (644, 4, '24D', 24, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (645, 4, '24E', 24, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (646, 4, '24F', 24, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (647, 4, '24G', 24, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (648, 4, '24H', 24, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (649, 4, '25A', 25, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (650, 4, '25B', 25, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (651, 4, '25C', 25, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (652, 4, '25D', 25, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (653, 4, '25E', 25, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (654, 4, '25F', 25, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (655, 4, '25G', 25, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (656, 4, '25H', 25, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (657, 4, '26A', 26, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (658, 4, '26B', 26, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (659, 4, '26C', 26, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (660, 4, '26D', 26, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (661, 4, '26E', 26, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (662, 4, '26F', 26, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (663, 4, '26G', 26, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (664, 4, '26H', 26, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (665, 4, '27A', 27, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (666, 4, '27B', 27, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (667, 4, '27C', 27, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (668, 4, '27D', 27, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (669, 4, '27E', 27, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (670, 4, '27F', 27, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (671, 4, '27G', 27, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (672, 4, '27H', 27, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (673, 4, '28A', 28, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (674, 4, '28B', 28, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (675, 4, '28C', 28, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (676, 4, '28D', 28, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (677, 4, '28E', 28, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (678, 4, '28F', 28, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (679, 4, '28G', 28, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (680, 4, '28H', 28, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (681, 4, '29A', 29, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (682, 4, '29B', 29, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (683, 4, '29C', 29, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (684, 4, '29D', 29, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (685, 4, '29E', 29, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (686, 4, '29F', 29, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (687, 4, '29G', 29, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (688, 4, '29H', 29, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (689, 4, '30A', 30, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (690, 4, '30B', 30, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (691, 4, '30C', 30, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (692, 4, '30D', 30, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (693, 4, '30E', 30, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (694, 4, '30F', 30, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (695, 4, '30G', 30, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (696, 4, '30H', 30, 8, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (697, 4, '31A', 31, 1, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (698, 4, '31B', 31, 2, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (699, 4, '31C', 31, 3, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (700, 4, '31D', 31, 4, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (701, 4, '31E', 31, 5, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (702, 4, '31F', 31, 6, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (703, 4, '31G', 31, 7, 'economy', 'available');
-INSERT INTO app_seat (id, airplane_id, number, row, column, type, status) VALUES (704, 4, '31H', 31, 8, 'economy', 'available');
+-- Seats (generados con: python manage.py generate_seat_layouts --sql --premium 4-7)
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (1, 1, '1A', 1, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (2, 1, '1B', 1, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (3, 1, '1C', 1, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (4, 1, '1D', 1, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (5, 1, '1E', 1, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (6, 1, '1F', 1, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (7, 1, '2A', 2, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (8, 1, '2B', 2, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (9, 1, '2C', 2, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (10, 1, '2D', 2, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (11, 1, '2E', 2, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (12, 1, '2F', 2, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (13, 1, '3A', 3, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (14, 1, '3B', 3, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (15, 1, '3C', 3, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (16, 1, '3D', 3, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (17, 1, '3E', 3, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (18, 1, '3F', 3, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (19, 1, '4A', 4, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (20, 1, '4B', 4, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (21, 1, '4C', 4, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (22, 1, '4D', 4, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (23, 1, '4E', 4, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (24, 1, '4F', 4, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (25, 1, '5A', 5, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (26, 1, '5B', 5, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (27, 1, '5C', 5, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (28, 1, '5D', 5, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (29, 1, '5E', 5, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (30, 1, '5F', 5, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (31, 1, '6A', 6, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (32, 1, '6B', 6, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (33, 1, '6C', 6, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (34, 1, '6D', 6, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (35, 1, '6E', 6, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (36, 1, '6F', 6, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (37, 1, '7A', 7, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (38, 1, '7B', 7, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (39, 1, '7C', 7, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (40, 1, '7D', 7, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (41, 1, '7E', 7, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (42, 1, '7F', 7, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (43, 1, '8A', 8, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (44, 1, '8B', 8, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (45, 1, '8C', 8, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (46, 1, '8D', 8, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (47, 1, '8E', 8, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (48, 1, '8F', 8, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (49, 1, '9A', 9, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (50, 1, '9B', 9, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (51, 1, '9C', 9, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (52, 1, '9D', 9, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (53, 1, '9E', 9, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (54, 1, '9F', 9, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (55, 1, '10A', 10, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (56, 1, '10B', 10, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (57, 1, '10C', 10, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (58, 1, '10D', 10, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (59, 1, '10E', 10, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (60, 1, '10F', 10, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (61, 1, '11A', 11, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (62, 1, '11B', 11, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (63, 1, '11C', 11, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (64, 1, '11D', 11, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (65, 1, '11E', 11, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (66, 1, '11F', 11, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (67, 1, '12A', 12, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (68, 1, '12B', 12, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (69, 1, '12C', 12, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (70, 1, '12D', 12, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (71, 1, '12E', 12, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (72, 1, '12F', 12, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (73, 1, '13A', 13, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (74, 1, '13B', 13, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (75, 1, '13C', 13, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (76, 1, '13D', 13, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (77, 1, '13E', 13, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (78, 1, '13F', 13, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (79, 1, '14A', 14, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (80, 1, '14B', 14, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (81, 1, '14C', 14, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (82, 1, '14D', 14, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (83, 1, '14E', 14, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (84, 1, '14F', 14, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (85, 1, '15A', 15, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (86, 1, '15B', 15, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (87, 1, '15C', 15, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (88, 1, '15D', 15, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (89, 1, '15E', 15, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (90, 1, '15F', 15, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (91, 1, '16A', 16, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (92, 1, '16B', 16, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (93, 1, '16C', 16, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (94, 1, '16D', 16, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (95, 1, '16E', 16, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (96, 1, '16F', 16, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (97, 1, '17A', 17, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (98, 1, '17B', 17, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (99, 1, '17C', 17, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (100, 1, '17D', 17, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (101, 1, '17E', 17, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (102, 1, '17F', 17, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (103, 1, '18A', 18, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (104, 1, '18B', 18, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (105, 1, '18C', 18, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (106, 1, '18D', 18, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (107, 1, '18E', 18, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (108, 1, '18F', 18, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (109, 1, '19A', 19, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (110, 1, '19B', 19, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (111, 1, '19C', 19, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (112, 1, '19D', 19, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (113, 1, '19E', 19, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (114, 1, '19F', 19, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (115, 1, '20A', 20, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (116, 1, '20B', 20, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (117, 1, '20C', 20, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (118, 1, '20D', 20, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (119, 1, '20E', 20, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (120, 1, '20F', 20, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (121, 1, '21A', 21, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (122, 1, '21B', 21, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (123, 1, '21C', 21, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (124, 1, '21D', 21, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (125, 1, '21E', 21, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (126, 1, '21F', 21, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (127, 1, '22A', 22, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (128, 1, '22B', 22, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (129, 1, '22C', 22, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (130, 1, '22D', 22, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (131, 1, '22E', 22, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (132, 1, '22F', 22, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (133, 1, '23A', 23, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (134, 1, '23B', 23, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (135, 1, '23C', 23, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (136, 1, '23D', 23, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (137, 1, '23E', 23, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (138, 1, '23F', 23, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (139, 1, '24A', 24, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (140, 1, '24B', 24, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (141, 1, '24C', 24, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (142, 1, '24D', 24, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (143, 1, '24E', 24, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (144, 1, '24F', 24, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (145, 1, '25A', 25, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (146, 1, '25B', 25, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (147, 1, '25C', 25, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (148, 1, '25D', 25, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (149, 1, '25E', 25, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (150, 1, '25F', 25, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (151, 1, '26A', 26, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (152, 1, '26B', 26, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (153, 1, '26C', 26, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (154, 1, '26D', 26, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (155, 1, '26E', 26, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (156, 1, '26F', 26, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (157, 1, '27A', 27, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (158, 1, '27B', 27, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (159, 1, '27C', 27, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (160, 1, '27D', 27, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (161, 1, '27E', 27, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (162, 1, '27F', 27, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (163, 1, '28A', 28, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (164, 1, '28B', 28, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (165, 1, '28C', 28, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (166, 1, '28D', 28, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (167, 1, '28E', 28, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (168, 1, '28F', 28, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (169, 1, '29A', 29, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (170, 1, '29B', 29, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (171, 1, '29C', 29, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (172, 1, '29D', 29, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (173, 1, '29E', 29, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (174, 1, '29F', 29, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (175, 1, '30A', 30, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (176, 1, '30B', 30, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (177, 1, '30C', 30, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (178, 1, '30D', 30, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (179, 1, '30E', 30, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (180, 1, '30F', 30, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (181, 1, '31A', 31, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (182, 1, '31B', 31, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (183, 1, '31C', 31, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (184, 1, '31D', 31, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (185, 1, '31E', 31, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (186, 1, '31F', 31, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (187, 2, '1A', 1, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (188, 2, '1B', 1, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (189, 2, '1C', 1, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (190, 2, '1D', 1, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (191, 2, '1E', 1, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (192, 2, '1F', 1, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (193, 2, '2A', 2, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (194, 2, '2B', 2, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (195, 2, '2C', 2, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (196, 2, '2D', 2, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (197, 2, '2E', 2, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (198, 2, '2F', 2, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (199, 2, '3A', 3, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (200, 2, '3B', 3, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (201, 2, '3C', 3, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (202, 2, '3D', 3, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (203, 2, '3E', 3, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (204, 2, '3F', 3, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (205, 2, '4A', 4, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (206, 2, '4B', 4, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (207, 2, '4C', 4, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (208, 2, '4D', 4, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (209, 2, '4E', 4, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (210, 2, '4F', 4, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (211, 2, '5A', 5, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (212, 2, '5B', 5, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (213, 2, '5C', 5, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (214, 2, '5D', 5, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (215, 2, '5E', 5, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (216, 2, '5F', 5, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (217, 2, '6A', 6, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (218, 2, '6B', 6, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (219, 2, '6C', 6, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (220, 2, '6D', 6, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (221, 2, '6E', 6, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (222, 2, '6F', 6, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (223, 2, '7A', 7, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (224, 2, '7B', 7, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (225, 2, '7C', 7, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (226, 2, '7D', 7, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (227, 2, '7E', 7, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (228, 2, '7F', 7, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (229, 2, '8A', 8, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (230, 2, '8B', 8, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (231, 2, '8C', 8, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (232, 2, '8D', 8, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (233, 2, '8E', 8, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (234, 2, '8F', 8, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (235, 2, '9A', 9, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (236, 2, '9B', 9, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (237, 2, '9C', 9, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (238, 2, '9D', 9, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (239, 2, '9E', 9, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (240, 2, '9F', 9, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (241, 2, '10A', 10, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (242, 2, '10B', 10, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (243, 2, '10C', 10, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (244, 2, '10D', 10, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (245, 2, '10E', 10, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (246, 2, '10F', 10, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (247, 2, '11A', 11, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (248, 2, '11B', 11, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (249, 2, '11C', 11, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (250, 2, '11D', 11, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (251, 2, '11E', 11, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (252, 2, '11F', 11, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (253, 2, '12A', 12, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (254, 2, '12B', 12, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (255, 2, '12C', 12, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (256, 2, '12D', 12, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (257, 2, '12E', 12, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (258, 2, '12F', 12, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (259, 2, '13A', 13, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (260, 2, '13B', 13, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (261, 2, '13C', 13, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (262, 2, '13D', 13, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (263, 2, '13E', 13, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (264, 2, '13F', 13, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (265, 2, '14A', 14, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (266, 2, '14B', 14, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (267, 2, '14C', 14, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (268, 2, '14D', 14, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (269, 2, '14E', 14, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (270, 2, '14F', 14, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (271, 2, '15A', 15, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (272, 2, '15B', 15, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (273, 2, '15C', 15, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (274, 2, '15D', 15, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (275, 2, '15E', 15, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (276, 2, '15F', 15, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (277, 2, '16A', 16, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (278, 2, '16B', 16, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (279, 2, '16C', 16, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (280, 2, '16D', 16, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (281, 2, '16E', 16, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (282, 2, '16F', 16, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (283, 2, '17A', 17, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (284, 2, '17B', 17, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (285, 2, '17C', 17, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (286, 2, '17D', 17, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (287, 2, '17E', 17, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (288, 2, '17F', 17, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (289, 2, '18A', 18, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (290, 2, '18B', 18, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (291, 2, '18C', 18, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (292, 2, '18D', 18, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (293, 2, '18E', 18, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (294, 2, '18F', 18, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (295, 2, '19A', 19, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (296, 2, '19B', 19, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (297, 2, '19C', 19, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (298, 2, '19D', 19, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (299, 2, '19E', 19, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (300, 2, '19F', 19, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (301, 2, '20A', 20, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (302, 2, '20B', 20, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (303, 2, '20C', 20, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (304, 2, '20D', 20, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (305, 2, '20E', 20, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (306, 2, '20F', 20, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (307, 2, '21A', 21, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (308, 2, '21B', 21, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (309, 2, '21C', 21, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (310, 2, '21D', 21, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (311, 2, '21E', 21, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (312, 2, '21F', 21, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (313, 2, '22A', 22, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (314, 2, '22B', 22, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (315, 2, '22C', 22, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (316, 2, '22D', 22, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (317, 2, '22E', 22, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (318, 2, '22F', 22, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (319, 2, '23A', 23, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (320, 2, '23B', 23, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (321, 2, '23C', 23, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (322, 2, '23D', 23, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (323, 2, '23E', 23, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (324, 2, '23F', 23, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (325, 2, '24A', 24, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (326, 2, '24B', 24, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (327, 2, '24C', 24, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (328, 2, '24D', 24, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (329, 2, '24E', 24, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (330, 2, '24F', 24, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (331, 2, '25A', 25, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (332, 2, '25B', 25, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (333, 2, '25C', 25, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (334, 2, '25D', 25, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (335, 2, '25E', 25, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (336, 2, '25F', 25, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (337, 2, '26A', 26, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (338, 2, '26B', 26, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (339, 2, '26C', 26, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (340, 2, '26D', 26, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (341, 2, '26E', 26, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (342, 2, '26F', 26, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (343, 2, '27A', 27, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (344, 2, '27B', 27, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (345, 2, '27C', 27, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (346, 2, '27D', 27, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (347, 2, '27E', 27, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (348, 2, '27F', 27, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (349, 2, '28A', 28, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (350, 2, '28B', 28, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (351, 2, '28C', 28, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (352, 2, '28D', 28, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (353, 2, '28E', 28, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (354, 2, '28F', 28, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (355, 2, '29A', 29, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (356, 2, '29B', 29, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (357, 2, '29C', 29, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (358, 2, '29D', 29, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (359, 2, '29E', 29, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (360, 2, '29F', 29, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (361, 3, '1A', 1, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (362, 3, '1B', 1, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (363, 3, '1C', 1, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (364, 3, '1D', 1, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (365, 3, '2A', 2, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (366, 3, '2B', 2, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (367, 3, '2C', 2, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (368, 3, '2D', 2, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (369, 3, '3A', 3, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (370, 3, '3B', 3, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (371, 3, '3C', 3, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (372, 3, '3D', 3, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (373, 3, '4A', 4, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (374, 3, '4B', 4, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (375, 3, '4C', 4, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (376, 3, '4D', 4, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (377, 3, '5A', 5, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (378, 3, '5B', 5, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (379, 3, '5C', 5, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (380, 3, '5D', 5, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (381, 3, '6A', 6, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (382, 3, '6B', 6, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (383, 3, '6C', 6, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (384, 3, '6D', 6, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (385, 3, '7A', 7, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (386, 3, '7B', 7, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (387, 3, '7C', 7, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (388, 3, '7D', 7, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (389, 3, '8A', 8, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (390, 3, '8B', 8, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (391, 3, '8C', 8, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (392, 3, '8D', 8, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (393, 3, '9A', 9, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (394, 3, '9B', 9, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (395, 3, '9C', 9, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (396, 3, '9D', 9, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (397, 3, '10A', 10, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (398, 3, '10B', 10, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (399, 3, '10C', 10, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (400, 3, '10D', 10, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (401, 3, '11A', 11, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (402, 3, '11B', 11, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (403, 3, '11C', 11, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (404, 3, '11D', 11, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (405, 3, '12A', 12, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (406, 3, '12B', 12, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (407, 3, '12C', 12, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (408, 3, '12D', 12, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (409, 3, '13A', 13, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (410, 3, '13B', 13, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (411, 3, '13C', 13, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (412, 3, '13D', 13, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (413, 3, '14A', 14, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (414, 3, '14B', 14, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (415, 3, '14C', 14, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (416, 3, '14D', 14, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (417, 3, '15A', 15, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (418, 3, '15B', 15, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (419, 3, '15C', 15, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (420, 3, '15D', 15, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (421, 3, '16A', 16, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (422, 3, '16B', 16, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (423, 3, '16C', 16, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (424, 3, '16D', 16, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (425, 3, '17A', 17, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (426, 3, '17B', 17, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (427, 3, '17C', 17, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (428, 3, '17D', 17, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (429, 3, '18A', 18, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (430, 3, '18B', 18, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (431, 3, '18C', 18, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (432, 3, '18D', 18, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (433, 3, '19A', 19, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (434, 3, '19B', 19, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (435, 3, '19C', 19, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (436, 3, '19D', 19, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (437, 3, '20A', 20, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (438, 3, '20B', 20, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (439, 3, '20C', 20, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (440, 3, '20D', 20, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (441, 3, '21A', 21, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (442, 3, '21B', 21, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (443, 3, '21C', 21, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (444, 3, '21D', 21, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (445, 3, '22A', 22, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (446, 3, '22B', 22, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (447, 3, '22C', 22, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (448, 3, '22D', 22, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (449, 3, '23A', 23, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (450, 3, '23B', 23, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (451, 3, '23C', 23, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (452, 3, '23D', 23, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (453, 3, '24A', 24, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (454, 3, '24B', 24, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (455, 3, '24C', 24, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (456, 3, '24D', 24, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (457, 4, '1A', 1, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (458, 4, '1B', 1, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (459, 4, '1C', 1, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (460, 4, '1D', 1, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (461, 4, '1E', 1, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (462, 4, '1F', 1, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (463, 4, '1G', 1, 7, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (464, 4, '1H', 1, 8, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (465, 4, '2A', 2, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (466, 4, '2B', 2, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (467, 4, '2C', 2, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (468, 4, '2D', 2, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (469, 4, '2E', 2, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (470, 4, '2F', 2, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (471, 4, '2G', 2, 7, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (472, 4, '2H', 2, 8, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (473, 4, '3A', 3, 1, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (474, 4, '3B', 3, 2, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (475, 4, '3C', 3, 3, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (476, 4, '3D', 3, 4, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (477, 4, '3E', 3, 5, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (478, 4, '3F', 3, 6, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (479, 4, '3G', 3, 7, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (480, 4, '3H', 3, 8, 'business');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (481, 4, '4A', 4, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (482, 4, '4B', 4, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (483, 4, '4C', 4, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (484, 4, '4D', 4, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (485, 4, '4E', 4, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (486, 4, '4F', 4, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (487, 4, '4G', 4, 7, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (488, 4, '4H', 4, 8, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (489, 4, '5A', 5, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (490, 4, '5B', 5, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (491, 4, '5C', 5, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (492, 4, '5D', 5, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (493, 4, '5E', 5, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (494, 4, '5F', 5, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (495, 4, '5G', 5, 7, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (496, 4, '5H', 5, 8, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (497, 4, '6A', 6, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (498, 4, '6B', 6, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (499, 4, '6C', 6, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (500, 4, '6D', 6, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (501, 4, '6E', 6, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (502, 4, '6F', 6, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (503, 4, '6G', 6, 7, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (504, 4, '6H', 6, 8, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (505, 4, '7A', 7, 1, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (506, 4, '7B', 7, 2, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (507, 4, '7C', 7, 3, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (508, 4, '7D', 7, 4, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (509, 4, '7E', 7, 5, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (510, 4, '7F', 7, 6, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (511, 4, '7G', 7, 7, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (512, 4, '7H', 7, 8, 'premium');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (513, 4, '8A', 8, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (514, 4, '8B', 8, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (515, 4, '8C', 8, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (516, 4, '8D', 8, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (517, 4, '8E', 8, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (518, 4, '8F', 8, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (519, 4, '8G', 8, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (520, 4, '8H', 8, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (521, 4, '9A', 9, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (522, 4, '9B', 9, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (523, 4, '9C', 9, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (524, 4, '9D', 9, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (525, 4, '9E', 9, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (526, 4, '9F', 9, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (527, 4, '9G', 9, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (528, 4, '9H', 9, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (529, 4, '10A', 10, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (530, 4, '10B', 10, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (531, 4, '10C', 10, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (532, 4, '10D', 10, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (533, 4, '10E', 10, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (534, 4, '10F', 10, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (535, 4, '10G', 10, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (536, 4, '10H', 10, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (537, 4, '11A', 11, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (538, 4, '11B', 11, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (539, 4, '11C', 11, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (540, 4, '11D', 11, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (541, 4, '11E', 11, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (542, 4, '11F', 11, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (543, 4, '11G', 11, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (544, 4, '11H', 11, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (545, 4, '12A', 12, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (546, 4, '12B', 12, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (547, 4, '12C', 12, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (548, 4, '12D', 12, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (549, 4, '12E', 12, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (550, 4, '12F', 12, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (551, 4, '12G', 12, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (552, 4, '12H', 12, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (553, 4, '13A', 13, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (554, 4, '13B', 13, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (555, 4, '13C', 13, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (556, 4, '13D', 13, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (557, 4, '13E', 13, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (558, 4, '13F', 13, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (559, 4, '13G', 13, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (560, 4, '13H', 13, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (561, 4, '14A', 14, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (562, 4, '14B', 14, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (563, 4, '14C', 14, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (564, 4, '14D', 14, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (565, 4, '14E', 14, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (566, 4, '14F', 14, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (567, 4, '14G', 14, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (568, 4, '14H', 14, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (569, 4, '15A', 15, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (570, 4, '15B', 15, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (571, 4, '15C', 15, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (572, 4, '15D', 15, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (573, 4, '15E', 15, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (574, 4, '15F', 15, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (575, 4, '15G', 15, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (576, 4, '15H', 15, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (577, 4, '16A', 16, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (578, 4, '16B', 16, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (579, 4, '16C', 16, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (580, 4, '16D', 16, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (581, 4, '16E', 16, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (582, 4, '16F', 16, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (583, 4, '16G', 16, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (584, 4, '16H', 16, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (585, 4, '17A', 17, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (586, 4, '17B', 17, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (587, 4, '17C', 17, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (588, 4, '17D', 17, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (589, 4, '17E', 17, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (590, 4, '17F', 17, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (591, 4, '17G', 17, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (592, 4, '17H', 17, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (593, 4, '18A', 18, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (594, 4, '18B', 18, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (595, 4, '18C', 18, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (596, 4, '18D', 18, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (597, 4, '18E', 18, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (598, 4, '18F', 18, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (599, 4, '18G', 18, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (600, 4, '18H', 18, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (601, 4, '19A', 19, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (602, 4, '19B', 19, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (603, 4, '19C', 19, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (604, 4, '19D', 19, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (605, 4, '19E', 19, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (606, 4, '19F', 19, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (607, 4, '19G', 19, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (608, 4, '19H', 19, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (609, 4, '20A', 20, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (610, 4, '20B', 20, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (611, 4, '20C', 20, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (612, 4, '20D', 20, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (613, 4, '20E', 20, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (614, 4, '20F', 20, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (615, 4, '20G', 20, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (616, 4, '20H', 20, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (617, 4, '21A', 21, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (618, 4, '21B', 21, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (619, 4, '21C', 21, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (620, 4, '21D', 21, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (621, 4, '21E', 21, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (622, 4, '21F', 21, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (623, 4, '21G', 21, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (624, 4, '21H', 21, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (625, 4, '22A', 22, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (626, 4, '22B', 22, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (627, 4, '22C', 22, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (628, 4, '22D', 22, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (629, 4, '22E', 22, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (630, 4, '22F', 22, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (631, 4, '22G', 22, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (632, 4, '22H', 22, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (633, 4, '23A', 23, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (634, 4, '23B', 23, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (635, 4, '23C', 23, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (636, 4, '23D', 23, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (637, 4, '23E', 23, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (638, 4, '23F', 23, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (639, 4, '23G', 23, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (640, 4, '23H', 23, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (641, 4, '24A', 24, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (642, 4, '24B', 24, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (643, 4, '24C', 24, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (644, 4, '24D', 24, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (645, 4, '24E', 24, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (646, 4, '24F', 24, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (647, 4, '24G', 24, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (648, 4, '24H', 24, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (649, 4, '25A', 25, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (650, 4, '25B', 25, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (651, 4, '25C', 25, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (652, 4, '25D', 25, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (653, 4, '25E', 25, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (654, 4, '25F', 25, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (655, 4, '25G', 25, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (656, 4, '25H', 25, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (657, 4, '26A', 26, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (658, 4, '26B', 26, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (659, 4, '26C', 26, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (660, 4, '26D', 26, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (661, 4, '26E', 26, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (662, 4, '26F', 26, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (663, 4, '26G', 26, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (664, 4, '26H', 26, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (665, 4, '27A', 27, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (666, 4, '27B', 27, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (667, 4, '27C', 27, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (668, 4, '27D', 27, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (669, 4, '27E', 27, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (670, 4, '27F', 27, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (671, 4, '27G', 27, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (672, 4, '27H', 27, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (673, 4, '28A', 28, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (674, 4, '28B', 28, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (675, 4, '28C', 28, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (676, 4, '28D', 28, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (677, 4, '28E', 28, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (678, 4, '28F', 28, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (679, 4, '28G', 28, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (680, 4, '28H', 28, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (681, 4, '29A', 29, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (682, 4, '29B', 29, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (683, 4, '29C', 29, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (684, 4, '29D', 29, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (685, 4, '29E', 29, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (686, 4, '29F', 29, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (687, 4, '29G', 29, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (688, 4, '29H', 29, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (689, 4, '30A', 30, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (690, 4, '30B', 30, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (691, 4, '30C', 30, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (692, 4, '30D', 30, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (693, 4, '30E', 30, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (694, 4, '30F', 30, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (695, 4, '30G', 30, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (696, 4, '30H', 30, 8, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (697, 4, '31A', 31, 1, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (698, 4, '31B', 31, 2, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (699, 4, '31C', 31, 3, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (700, 4, '31D', 31, 4, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (701, 4, '31E', 31, 5, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (702, 4, '31F', 31, 6, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (703, 4, '31G', 31, 7, 'economy');
+INSERT INTO app_seat (id, airplane_id, number, row, column, type) VALUES (704, 4, '31H', 31, 8, 'economy');
 
 -- Flights
 INSERT INTO app_flight (id, airplane_id, origin, destination, departure_time, arrival_time, duration, status, base_price) VALUES (1, 1, 'AEP', 'COR', '2025-08-01 07:10:00', '2025-08-01 08:35:00', 5100000000, 'scheduled', 45000.00);
@@ -1047,137 +1048,7 @@ INSERT INTO app_ticket (id, reservation_id, barcode, issue_date, status) VALUES
 INSERT INTO app_reservation (id, flight_id, passenger_id, seat_id, status, reservation_date, price, reservation_code) VALUES (130, 7, 23, 423, 'confirmed', '2025-07-30 15:13:00', 120000.00, 'RSV070035');
 INSERT INTO app_ticket (id, reservation_id, barcode, issue_date, status) VALUES (97, 130, 'AR000130232', '2025-08-01 16:13:00', 'issued');
 
--- Update seats that got booked to status=reserved
-UPDATE app_seat SET status='reserved' WHERE id=43;
-UPDATE app_seat SET status='reserved' WHERE id=44;
-UPDATE app_seat SET status='reserved' WHERE id=45;
-UPDATE app_seat SET status='reserved' WHERE id=46;
-UPDATE app_seat SET status='reserved' WHERE id=47;
-UPDATE app_seat SET status='reserved' WHERE id=48;
-UPDATE app_seat SET status='reserved' WHERE id=49;
-UPDATE app_seat SET status='reserved' WHERE id=50;
-UPDATE app_seat SET status='reserved' WHERE id=51;
-UPDATE app_seat SET status='reserved' WHERE id=52;
-UPDATE app_seat SET status='reserved' WHERE id=53;
-UPDATE app_seat SET status='reserved' WHERE id=54;
-UPDATE app_seat SET status='reserved' WHERE id=55;
-UPDATE app_seat SET status='reserved' WHERE id=56;
-UPDATE app_seat SET status='reserved' WHERE id=57;
-UPDATE app_seat SET status='reserved' WHERE id=58;
-UPDATE app_seat SET status='reserved' WHERE id=59;
-UPDATE app_seat SET status='reserved' WHERE id=60;
-UPDATE app_seat SET status='reserved' WHERE id=61;
-UPDATE app_seat SET status='reserved' WHERE id=62;
-UPDATE app_seat SET status='reserved' WHERE id=63;
-UPDATE app_seat SET status='reserved' WHERE id=64;
-UPDATE app_seat SET status='reserved' WHERE id=65;
-UPDATE app_seat SET status='reserved' WHERE id=66;
-UPDATE app_seat SET status='reserved' WHERE id=67;
-UPDATE app_seat SET status='reserved' WHERE id=68;
-UPDATE app_seat SET status='reserved' WHERE id=69;
-UPDATE app_seat SET status='reserved' WHERE id=70;
-UPDATE app_seat SET status='reserved' WHERE id=71;
-UPDATE app_seat SET status='reserved' WHERE id=72;
-UPDATE app_seat SET status='reserved' WHERE id=229;
-UPDATE app_seat SET status='reserved' WHERE id=230;
-UPDATE app_seat SET status='reserved' WHERE id=231;
-UPDATE app_seat SET status='reserved' WHERE id=232;
-UPDATE app_seat SET status='reserved' WHERE id=233;
-UPDATE app_seat SET status='reserved' WHERE id=234;
-UPDATE app_seat SET status='reserved' WHERE id=235;
-UPDATE app_seat SET status='reserved' WHERE id=236;
-UPDATE app_seat SET status='reserved' WHERE id=237;
-UPDATE app_seat SET status='reserved' WHERE id=238;
-UPDATE app_seat SET status='reserved' WHERE id=239;
-UPDATE app_seat SET status='reserved' WHERE id=240;
-UPDATE app_seat SET status='reserved' WHERE id=241;
-UPDATE app_seat SET status='reserved' WHERE id=242;
-UPDATE app_seat SET status='reserved' WHERE id=243;
-UPDATE app_seat SET status='reserved' WHERE id=244;
-UPDATE app_seat SET status='reserved' WHERE id=245;
-UPDATE app_seat SET status='reserved' WHERE id=246;
-UPDATE app_seat SET status='reserved' WHERE id=247;
-UPDATE app_seat SET status='reserved' WHERE id=248;
-UPDATE app_seat SET status='reserved' WHERE id=249;
-UPDATE app_seat SET status='reserved' WHERE id=250;
-UPDATE app_seat SET status='reserved' WHERE id=251;
-UPDATE app_seat SET status='reserved' WHERE id=252;
-UPDATE app_seat SET status='reserved' WHERE id=253;
-UPDATE app_seat SET status='reserved' WHERE id=254;
-UPDATE app_seat SET status='reserved' WHERE id=255;
-UPDATE app_seat SET status='reserved' WHERE id=256;
-UPDATE app_seat SET status='reserved' WHERE id=257;
-UPDATE app_seat SET status='reserved' WHERE id=258;
-UPDATE app_seat SET status='reserved' WHERE id=259;
-UPDATE app_seat SET status='reserved' WHERE id=260;
-UPDATE app_seat SET status='reserved' WHERE id=261;
-UPDATE app_seat SET status='reserved' WHERE id=262;
-UPDATE app_seat SET status='reserved' WHERE id=263;
-UPDATE app_seat SET status='reserved' WHERE id=264;
-UPDATE app_seat SET status='reserved' WHERE id=265;
-UPDATE app_seat SET status='reserved' WHERE id=266;
-UPDATE app_seat SET status='reserved' WHERE id=267;
-UPDATE app_seat SET status='reserved' WHERE id=268;
-UPDATE app_seat SET status='reserved' WHERE id=389;
-UPDATE app_seat SET status='reserved' WHERE id=390;
-UPDATE app_seat SET status='reserved' WHERE id=391;
-UPDATE app_seat SET status='reserved' WHERE id=392;
-UPDATE app_seat SET status='reserved' WHERE id=393;
-UPDATE app_seat SET status='reserved' WHERE id=394;
-UPDATE app_seat SET status='reserved' WHERE id=395;
-UPDATE app_seat SET status='reserved' WHERE id=396;
-UPDATE app_seat SET status='reserved' WHERE id=397;
-UPDATE app_seat SET status='reserved' WHERE id=398;
-UPDATE app_seat SET status='reserved' WHERE id=399;
-UPDATE app_seat SET status='reserved' WHERE id=400;
-UPDATE app_seat SET status='reserved' WHERE id=401;
-UPDATE app_seat SET status='reserved' WHERE id=402;
-UPDATE app_seat SET status='reserved' WHERE id=403;
-UPDATE app_seat SET status='reserved' WHERE id=404;
-UPDATE app_seat SET status='reserved' WHERE id=405;
-UPDATE app_seat SET status='reserved' WHERE id=406;
-UPDATE app_seat SET status='reserved' WHERE id=407;
-UPDATE app_seat SET status='reserved' WHERE id=408;
-UPDATE app_seat SET status='reserved' WHERE id=409;
-UPDATE app_seat SET status='reserved' WHERE id=410;
-UPDATE app_seat SET status='reserved' WHERE id=411;
-UPDATE app_seat SET status='reserved' WHERE id=412;
-UPDATE app_seat SET status='reserved' WHERE id=413;
-UPDATE app_seat SET status='reserved' WHERE id=414;
-UPDATE app_seat SET status='reserved' WHERE id=415;
-UPDATE app_seat SET status='reserved' WHERE id=416;
-UPDATE app_seat SET status='reserved' WHERE id=417;
-UPDATE app_seat SET status='reserved' WHERE id=418;
-UPDATE app_seat SET status='reserved' WHERE id=419;
-UPDATE app_seat SET status='reserved' WHERE id=420;
-UPDATE app_seat SET status='reserved' WHERE id=421;
-UPDATE app_seat SET status='reserved' WHERE id=422;
-UPDATE app_seat SET status='reserved' WHERE id=423;
-UPDATE app_seat SET status='reserved' WHERE id=513;
-UPDATE app_seat SET status='reserved' WHERE id=514;
-UPDATE app_seat SET status='reserved' WHERE id=515;
-UPDATE app_seat SET status='reserved' WHERE id=516;
-UPDATE app_seat SET status='reserved' WHERE id=517;
-UPDATE app_seat SET status='reserved' WHERE id=518;
-UPDATE app_seat SET status='reserved' WHERE id=519;
-UPDATE app_seat SET status='reserved' WHERE id=520;
-UPDATE app_seat SET status='reserved' WHERE id=521;
-UPDATE app_seat SET status='reserved' WHERE id=522;
-UPDATE app_seat SET status='reserved' WHERE id=523;
-UPDATE app_seat SET status='reserved' WHERE id=524;
-UPDATE app_seat SET status='reserved' WHERE id=525;
-UPDATE app_seat SET status='reserved' WHERE id=526;
-UPDATE app_seat SET status='reserved' WHERE id=527;
-UPDATE app_seat SET status='reserved' WHERE id=528;
-UPDATE app_seat SET status='reserved' WHERE id=529;
-UPDATE app_seat SET status='reserved' WHERE id=530;
-UPDATE app_seat SET status='reserved' WHERE id=531;
-UPDATE app_seat SET status='reserved' WHERE id=532;
-UPDATE app_seat SET status='reserved' WHERE id=533;
-UPDATE app_seat SET status='reserved' WHERE id=534;
-UPDATE app_seat SET status='reserved' WHERE id=535;
-UPDATE app_seat SET status='reserved' WHERE id=536;
-UPDATE app_seat SET status='reserved' WHERE id=537;
+-- Seat status per flight is rebuilt from these reservations (app_flightseatinventory)
 COMMIT;
 
 
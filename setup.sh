@@ -18,6 +18,7 @@ cd fly_project
 python manage.py migrate
 python manage.py dbshell < seeds/seed_arg_airline.sql
 python manage.py dbshell < seeds/seed_destinations.sql
+python manage.py dbshell < seeds/seed_airports.sql
 cd ..
 
 echo "Setup completo. Puedes iniciar el servidor con ./runserver.sh"